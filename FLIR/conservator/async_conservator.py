@@ -0,0 +1,285 @@
+"""
+Awaitable versions of the main entry points of this library.
+
+Every request made by :class:`~FLIR.conservator.conservator.Conservator` blocks
+until the server responds. :class:`AsyncConservator` provides coroutines for
+queries and file transfers, so a single process can keep many requests in
+flight at once:
+
+>>> async with AsyncConservator.default(max_concurrency=100) as conservator:
+...     videos = await asyncio.gather(
+...         *(conservator.query(Query.video, id=id_) for id_ in video_ids)
+...     )
+
+Requests are prepared and wrapped exactly as they are for synchronous
+queries. The network calls themselves run on a pool of worker threads that
+share the connection's pooled HTTP session.
+
+Returned objects are wrapped with the synchronous
+:class:`~FLIR.conservator.conservator.Conservator` available as
+:attr:`AsyncConservator.conservator`, so their methods (for instance,
+:meth:`~FLIR.conservator.wrappers.queryable.QueryableType.populate`) still block.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from FLIR.conservator.config import Config
+from FLIR.conservator.conservator import Conservator
+from FLIR.conservator.http_session import set_pool_size
+from FLIR.conservator.paginated_query import PaginatedQuery
+
+# get_running_loop was added in Python 3.7. In a coroutine, get_event_loop
+# returns the same loop.
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class AsyncConservatorConnection:
+    """
+    Runs queries on a remote Conservator instance without blocking the event loop.
+
+    :param connection: The synchronous
+        :class:`~FLIR.conservator.connection.ConservatorConnection` used to
+        prepare operations and wrap their results.
+    :param max_concurrency: The maximum number of requests in flight at once.
+        If `None`, uses the connection's ``http_pool_size``.
+    """
+
+    def __init__(self, connection, max_concurrency=None):
+        if max_concurrency is None:
+            max_concurrency = connection.config.http_pool_size
+        if max_concurrency > connection.config.http_pool_size:
+            # Make sure every worker can keep its connection alive.
+            set_pool_size(connection.session, max_concurrency)
+        self.connection = connection
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    async def _run_in_executor(self, func, *args, **kwargs):
+        loop = _get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run(self, operation, variables=None):
+        """
+        Awaitable version of :meth:`~FLIR.conservator.connection.ConservatorConnection.run`.
+        """
+        return await self._run_in_executor(self.connection.run, operation, variables)
+
+    async def query(self, query, operation_base=None, fields=None, **kwargs):
+        """
+        Awaitable version of :meth:`~FLIR.conservator.connection.ConservatorConnection.query`.
+        """
+        return await self._run_in_executor(
+            self.connection.query, query, operation_base, fields, **kwargs
+        )
+
+    async def get_email(self):
+        """Returns the current User's email"""
+        return await self._run_in_executor(self.connection.get_email)
+
+    def paginated_query(self, query, **kwargs):
+        """
+        Returns an :class:`AsyncPaginatedQuery` for `query`. The `kwargs` are
+        passed to the :class:`AsyncPaginatedQuery` constructor.
+        """
+        return AsyncPaginatedQuery(self, query=query, **kwargs)
+
+    def close(self):
+        """
+        Waits for pending requests and stops the worker threads.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # Waiting for pending requests mustn't block the event loop.
+        await _get_running_loop().run_in_executor(None, self.close)
+
+
+class AsyncConservator(AsyncConservatorConnection):
+    """
+    Awaitable counterpart of :class:`~FLIR.conservator.conservator.Conservator`.
+
+    :param config: The :class:`~FLIR.conservator.config.Config` object to use for this connection.
+    :param max_concurrency: The maximum number of requests in flight at once.
+        If `None`, uses the config's ``http_pool_size``.
+    """
+
+    def __init__(self, config, max_concurrency=None):
+        self.conservator = Conservator(config)
+        super().__init__(self.conservator, max_concurrency=max_concurrency)
+        self.files = AsyncConservatorFileTransfers(self)
+
+    def __repr__(self):
+        return f"<AsyncConservator at {self.conservator.config.url}>"
+
+    async def get_user(self):
+        """Returns the User that the provided API token authorizes"""
+        return await self._run_in_executor(self.conservator.get_user)
+
+    @staticmethod
+    def default(save=True, max_concurrency=None):
+        """
+        Returns an :class:`AsyncConservator` using :meth:`Config.default() <FLIR.conservator.config.Config.default>`.
+        """
+        return AsyncConservator(Config.default(save=save), max_concurrency)
+
+
+class AsyncConservatorFileTransfers:
+    """
+    Awaitable versions of the methods in
+    :class:`~FLIR.conservator.file_transfers.ConservatorFileTransfers`.
+
+    :param async_conservator: The :class:`AsyncConservator` whose workers
+        perform the transfers.
+    """
+
+    def __init__(self, async_conservator):
+        self._async_conservator = async_conservator
+        self._files = async_conservator.conservator.files
+
+    async def download(self, url, local_path, no_meter=True, max_retries=5):
+        """
+        Download the file from Conservator `url` to the `local_path`.
+        """
+        return await self._async_conservator._run_in_executor(
+            self._files.download, url, local_path, no_meter, max_retries
+        )
+
+    async def download_if_missing(self, url, local_path, expected_md5, no_meter=True):
+        """
+        Check that a file exists at `local_path` with the `expected_md5` hash. If it
+        doesn't, download it from `url`.
+        """
+        return await self._async_conservator._run_in_executor(
+            self._files.download_if_missing, url, local_path, expected_md5, no_meter
+        )
+
+    async def upload(self, url, local_path, max_retries=5):
+        """
+        Upload the file at `local_path` to Conservator `url`.
+        """
+        return await self._async_conservator._run_in_executor(
+            self._files.upload, url, local_path, max_retries
+        )
+
+    async def download_many(self, downloads):
+        """
+        Download a list of `DownloadRequest` concurrently. Returns a list with
+        the result of each download, or `False` if it failed.
+        """
+        return await asyncio.gather(
+            *(
+                self._async_conservator._run_in_executor(
+                    self._files._do_download_request, download
+                )
+                for download in downloads
+            )
+        )
+
+    async def upload_many(self, uploads):
+        """
+        Upload a list of `UploadRequest` concurrently. Returns a list with
+        the response of each upload, or `False` if it failed.
+        """
+        return await asyncio.gather(
+            *(
+                self._async_conservator._run_in_executor(
+                    self._files._do_upload_request, upload
+                )
+                for upload in uploads
+            )
+        )
+
+
+class AsyncPaginatedQuery(PaginatedQuery):
+    """
+    A :class:`~FLIR.conservator.paginated_query.PaginatedQuery` that is iterated
+    with ``async for``:
+
+    >>> results = AsyncPaginatedQuery(conservator, query=Query.projects, search_text="ADAS")
+    >>> async for project in results.including("name"):
+    ...     print(project.name)
+
+    Fields, filters and page sizes are set the same way as on a regular
+    :class:`~FLIR.conservator.paginated_query.PaginatedQuery`.
+
+    :param conservator: The :class:`AsyncConservatorConnection` to query.
+    """
+
+    def __init__(self, conservator, **kwargs):
+        self._async_conservator = conservator
+        super().__init__(conservator.connection, **kwargs)
+
+    def _load_total_items(self):
+        # Deferred to the first iteration, so we don't block the event loop.
+        self._total_items = None
+
+    async def _aload_total_items(self):
+        results = await self._async_conservator.query(
+            query=self._query,
+            fields=self.fields,
+            raw=self.raw,
+            page=1,
+            limit=1,
+            **self.kwargs,
+        )
+        self._set_total_items(self._get_field(results, self.total_unpack_field))
+
+    async def _anext_page(self):
+        self.started = True
+        results = await self._async_conservator.query(
+            query=self._query,
+            fields=self.fields,
+            raw=self.raw,
+            page=self._page,
+            limit=self._limit,
+            **self.kwargs,
+        )
+        return self._unpack_page(results)
+
+    async def __aiter__(self):
+        for item in self.results:
+            yield item
+
+        if self.reverse and self._total_items is None:
+            await self._aload_total_items()
+
+        while not self.done:
+            next_page = await self._anext_page()
+            is_last_page = self._is_last_page(next_page)
+            for item in self._page_items(next_page):
+                yield item
+            if is_last_page:
+                self.done = True
+            self._save_checkpoint()
+            if self.done:
+                return
+
+    def __iter__(self):
+        raise TypeError("AsyncPaginatedQuery must be iterated with 'async for'")
+
+    async def first(self):
+        """
+        Returns the first result, or `None` if it doesn't exist.
+        """
+        async for item in self:
+            return item
+        return None
+
+    async def count(self):
+        """
+        Awaitable version of :meth:`~FLIR.conservator.paginated_query.PaginatedQuery.count`.
+        """
+        return await self._async_conservator._run_in_executor(super().count)
+
+    async def to_list(self):
+        """
+        Returns all results as a `list`.
+        """
+        return [item async for item in self]
@@ -0,0 +1,113 @@
+"""
+Combines many independent queries or mutations into a single request.
+
+Each call is added to one GraphQL operation under a unique alias, so
+``N`` calls cost one round trip instead of ``N``:
+
+>>> with conservator.batch() as batch:
+...     results = [batch.query(Mutation.approve_dataset_frame, fields="id", id=id_)
+...                for id_ in dataset_frame_ids]
+>>> for result in results:
+...     if result.error is not None:
+...         print(f"Failed: {result.error}")
+
+Queries and mutations may be mixed in one batch; they are sent as separate
+operations. Mutations are executed by the server in the order they were added.
+"""
+
+
+class BatchResult:
+    """
+    The outcome of a single call in a :class:`QueryBatch`. It is filled in
+    once the batch is executed.
+    """
+
+    def __init__(self, query, fields, kwargs):
+        self.query = query
+        self.fields = fields
+        self.kwargs = kwargs
+        self.done = False
+        self.error = None
+        self._value = None
+
+    def set_value(self, value):
+        self._value = value
+        self.done = True
+
+    def set_error(self, error):
+        self.error = error
+        self.done = True
+
+    @property
+    def value(self):
+        """
+        The wrapped result of the call. If the call failed, its
+        :class:`~FLIR.conservator.connection.ConservatorGraphQLServerError`
+        is raised instead.
+        """
+        if not self.done:
+            raise BatchNotExecutedException()
+        if self.error is not None:
+            raise self.error
+        return self._value
+
+    def __repr__(self):
+        return f"<BatchResult for {self.query.name}>"
+
+
+class QueryBatch:
+    """
+    Collects calls to be run together. Usually created with
+    :meth:`~FLIR.conservator.connection.ConservatorConnection.batch`.
+
+    :param conservator: The connection to run the calls with.
+    :param batch_size: The maximum number of calls sent in a single request.
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(self, conservator, batch_size=DEFAULT_BATCH_SIZE):
+        self._conservator = conservator
+        self.batch_size = batch_size
+        self.results = []
+
+    def query(self, query, fields=None, **kwargs):
+        """
+        Adds a call to the batch, and returns its :class:`BatchResult`.
+
+        The arguments are the same as those of
+        :meth:`~FLIR.conservator.connection.ConservatorConnection.query`.
+        """
+        result = BatchResult(query, fields, kwargs)
+        self.results.append(result)
+        return result
+
+    def execute(self):
+        """
+        Runs all pending calls, and returns the list of every :class:`BatchResult`.
+        """
+        pending = [result for result in self.results if not result.done]
+        by_container = {}
+        for result in pending:
+            by_container.setdefault(result.query.container, []).append(result)
+        for container, results in by_container.items():
+            for start in range(0, len(results), self.batch_size):
+                chunk = results[start : start + self.batch_size]
+                self._conservator.run_batch(container, chunk)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+
+class BatchNotExecutedException(Exception):
+    """
+    Raised when the value of a :class:`BatchResult` is read before
+    its batch was executed.
+    """
+
+    pass
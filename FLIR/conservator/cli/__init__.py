@@ -1,27 +1,45 @@
 import click
-
-from FLIR.conservator.cli.config import config_
-from FLIR.conservator.cli.managers import get_manager_command
-from FLIR.conservator.cli.interactive import interactive
-from FLIR.conservator.conservator import Conservator
-from FLIR.conservator.generated import schema
-from FLIR.conservator.managers import (
-    CollectionManager,
-    DatasetManager,
-    ProjectManager,
-    VideoManager,
-    ImageManager,
-)
-from FLIR.conservator.util import (
-    to_clean_string,
-    get_conservator_cli_version,
-    check_platform,
-)
-from FLIR.conservator.cli.cvc import cvc
 import logging
 
+from FLIR.conservator.cli.lazy_group import LazyGroup
+
+# Subcommands are imported when first used, so commands like --help
+# don't import the whole library.
+LAZY_SUBCOMMANDS = {
+    "config": ("FLIR.conservator.cli.config:config_", "Manage configs"),
+    "collections": (
+        "FLIR.conservator.cli.managers:collections_",
+        "View or manage collections",
+    ),
+    "datasets": ("FLIR.conservator.cli.managers:datasets_", "View or manage datasets"),
+    "projects": ("FLIR.conservator.cli.managers:projects_", "View or manage projects"),
+    "videos": ("FLIR.conservator.cli.managers:videos_", "View or manage videos"),
+    "images": ("FLIR.conservator.cli.managers:images_", "View or manage images"),
+    "interactive": (
+        "FLIR.conservator.cli.interactive:interactive",
+        "An interactive shell for exploring conservator",
+    ),
+    "cvc": (
+        "FLIR.conservator.cli.cvc:cvc",
+        "Commands for manipulating local datasets",
+    ),
+}
+
+
+def print_version(ctx, param, value):
+    # The latest version is only looked up when --version is passed.
+    if not value or ctx.resilient_parsing:
+        return
+    from FLIR.conservator.util import get_conservator_cli_version
+    from FLIR.conservator.version import version as cli_ver
 
-@click.group()
+    latest_version = get_conservator_cli_version() or "unknown"
+    click.echo(f"conservator-cli, version {cli_ver}")
+    click.echo(f"Latest version on PyPi is {latest_version}")
+    ctx.exit()
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.option(
     "--log",
     "--log-level",
@@ -34,14 +52,17 @@ import logging
     default=None,
     help="Conservator config name, use default credentials if not specified",
 )
-@click.version_option(
-    prog_name="conservator-cli",
-    package_name="conservator-cli",
-    message="%(prog)s, version %(version)s \nLatest version on PyPi is {}".format(
-        get_conservator_cli_version()
-    ),
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=print_version,
+    help="Show the version and exit.",
 )
 def main(log, config):
+    from FLIR.conservator.util import check_platform
+
     check_platform()
     levels = {
         "DEBUG": logging.DEBUG,
@@ -59,22 +80,14 @@ def main(log, config):
 
 @main.command(help="Print information on the current user")
 def whoami():
+    from FLIR.conservator.conservator import Conservator
+    from FLIR.conservator.util import to_clean_string
+
     ctx_obj = click.get_current_context().obj
     conservator = Conservator.create(ctx_obj["config_name"])
     user = conservator.get_user()
     click.echo(to_clean_string(user))
 
 
-main.add_command(config_)
-main.add_command(
-    get_manager_command(CollectionManager, schema.Collection, "collections")
-)
-main.add_command(get_manager_command(DatasetManager, schema.Dataset, "datasets"))
-main.add_command(get_manager_command(ProjectManager, schema.Project, "projects"))
-main.add_command(get_manager_command(VideoManager, schema.Video, "videos"))
-main.add_command(get_manager_command(ImageManager, schema.Image, "images"))
-main.add_command(interactive)
-main.add_command(cvc, name="cvc")
-
 if __name__ == "__main__":
     main()
@@ -14,14 +14,16 @@ import click
 
 from click import get_current_context
 
-from FLIR.conservator.conservator import Conservator
-from FLIR.conservator.local_dataset import LocalDataset
-from FLIR.conservator.util import check_platform, check_dir_access
+# Most of the library is only imported by the commands that use it,
+# so commands like --help start quickly.
 
 
 def pass_valid_local_dataset(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        from FLIR.conservator.conservator import Conservator
+        from FLIR.conservator.local_dataset import LocalDataset
+
         ctx_obj = get_current_context().obj
 
         if "conservator" in ctx_obj:
@@ -51,6 +53,8 @@ def pass_valid_local_dataset(func):
 def check_git_config(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        from FLIR.conservator.conservator import Conservator
+
         ctx_obj = get_current_context().obj
 
         if "conservator" in ctx_obj:
@@ -156,6 +160,8 @@ def check_git_config(func):
 @click.version_option(prog_name="conservator-cli", package_name="conservator-cli")
 @click.pass_context
 def main(ctx, log, path, config, url, api_key):
+    from FLIR.conservator.util import check_platform
+
     check_platform()
     levels = {
         "DEBUG": logging.DEBUG,
@@ -197,6 +203,10 @@ def main(ctx, log, path, config, url, api_key):
 @click.option("-k", "--api-key", help="API Key to use when connecting to Conservator")
 @click.pass_context
 def clone(ctx, identifier, path, checkout, url, api_key):
+    from FLIR.conservator.conservator import Conservator
+    from FLIR.conservator.local_dataset import LocalDataset
+    from FLIR.conservator.util import check_dir_access
+
     if not check_dir_access(os.getcwd()):
         click.secho(f"Cannot clone to directory {os.getcwd()}!", fg="red", bold=True)
         sys.exit(1)
@@ -221,6 +231,8 @@ def checkout_(local_dataset, commit):
 
 # pylint: disable=unused-argument
 def is_image_file(ctx, param, value):
+    from FLIR.conservator.local_dataset import LocalDataset
+
     for filename in value:
         if not LocalDataset.get_image_info(filename):
             raise click.BadParameter(
@@ -343,7 +355,7 @@ def status(local_dataset):
     type=int,
     default=10,
     show_default=True,
-    help="Number of concurrent processes to use when downloading.",
+    help="Number of concurrent downloads (threads) to use when downloading.",
 )
 @click.option(
     "-s",
@@ -362,6 +374,8 @@ def status(local_dataset):
 @pass_valid_local_dataset
 @check_git_config
 def download(local_dataset, include_raw, include_analytics, pool_size, symlink, tries):
+    from FLIR.conservator.util import check_dir_access
+
     if include_raw and not check_dir_access(local_dataset.data_path):
         click.secho(f"Cannot write to {local_dataset.data_path}!", fg="red", bold=True)
         sys.exit(1)
@@ -512,6 +526,8 @@ def publish(local_dataset, message, skip_validation, tries):
 )
 @pass_valid_local_dataset
 def update_identity(local_dataset):
+    from FLIR.conservator.conservator import Conservator
+
     ctx_obj = get_current_context().obj
     conservator = Conservator.create(ctx_obj["config_name"])
 
@@ -583,6 +599,8 @@ def cvc(ctx, path):
     # It is the same as main() except it skips things that toplevel
     # conservator command already handles (logging and conservator config,
     # and would result in confusing behavior if included twice.
+    from FLIR.conservator.util import check_platform
+
     check_platform()
     ctx.obj["cvc_local_path"] = path
 
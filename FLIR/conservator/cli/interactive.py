@@ -3,7 +3,6 @@ import os
 import shlex
 
 import click
-import readline
 
 from typing import Optional
 
@@ -33,9 +32,13 @@ def complete(value, state):
         return f"{args[0]} {v}"
 
 
-readline.set_completer_delims("")
-readline.set_completer(complete)
-readline.parse_and_bind("tab: complete")
+def configure_readline():
+    # Not done on import, so importing the CLI doesn't change the terminal.
+    import readline
+
+    readline.set_completer_delims("")
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
 
 
 def print_status(message):
@@ -399,6 +402,7 @@ def run_shell_command(command):
 @click.command(help="An interactive shell for exploring conservator")
 def interactive():
     global conservator
+    configure_readline()
     ctx_obj = click.get_current_context().obj
     conservator = Conservator.create(ctx_obj["config_name"])
 
@@ -0,0 +1,58 @@
+"""
+A click group whose subcommands are imported when first used.
+
+Importing a subcommand can mean importing most of the library (the generated
+schema, managers, ``requests``, ``PIL``...). With :class:`LazyGroup`, commands
+like ``conservator --help`` only import what they run.
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A :class:`click.Group` with subcommands that are imported when first used.
+
+    :param lazy_subcommands: A `dict` by command name of
+        ``(import_path, help)`` tuples. `import_path` is the command's module
+        and attribute, such as ``"FLIR.conservator.cli.config:config_"``.
+        `help` is shown in the group's help, without importing the command.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name):
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"{import_path} is not a click command")
+        return command
+
+    def format_commands(self, ctx, formatter):
+        # Same as click.MultiCommand.format_commands, but unloaded commands
+        # use their help from lazy_subcommands.
+        limit = formatter.width - 6 - max(map(len, self.list_commands(ctx)))
+        rows = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name, None)
+            if command is None:
+                _, help_ = self.lazy_subcommands[name]
+                rows.append((name, click.utils.make_default_short_help(help_, limit)))
+            elif not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
@@ -3,11 +3,15 @@ import functools
 
 from FLIR.conservator.conservator import Conservator
 from FLIR.conservator.fields_request import FieldsRequest
+from FLIR.conservator.generated import schema
 from FLIR.conservator.managers import (
     SearchableTypeManager,
     CollectionManager,
     MediaTypeManager,
     DatasetManager,
+    ProjectManager,
+    VideoManager,
+    ImageManager,
 )
 from FLIR.conservator.wrappers.collection import Collection, InvalidRemotePathException
 from FLIR.conservator.util import to_clean_string
@@ -469,3 +473,11 @@ def get_manager_command(type_manager, sgqlc_type, name):
             return True
 
     return group
+
+
+# Imported by the conservator command when first used.
+collections_ = get_manager_command(CollectionManager, schema.Collection, "collections")
+datasets_ = get_manager_command(DatasetManager, schema.Dataset, "datasets")
+projects_ = get_manager_command(ProjectManager, schema.Project, "projects")
+videos_ = get_manager_command(VideoManager, schema.Video, "videos")
+images_ = get_manager_command(ImageManager, schema.Image, "images")
@@ -0,0 +1,150 @@
+"""
+Caches the GraphQL documents built by
+:meth:`~FLIR.conservator.connection.ConservatorConnection.query`.
+
+Building a document means creating an SGQLC operation, selecting its fields
+with :meth:`~FLIR.conservator.fields_request.FieldsRequest.prepare_query`, and
+serializing it. Arguments are passed as GraphQL variables rather than inlined,
+so the document only depends on the query, the requested fields, and the names
+of the arguments. Repeated queries (such as the pages of a
+:class:`~FLIR.conservator.paginated_query.PaginatedQuery`) reuse the
+cached document, and only send new variables.
+"""
+
+import collections
+import re
+import threading
+
+import sgqlc.types
+from sgqlc.operation import Operation
+from sgqlc.types import Variable
+
+from FLIR.conservator.fields_request import FieldsRequest
+
+
+def operation_to_graphql(operation):
+    """
+    Serializes an SGQLC `operation` to a GraphQL document, dropping any
+    empty selections.
+    """
+    # The depth is completely arbitrary atm...
+    gql = operation.__to_graphql__(auto_select_depth=5)
+    return re.sub(r"\w* {\s*}\s*", "", gql)
+
+
+class CompiledQuery:
+    """
+    A serialized GraphQL document, and the SGQLC operation used to
+    interpret its responses.
+
+    :param query: The SGQLC query (or mutation) field.
+    :param fields: The :class:`~FLIR.conservator.fields_request.FieldsRequest`
+        of fields to select.
+    :param arg_names: The names of the arguments passed to the query.
+    """
+
+    def __init__(self, query, fields, arg_names):
+        self.args = {name: query.args[name] for name in arg_names}
+        variables = {name: arg.type for name, arg in self.args.items()}
+        self.operation = Operation(query.container, variables=variables)
+        selector = getattr(self.operation, query.name)
+        selector(**{name: Variable(name) for name in self.args})
+        fields.prepare_query(selector)
+        self.gql = operation_to_graphql(self.operation)
+
+    def variables(self, kwargs):
+        """
+        Returns the GraphQL variables for running this query with `kwargs`.
+        """
+        return {
+            arg.graphql_name: arg.type.__to_json_value__(kwargs[name])
+            for name, arg in self.args.items()
+        }
+
+
+class CompiledQueryCache:
+    """
+    A least-recently-used cache of :class:`CompiledQuery`.
+
+    The number of cache hits and misses are counted in ``hits`` and ``misses``.
+
+    :param max_size: The maximum number of documents to keep.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._compiled = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def can_compile(query, kwargs):
+        """
+        Returns `True` if every argument in `kwargs` can be passed to
+        `query` as a variable.
+        """
+        return all(
+            name in query.args and _is_variable_value(value)
+            for name, value in kwargs.items()
+        )
+
+    def get(self, query, fields, kwargs):
+        """
+        Returns the :class:`CompiledQuery` for running `query` with `fields`
+        and `kwargs`, compiling it if it isn't cached.
+        """
+        fields = FieldsRequest.create(fields)
+        arg_names = tuple(sorted(kwargs))
+        key = (query.container.__name__, query.name, fields.cache_key(), arg_names)
+        with self._lock:
+            compiled = self._compiled.get(key, None)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = CompiledQuery(query, fields, arg_names)
+        with self._lock:
+            self._compiled[key] = compiled
+            while len(self._compiled) > self.max_size:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        """Removes every cached document, and resets the counters."""
+        with self._lock:
+            self._compiled.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns a `dict` with the number of ``hits``, ``misses`` and cached
+        documents (``size``).
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def __len__(self):
+        return len(self._compiled)
+
+    def __getstate__(self):
+        # Cached documents are cheap to rebuild, and locks can't be pickled.
+        # This matters when a Conservator is sent to worker processes.
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_size"])
+
+
+def _is_variable_value(value):
+    # Other values (such as dicts for input types) are only understood
+    # by SGQLC when inlined in the document.
+    if isinstance(value, (list, tuple)):
+        return all(_is_variable_value(item) for item in value)
+    return value is None or isinstance(
+        value, (str, int, float, bool, sgqlc.types.Input)
+    )
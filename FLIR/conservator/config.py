@@ -7,11 +7,12 @@ In general, use :func:`Config.default`.
 
 import os
 import json
+import functools
 import logging
 from collections import OrderedDict
 
-import requests
 from FLIR.conservator.connection import ConservatorConnection
+from FLIR.conservator.http_session import DEFAULT_POOL_SIZE, get_default_session
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +22,40 @@ class ConfigError(Exception):
 
 
 class ConfigAttribute:
+    """
+    Describes a single value stored in a :class:`Config`.
+
+    Attributes with `prompt` set to `False` are tuning options. They aren't asked
+    for by :func:`Config.from_input`, and use their default unless set in a config
+    file or the environment. Their `validator` is run when a :class:`Config` is
+    created instead.
+    """
+
     def __init__(
-        self, internal_name, friendly_name, default=None, type_=str, validator=None
+        self,
+        internal_name,
+        friendly_name,
+        default=None,
+        type_=str,
+        validator=None,
+        prompt=True,
     ):
         self.internal_name = internal_name
         self.friendly_name = friendly_name
         self.default = default
         self.type_ = type_
         self.validator = validator
+        self.prompt = prompt
+
+
+def to_bool(value):
+    """
+    Converts a config value to a `bool`. Strings such as ``"false"`` or ``"0"``
+    (for instance, from environment variables) are `False`.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
 
 
 def validate_max_retries(config_dict):
@@ -47,6 +74,27 @@ def validate_max_retries(config_dict):
     return retries_ok
 
 
+def validate_http_pool_size(config_dict):
+    """
+    Validates HTTP connection pool size value in a config
+    """
+    try:
+        return int(config_dict["CONSERVATOR_HTTP_POOL_SIZE"]) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_limit(config_dict, internal_name):
+    """
+    Validates a rate or concurrency limit value in a config. Zero means
+    unlimited.
+    """
+    try:
+        return float(config_dict[internal_name]) >= 0
+    except (TypeError, ValueError):
+        return False
+
+
 def validate_cache_path(config_dict):
     """
     Validates cache path value in a config
@@ -70,7 +118,7 @@ def validate_url(config_dict):
     try:
         # does url have graphql endpoint?
         check_url = ConservatorConnection.to_graphql_url(config_dict["CONSERVATOR_URL"])
-        response = requests.head(check_url, timeout=10)
+        response = get_default_session().head(check_url, timeout=10)
         if response.status_code == 405:
             url_ok = True
     except Exception:
@@ -110,7 +158,17 @@ class Config:
      - ``CONSERVATOR_API_KEY``
      - ``CONSERVATOR_URL``
      - ``CONSERVATOR_MAX_RETRIES`` (default: 5)
+     - ``CONSERVATOR_RETRY_BUDGET`` (retries per request, default: 0 for no budget)
      - ``CONSERVATOR_CVC_CACHE_PATH`` (default: .cvc/cache)
+     - ``CONSERVATOR_HTTP_POOL_SIZE`` (default: 10)
+     - ``CONSERVATOR_VERSION_CHECK`` (default: true)
+     - ``CONSERVATOR_GRAPHQL_RATE_LIMIT`` (requests per second, default: 0 for no limit)
+     - ``CONSERVATOR_GRAPHQL_MAX_IN_FLIGHT`` (default: 0 for no limit)
+     - ``CONSERVATOR_TRANSFER_RATE_LIMIT`` (MiB per second, default: 0 for no limit)
+     - ``CONSERVATOR_TRANSFER_MAX_IN_FLIGHT`` (default: 0 for no limit)
+     - ``CONSERVATOR_METRICS_PATH`` (default: empty, metrics aren't saved)
+     - ``CONSERVATOR_FIELD_PROFILE_PATH`` (default: empty, field usage isn't profiled)
+     - ``CONSERVATOR_LEARNED_FIELDS_PATH`` (default: empty, default fields are used)
 
     :param kwargs: A dictionary of (`str`: `str`) providing values for all of the Config attributes.
         Any attribute not in the dictionary, will use the default value. If no default value is defined,
@@ -127,12 +185,95 @@ class Config:
                 type_=int,
                 validator=validate_max_retries,
             ),
+            "retry_budget": ConfigAttribute(
+                "CONSERVATOR_RETRY_BUDGET",
+                "Retries Per Request (0 for no budget)",
+                default=0.0,
+                type_=float,
+                validator=functools.partial(
+                    validate_limit, internal_name="CONSERVATOR_RETRY_BUDGET"
+                ),
+                prompt=False,
+            ),
             "cvc_cache_path": ConfigAttribute(
                 "CONSERVATOR_CVC_CACHE_PATH",
                 "CVC Cache Path",
                 default=os.path.join(".cvc", "cache"),
                 validator=validate_cache_path,
             ),
+            "http_pool_size": ConfigAttribute(
+                "CONSERVATOR_HTTP_POOL_SIZE",
+                "HTTP Connection Pool Size",
+                default=DEFAULT_POOL_SIZE,
+                type_=int,
+                validator=validate_http_pool_size,
+                prompt=False,
+            ),
+            "version_check": ConfigAttribute(
+                "CONSERVATOR_VERSION_CHECK",
+                "Check For Newer Versions",
+                default=True,
+                type_=bool,
+                prompt=False,
+            ),
+            "graphql_rate_limit": ConfigAttribute(
+                "CONSERVATOR_GRAPHQL_RATE_LIMIT",
+                "GraphQL Requests Per Second (0 for no limit)",
+                default=0.0,
+                type_=float,
+                validator=functools.partial(
+                    validate_limit, internal_name="CONSERVATOR_GRAPHQL_RATE_LIMIT"
+                ),
+                prompt=False,
+            ),
+            "graphql_max_in_flight": ConfigAttribute(
+                "CONSERVATOR_GRAPHQL_MAX_IN_FLIGHT",
+                "Concurrent GraphQL Requests (0 for no limit)",
+                default=0,
+                type_=int,
+                validator=functools.partial(
+                    validate_limit, internal_name="CONSERVATOR_GRAPHQL_MAX_IN_FLIGHT"
+                ),
+                prompt=False,
+            ),
+            "transfer_rate_limit": ConfigAttribute(
+                "CONSERVATOR_TRANSFER_RATE_LIMIT",
+                "File Transfer MiB Per Second (0 for no limit)",
+                default=0.0,
+                type_=float,
+                validator=functools.partial(
+                    validate_limit, internal_name="CONSERVATOR_TRANSFER_RATE_LIMIT"
+                ),
+                prompt=False,
+            ),
+            "transfer_max_in_flight": ConfigAttribute(
+                "CONSERVATOR_TRANSFER_MAX_IN_FLIGHT",
+                "Concurrent File Transfers (0 for no limit)",
+                default=0,
+                type_=int,
+                validator=functools.partial(
+                    validate_limit, internal_name="CONSERVATOR_TRANSFER_MAX_IN_FLIGHT"
+                ),
+                prompt=False,
+            ),
+            "metrics_path": ConfigAttribute(
+                "CONSERVATOR_METRICS_PATH",
+                "Metrics Output Path (.json or .prom)",
+                default="",
+                prompt=False,
+            ),
+            "field_profile_path": ConfigAttribute(
+                "CONSERVATOR_FIELD_PROFILE_PATH",
+                "Field Usage Report Path",
+                default="",
+                prompt=False,
+            ),
+            "learned_fields_path": ConfigAttribute(
+                "CONSERVATOR_LEARNED_FIELDS_PATH",
+                "Learned Fields Path (a field usage report)",
+                default="",
+                prompt=False,
+            ),
             "url": ConfigAttribute(
                 "CONSERVATOR_URL",
                 "Conservator URL (The URL you use to access Conservator in a browser)",
@@ -149,12 +290,24 @@ class Config:
         for name, attr in Config.ATTRIBUTES.items():
             value = kwargs.get(attr.internal_name, None)
             if value is not None:
-                value = attr.type_(value)
+                try:
+                    value = to_bool(value) if attr.type_ is bool else attr.type_(value)
+                except ValueError as e:
+                    raise ConfigError(
+                        f"Invalid value for '{attr.internal_name}': {value!r}"
+                    ) from e
             if value is None:
                 value = attr.default
             if value is None:
                 raise ConfigError(f"Missing value for '{name}'")
             assert isinstance(value, attr.type_)
+            # Other attributes are validated by from_input(), since checking
+            # the URL and key needs a request.
+            if not attr.prompt and attr.validator is not None:
+                if not attr.validator({attr.internal_name: value}):
+                    raise ConfigError(
+                        f"Invalid value for '{attr.internal_name}': {value!r}"
+                    )
             setattr(self, name, value)
 
     @staticmethod
@@ -182,6 +335,9 @@ class Config:
 
         config_dict = {}
         for name, attr in Config.ATTRIBUTES.items():
+            if not attr.prompt:
+                config_dict[attr.internal_name] = attr.default
+                continue
             # loop until user supplies a config that actually works
             while True:
                 if attr.default is None:
@@ -1,21 +1,36 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=broad-except
 # pylint: disable=unnecessary-pass
-import re
+import functools
 import urllib.parse
 import logging
 import platform
+import re
+import reprlib
 import sys
+import threading
+import time
 
 import requests
-from sgqlc.endpoint.http import HTTPEndpoint
+from sgqlc.endpoint.requests import RequestsEndpoint
 from sgqlc.operation import Operation
 
+from FLIR.conservator.batch import QueryBatch
+from FLIR.conservator.compiled_query import CompiledQueryCache, operation_to_graphql
+from FLIR.conservator.field_usage import FieldUsageProfiler, load_learned_fields
 from FLIR.conservator.fields_manager import FieldsManager
 from FLIR.conservator.fields_request import FieldsRequest
 from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.http_session import create_session
+from FLIR.conservator.metrics import Metrics
+from FLIR.conservator.rate_limit import RateLimiter
+from FLIR.conservator.response_cache import ResponseCache
+from FLIR.conservator.retry import RetryBudget, RetryPolicy, parse_retry_after
 from FLIR.conservator.version import version as cli_ver
-from FLIR.conservator.util import compare_conservator_cli_version
+from FLIR.conservator.util import (
+    check_conservator_cli_version_in_background,
+    to_snake_case_keys,
+)
 
 __all__ = [
     "ConservatorMalformedQueryException",
@@ -27,6 +42,43 @@ from FLIR.conservator.wrappers import TypeProxy
 
 logger = logging.getLogger(__name__)
 
+# Limits how much of a response is rendered in debug logs.
+_response_repr = reprlib.Repr()
+_response_repr.maxlevel = 4
+_response_repr.maxdict = 10
+_response_repr.maxlist = 10
+_response_repr.maxstring = 200
+_response_repr.maxother = 200
+
+
+class _LazyResponseRepr:
+    """Renders a response only if it is actually logged."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def __str__(self):
+        return _response_repr.repr(self.response)
+
+
+# The decoded size of the last GraphQL response received by each thread.
+# Content-Length is missing from chunked responses, and is the compressed
+# size of gzipped ones.
+_response_sizes = threading.local()
+
+
+def _record_response_size(response, *args, **kwargs):
+    # A requests response hook. Streamed content must be left for the caller.
+    if not kwargs.get("stream", False):
+        _response_sizes.size = len(response.content)
+
+
+@functools.lru_cache(maxsize=256)
+def _operation_name(gql):
+    # The first field selected, skipping any alias.
+    match = re.search(r"{\s*(?:\w+\s*:\s*)?(\w+)", gql)
+    return match.group(1) if match else "unknown"
+
 
 class ConservatorMalformedQueryException(Exception):
     """
@@ -58,12 +110,46 @@ class ConservatorConnection:
     """
     Acts as an intermediary between SGQLC and a remote Conservator instance.
 
+    All HTTP requests made by the connection share a single pooled
+    :class:`requests.Session`, available as ``session``, so connections
+    to the server are kept alive between requests. A forked child process
+    gets new pools, so it never shares sockets with its parent.
+
+    Documents built by :meth:`query` are cached in ``query_cache``, a
+    :class:`~FLIR.conservator.compiled_query.CompiledQueryCache` that
+    counts its hits and misses.
+
+    Responses to queries that rarely change are kept in ``response_cache``,
+    a :class:`~FLIR.conservator.response_cache.ResponseCache`. Set it to
+    `None` to always ask the server.
+
+    Failed requests are retried according to ``retry_policy``, a
+    :class:`~FLIR.conservator.retry.RetryPolicy` that is also used for
+    file transfers. Retries are only limited by a
+    :class:`~FLIR.conservator.retry.RetryBudget` if the config's
+    ``retry_budget`` is set.
+
+    The load put on the server is limited by ``graphql_limiter`` (for GraphQL
+    requests) and ``transfer_limiter`` (for the bytes of file transfers), two
+    :class:`~FLIR.conservator.rate_limit.RateLimiter` configured by the
+    config's rate and in-flight limits.
+
+    Latency, sizes and retries of requests are recorded in ``metrics``, a
+    :class:`~FLIR.conservator.metrics.Metrics`.
+
+    If the config's ``field_profile_path`` is set, the fields read from query
+    results are recorded in ``field_usage``, a
+    :class:`~FLIR.conservator.field_usage.FieldUsageProfiler`. Queries selecting
+    default fields use the fields in ``learned_fields`` instead, a `dict` by
+    query name loaded from the config's ``learned_fields_path``.
+
     :param config: :class:`~FLIR.conservator.config.Config` providing Conservator URL and user
         authentication info.
     """
 
     def __init__(self, config):
-        compare_conservator_cli_version()
+        if config.version_check:
+            check_conservator_cli_version_in_background()
 
         self.config = config
         self.email = None
@@ -79,8 +165,38 @@ class ConservatorConnection:
             "authorization": config.key,
             "User-Agent": agent_string,
         }
-        self.endpoint = HTTPEndpoint(self.graphql_url, base_headers=headers)
+        self.session = create_session(config.http_pool_size)
+        self.session.hooks["response"].append(_record_response_size)
+        self.endpoint = RequestsEndpoint(
+            self.graphql_url, base_headers=headers, session=self.session
+        )
         self.fields_manager = FieldsManager()
+        self.query_cache = CompiledQueryCache()
+        self.response_cache = ResponseCache()
+        retry_budget = None
+        if config.retry_budget > 0:
+            retry_budget = RetryBudget(ratio=config.retry_budget)
+        self.retry_policy = RetryPolicy(
+            max_retries=config.max_retries, budget=retry_budget
+        )
+        self.graphql_limiter = RateLimiter(
+            rate=config.graphql_rate_limit,
+            max_in_flight=config.graphql_max_in_flight,
+        )
+        self.transfer_limiter = RateLimiter(
+            rate=config.transfer_rate_limit * 1024 * 1024,
+            max_in_flight=config.transfer_max_in_flight,
+        )
+        self.metrics = Metrics()
+        if config.metrics_path:
+            self.metrics.dump_at_exit(config.metrics_path)
+        self.field_usage = None
+        if config.field_profile_path:
+            self.field_usage = FieldUsageProfiler()
+            self.field_usage.dump_at_exit(config.field_profile_path)
+        self.learned_fields = {}
+        if config.learned_fields_path:
+            self.learned_fields = load_learned_fields(config.learned_fields_path)
 
     def get_email(self):
         """Returns the current User's email"""
@@ -146,7 +262,8 @@ class ConservatorConnection:
         """
         hash_url = self.get_dvc_hash_url(md5)
         # We only care about the status code, so we use .head
-        response = requests.head(hash_url, timeout=10)
+        with self.graphql_limiter.limit():
+            response = self.session.head(hash_url, timeout=10)
         # 302 means the file was found.
         return response.status_code == 302
 
@@ -170,20 +287,84 @@ class ConservatorConnection:
         If any errors are encountered, they will be raised with a
         :class:`ConservatorGraphQLServerError`.
         """
-        # The depth is completely arbitrary atm...
-        gql = operation.__to_graphql__(auto_select_depth=5)
-        gql = re.sub(r"\w* {\s*}\s*", "", gql)
-        json_response = self.endpoint(gql, variables)
-        logger.debug("Response: %s", str(json_response))
+        gql = self._to_graphql(operation)
+        return self._run_document(gql, operation, variables)
+
+    def _run_document(
+        self, gql, operation, variables=None, cache_policy=None, raw=False
+    ):
+        cache_key = None
+        if cache_policy is not None and self.response_cache is not None:
+            cache_key = ResponseCache.key(self.config, gql, variables, cache_policy)
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                if raw:
+                    return cached_response["data"]
+                return operation + cached_response
+
+        json_response = self._execute(gql, variables)
+        if gql.startswith("mutation"):
+            self._invalidate_response_cache()
         errors = json_response.get("errors", None)
         if errors is not None:
             raise ConservatorGraphQLServerError(gql, errors)
 
+        if cache_key is not None:
+            self.response_cache.set(cache_key, json_response, cache_policy)
+        if raw:
+            # Skip building SGQLC objects.
+            return json_response["data"]
         response = operation + json_response
 
         return response
 
-    def query(self, query, operation_base=None, fields=None, **kwargs):
+    def _invalidate_response_cache(self):
+        # Even a failed mutation may have changed something.
+        if self.response_cache is not None:
+            self.response_cache.invalidate()
+
+    def _cache_policy(self, query, kwargs):
+        if self.response_cache is None:
+            return None
+        return self.response_cache.policy_for(query, kwargs)
+
+    @staticmethod
+    def _to_graphql(operation):
+        return operation_to_graphql(operation)
+
+    def _execute(self, gql, variables=None):
+        start = time.perf_counter()
+        _response_sizes.size = 0
+        try:
+            with self.graphql_limiter.limit():
+                json_response = self.endpoint(gql, variables)
+        except requests.exceptions.RequestException as request_error:
+            # Report connection problems the same way as HTTP errors, so they
+            # are retried by query().
+            json_response = {
+                "data": None,
+                "errors": [{"message": str(request_error), "exception": request_error}],
+            }
+        seconds = time.perf_counter() - start
+        self.metrics.record_request(
+            "graphql",
+            _operation_name(gql),
+            seconds,
+            size=_response_sizes.size,
+            error=bool(json_response.get("errors", None)),
+        )
+        logger.debug("Response: %s", _LazyResponseRepr(json_response))
+        return json_response
+
+    def query(
+        self,
+        query,
+        operation_base=None,
+        fields=None,
+        raw=False,
+        retry_policy=None,
+        **kwargs,
+    ):
         """
         Provides an alternative way to prepare and run SGQLC operations.
 
@@ -191,42 +372,199 @@ class ConservatorConnection:
         :param operation_base: Not required. Included for backwards-compatibility.
         :param fields: A :class:`FLIR.conservator.fields_request.FieldsRequest` of
             the fields to include (or exclude) in the results.
+        :param raw: If `True`, return the decoded JSON result (with snake_case
+            keys) instead of wrapped objects. This is much faster for large
+            results, but custom scalars (such as dates) are left as strings.
+        :param retry_policy: A :class:`~FLIR.conservator.retry.RetryPolicy` used
+            instead of ``retry_policy`` for this query.
         :param kwargs: These named parameters are passed as arguments to the query.
         """
+        return self._with_retries(
+            self._query, query, fields, raw=raw, retry_policy=retry_policy, **kwargs
+        )
 
+    def _with_retries(self, func, *args, retry_policy=None, **kwargs):
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+        retry_policy.record_request()
         tries = 0
 
         while True:
             try:
-                return self._query(query, fields, **kwargs)
+                return func(*args, **kwargs)
             except ConservatorGraphQLServerError as graphql_error:
-                exception = graphql_error.errors[0].get("exception", None)
+                error = graphql_error.errors[0]
+                exception = error.get("exception", None)
                 if exception is None:
                     # This is a graphql error sent by the server.
                     # The query shouldn't be retried.
                     raise
 
-                # Otherwise we had an error due to connection. We should retry.
-                # (see _log_http_error in sgqlc/endpoint/http.py)
-                tries += 1
-                if tries > self.config.max_retries:
+                # Otherwise we had an error due to connection or an HTTP
+                # error status (see _log_http_error in sgqlc/endpoint/requests.py)
+                status = error.get("status", None)
+                if status is not None:
+                    exception = None
+                if not retry_policy.should_retry(
+                    tries, status_code=status, exception=exception
+                ):
                     raise
-                logger.warning(
-                    "Retrying request after exception: %s", str(graphql_error)
+                tries += 1
+                self.metrics.record_retry(
+                    "graphql", _operation_name(graphql_error.operation)
+                )
+                retry_after = parse_retry_after(
+                    (error.get("headers", None) or {}).get("Retry-After", None)
+                )
+                retry_policy.sleep(
+                    tries, retry_after, reason=f"request failed: {graphql_error}"
                 )
-                logger.warning("Retry #%s", str(tries))
 
-    def _query(self, query, fields, **kwargs):
-        type_ = query.type
-        gql_op = Operation(query.container)
-        query_name = query.name
-        query = getattr(gql_op, query_name)
-        query(**kwargs)
+    def batch(self, batch_size=QueryBatch.DEFAULT_BATCH_SIZE):
+        """
+        Returns a :class:`~FLIR.conservator.batch.QueryBatch` for running many
+        independent queries or mutations in a single request. When used as a
+        context manager, the batch is executed on exit:
 
-        field_req = FieldsRequest.create(fields)
-        field_req.prepare_query(query)
+        >>> with conservator.batch() as batch:
+        ...     first = batch.query(Query.dataset, id=first_id, fields="name")
+        ...     second = batch.query(Query.dataset, id=second_id, fields="name")
+        >>> print(first.value.name, second.value.name)
+
+        :param batch_size: The maximum number of calls sent in a single request.
+        """
+        return QueryBatch(self, batch_size=batch_size)
+
+    def query_many(self, calls, batch_size=QueryBatch.DEFAULT_BATCH_SIZE):
+        """
+        Runs many independent queries or mutations, using as few requests as
+        possible. Returns a list with a :class:`~FLIR.conservator.batch.BatchResult`
+        for each call, in the same order. A failed call doesn't affect the others;
+        its error is stored on its result.
+
+        :param calls: A list of ``(query, kwargs)`` or ``(query, kwargs, fields)``
+            tuples, with the same meaning as the arguments of :meth:`query`.
+        :param batch_size: The maximum number of calls sent in a single request.
+        """
+        batch = self.batch(batch_size=batch_size)
+        for query, kwargs, *fields in calls:
+            batch.query(query, fields=fields[0] if fields else None, **kwargs)
+        return batch.execute()
 
-        result = self.run(gql_op)
-        value = getattr(result, query_name)
+    def run_batch(self, container, batch_results):
+        """
+        Runs the calls of `batch_results` in a single operation on `container`
+        (``Query`` or ``Mutation``), storing each call's value or error on its
+        :class:`~FLIR.conservator.batch.BatchResult`.
 
-        return TypeProxy.wrap(self, type_, value)
+        Connection errors are retried like in :meth:`query`.
+        """
+        self._with_retries(self._run_batch, container, batch_results)
+
+    def _run_batch(self, container, batch_results):
+        gql_op = Operation(container)
+        aliases = [f"batch{index}" for index in range(len(batch_results))]
+        for alias, batch_result in zip(aliases, batch_results):
+            selector = getattr(gql_op, batch_result.query.name)
+            selector = selector(__alias__=alias, **batch_result.kwargs)
+            fields = self._fields_for(batch_result.query, batch_result.fields)
+            fields.prepare_query(selector)
+
+        gql = self._to_graphql(gql_op)
+        json_response = self._execute(gql)
+        if container is not Query:
+            self._invalidate_response_cache()
+        errors = json_response.get("errors", None) or []
+        if any(error.get("exception", None) is not None for error in errors):
+            # Retried by run_batch().
+            raise ConservatorGraphQLServerError(gql, errors)
+
+        # Errors are attributed to calls by the first element of their path,
+        # which is the call's alias. Any other error affects every call.
+        errors_by_alias = {}
+        for error in errors:
+            path = error.get("path", None) or [None]
+            errors_by_alias.setdefault(path[0], []).append(error)
+        shared_errors = [
+            error
+            for alias, alias_errors in errors_by_alias.items()
+            if alias not in aliases
+            for error in alias_errors
+        ]
+
+        if json_response.get("data", None) is None:
+            # An error in a non-null field nulls the whole response, so the
+            # results of calls without errors are lost. Queries are safe to run
+            # again, but mutations may already have been applied.
+            rerun = []
+            for alias, batch_result in zip(aliases, batch_results):
+                call_errors = errors_by_alias.get(alias, []) + shared_errors
+                if not call_errors and container is Query:
+                    rerun.append(batch_result)
+                    continue
+                batch_result.set_error(
+                    ConservatorGraphQLServerError(gql, call_errors or errors)
+                )
+            if rerun:
+                self._run_batch(container, rerun)
+            return
+
+        response = gql_op + {"data": json_response["data"]}
+        for alias, batch_result in zip(aliases, batch_results):
+            call_errors = errors_by_alias.get(alias, []) + shared_errors
+            if call_errors:
+                batch_result.set_error(ConservatorGraphQLServerError(gql, call_errors))
+                continue
+            value = getattr(response, alias)
+            batch_result.set_value(self._wrap_value(batch_result.query, value))
+
+    def _query(self, query, fields, raw=False, **kwargs):
+        fields = self._fields_for(query, fields)
+        cache_policy = self._cache_policy(query, kwargs)
+        if not self.query_cache.can_compile(query, kwargs):
+            # Let SGQLC report the unknown arguments.
+            gql_op = self._prepare_operation(query, fields, **kwargs)
+            gql = self._to_graphql(gql_op)
+            result = self._run_document(gql, gql_op, cache_policy=cache_policy, raw=raw)
+            return self._wrap_result(query, result, raw)
+
+        compiled = self.query_cache.get(query, fields, kwargs)
+        result = self._run_document(
+            compiled.gql,
+            compiled.operation,
+            compiled.variables(kwargs),
+            cache_policy=cache_policy,
+            raw=raw,
+        )
+        return self._wrap_result(query, result, raw)
+
+    @staticmethod
+    def _prepare_operation(query, fields, **kwargs):
+        gql_op = Operation(query.container)
+        selector = getattr(gql_op, query.name)
+        selector(**kwargs)
+
+        field_req = FieldsRequest.create(fields)
+        field_req.prepare_query(selector)
+        return gql_op
+
+    def _wrap_result(self, query, result, raw=False):
+        if raw:
+            return to_snake_case_keys(result[query.graphql_name])
+        value = getattr(result, query.name)
+        return self._wrap_value(query, value)
+
+    def _wrap_value(self, query, value):
+        wrapped = TypeProxy.wrap(self, query.type, value)
+        if self.field_usage is not None:
+            self.field_usage.track(query.name, value, wrapped)
+        return wrapped
+
+    def _fields_for(self, query, fields):
+        # Learned fields replace default fields only.
+        fields = FieldsRequest.create(fields)
+        if self.learned_fields and not fields.paths and not fields.excluded:
+            learned = self.learned_fields.get(query.name, None)
+            if learned:
+                return FieldsRequest.create(learned)
+        return fields
@@ -0,0 +1,238 @@
+"""
+Finds the fields that queries fetch but scripts never read.
+
+Queries run without `fields` select the defaults of
+:class:`~FLIR.conservator.fields_manager.FieldsManager`, which often include
+fields (such as ACLs, file lockers and counts) that a script never uses.
+A :class:`FieldUsageProfiler` records which fields each query fetched, and
+which of them were read from the returned objects. Its report lists the
+unused fields, and suggests a minimal
+:class:`~FLIR.conservator.fields_request.FieldsRequest` for each query.
+
+Fields are attributed to the query that returned the object they were read
+from, by query name. Reading a field includes accessing it as an attribute,
+checking it with :meth:`~FLIR.conservator.wrappers.type_proxy.TypeProxy.has_field`
+and converting the object with ``to_json`` or ``str``. Results of queries run
+with ``raw=True`` aren't tracked.
+
+If the config's ``field_profile_path`` is set, the report is written there as
+JSON when the process exits. The same file can be given as a later run's
+``learned_fields_path``. Queries in that run that would select default fields
+select the learned fields instead (see :func:`load_learned_fields`).
+
+.. note:: Learned fields only suit scripts that read the same fields as the
+   profiled run. Reading a field that wasn't learned raises an
+   `AttributeError`, unless it's populated first (for instance, by methods
+   using :func:`~FLIR.conservator.wrappers.type_proxy.requires_fields`).
+
+Fields fetched and read in worker processes are not sent back to the parent
+process.
+"""
+
+import atexit
+import json
+import logging
+import threading
+
+import sgqlc.types
+
+from FLIR.conservator.fields_request import FieldsRequest
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FieldUsageProfiler", "load_learned_fields"]
+
+# Recorded as a used path to mean every field under its prefix was used.
+_ALL = "*"
+
+
+class FieldUsageProfiler:
+    """
+    Records the fields fetched and read per query.
+    """
+
+    def __init__(self):
+        # Paths by query name.
+        self._fetched = {}
+        self._used = {}
+        self._lock = threading.Lock()
+
+    def track(self, query_name, value, wrapped):
+        """
+        Records the fields of `value` (a query result) as fetched by
+        `query_name`, and starts recording the fields read from `wrapped`,
+        the result wrapped by
+        :meth:`~FLIR.conservator.wrappers.type_proxy.TypeProxy.wrap`.
+        """
+        self.record_fetched(query_name, "", value)
+        if hasattr(wrapped, "_usage"):
+            wrapped._usage = (self, query_name, "")
+
+    def record_fetched(self, query_name, path, value):
+        """
+        Records `path` and its subfields in `value` (an unwrapped value) as
+        fetched by `query_name`.
+        """
+        paths = set()
+        _collect_paths(value, path, paths)
+        with self._lock:
+            self._fetched.setdefault(query_name, set()).update(paths)
+
+    def record_used(self, query_name, path):
+        """
+        Records that `path` of a result of `query_name` was read.
+        """
+        with self._lock:
+            self._used.setdefault(query_name, set()).add(path)
+
+    def record_all_used(self, query_name, prefix):
+        """
+        Records that every field under `prefix` (a path ending with ``.``, or
+        ``""`` for the whole result) of a result of `query_name` was read.
+        """
+        self.record_used(query_name, prefix + _ALL)
+
+    def used_fields(self, query_name):
+        """
+        Returns the sorted paths of the fields of `query_name` that were read.
+        Subfields of a field are listed instead of the field itself.
+        """
+        with self._lock:
+            fetched = set(self._fetched.get(query_name, ()))
+            used = set(self._used.get(query_name, ()))
+        paths = set()
+        for path in used:
+            if path.endswith(_ALL):
+                prefix = path[: -len(_ALL)]
+                paths.update(p for p in fetched if p.startswith(prefix))
+                if prefix:
+                    paths.add(prefix[:-1])
+            else:
+                paths.add(path)
+        return sorted(
+            path
+            for path in paths
+            if not any(other.startswith(path + ".") for other in paths)
+        )
+
+    def unused_fields(self, query_name):
+        """
+        Returns the sorted paths of the fields fetched by `query_name` that
+        were never read, and aren't suggested by :meth:`suggest`.
+        """
+        used = self.suggest(query_name).paths
+        with self._lock:
+            fetched = set(self._fetched.get(query_name, ()))
+        return sorted(
+            path
+            for path in fetched
+            if not any(
+                path == other
+                or path.startswith(other + ".")
+                or other.startswith(path + ".")
+                for other in used
+            )
+        )
+
+    def suggest(self, query_name):
+        """
+        Returns a :class:`~FLIR.conservator.fields_request.FieldsRequest` of
+        the fields of `query_name` that were read. The ``id`` of results is
+        always included, so they can still be populated.
+        """
+        paths = self.used_fields(query_name)
+        with self._lock:
+            fetched = self._fetched.get(query_name, ())
+            if "id" in fetched and "id" not in paths:
+                paths.append("id")
+        return FieldsRequest.create(sorted(paths))
+
+    def queries(self):
+        """Returns the sorted names of the queries that fetched fields."""
+        with self._lock:
+            return sorted(self._fetched)
+
+    def report(self):
+        """
+        Returns a `dict` by query name of the suggested ``fields`` (see
+        :meth:`suggest`) and the ``unused`` fields.
+        """
+        return {
+            name: {
+                "fields": sorted(self.suggest(name).paths),
+                "unused": self.unused_fields(name),
+            }
+            for name in self.queries()
+        }
+
+    def reset(self):
+        """Removes all recorded fields."""
+        with self._lock:
+            self._fetched.clear()
+            self._used.clear()
+
+    def to_json(self):
+        """Returns the report as a JSON string."""
+        return json.dumps(self.report(), indent=2, sort_keys=True)
+
+    def dump(self, path):
+        """
+        Writes the report to `path` as JSON, and logs a summary.
+        """
+        report = self.report()
+        for name, usage in report.items():
+            logger.info(
+                "Query '%s' fetched %s unused fields, suggested fields: %s",
+                name,
+                len(usage["unused"]),
+                ", ".join(usage["fields"]),
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    def dump_at_exit(self, path):
+        """
+        Writes the report to `path` (see :meth:`dump`) when the process exits.
+        """
+        atexit.register(self._dump_quietly, path)
+
+    def _dump_quietly(self, path):
+        try:
+            self.dump(path)
+        except OSError as e:
+            logger.warning("Couldn't write field usage to %s: %s", path, e)
+
+    def __getstate__(self):
+        # Locks can't be pickled. Worker processes record their own usage.
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+
+def load_learned_fields(path):
+    """
+    Returns a `dict` by query name of the fields suggested in a report written
+    by :meth:`FieldUsageProfiler.dump`. Returns an empty `dict` if `path`
+    doesn't exist.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+    except FileNotFoundError:
+        logger.warning("No learned fields at %s", path)
+        return {}
+    return {name: usage["fields"] for name, usage in report.items()}
+
+
+def _collect_paths(value, path, paths):
+    if isinstance(value, list):
+        for item in value:
+            _collect_paths(item, path, paths)
+        return
+    if path:
+        paths.add(path)
+    if isinstance(value, sgqlc.types.ContainerType):
+        prefix = path + "." if path else ""
+        for name in value:
+            _collect_paths(getattr(value, name), prefix + name, paths)
@@ -1,3 +1,6 @@
+import functools
+import types
+
 import sgqlc.types
 from FLIR.conservator.generated import schema
 
@@ -18,14 +21,20 @@ class FieldsManager:
         specific fields you need. The fields included here may change
         at any time.
 
-        See source for which fields are included.
+        See source for which fields are included. The fields of each type
+        are only worked out once, and then reused.
         """
-        # TODO: This behemoth of a method might be wise to split up...
-
-        type_ = selector.__field__.type
         # by default, include everything.
         # later calls to specific fields will reduce the scope
         selector()
+        _apply_plan(selector, _default_plan(selector.__field__.type))
+
+    @classmethod
+    def _select_default_fields(cls, selector):
+        # Called once per type with a _PlanRecorder, to record its defaults.
+        # TODO: This behemoth of a method might be wise to split up...
+
+        type_ = selector.__field__.type
 
         if issubclass(type_, sgqlc.types.Scalar):
             return
@@ -189,3 +198,46 @@ class FieldsManager:
             selector.flagged_frames()
             selector.full_res_mp4_url()
             selector.full_res_mp4_status()
+
+
+class _PlanRecorder:
+    """
+    Stands in for a selector of `type_`, recording the fields selected on it.
+    """
+
+    def __init__(self, type_):
+        self.__field__ = types.SimpleNamespace(type=type_)
+        self._called = False
+        self._children = {}
+
+    def __call__(self):
+        self._called = True
+
+    def __getattr__(self, name):
+        child = self._children.get(name, None)
+        if child is None:
+            child = _PlanRecorder(getattr(self.__field__.type, name).type)
+            self._children[name] = child
+        return child
+
+    def plan(self):
+        return tuple(
+            (name, child._called, child.plan())
+            for name, child in self._children.items()
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _default_plan(type_):
+    # A tuple of (field name, whether it's selected, plan of its fields).
+    recorder = _PlanRecorder(type_)
+    FieldsManager._select_default_fields(recorder)
+    return recorder.plan()
+
+
+def _apply_plan(selector, plan):
+    for name, called, child_plan in plan:
+        child = getattr(selector, name)
+        if called:
+            child()
+        _apply_plan(child, child_plan)
@@ -123,6 +123,32 @@ class FieldsRequest:
         """Excludes `field_paths` from the request."""
         self.excluded = self.excluded.union(field_paths)
 
+    def to_json(self):
+        """
+        Returns the request as a `dict` suitable for turning into JSON.
+        See :meth:`from_json`.
+        """
+        return {"paths": dict(self.paths), "excluded": sorted(self.excluded)}
+
+    @classmethod
+    def from_json(cls, json):
+        """
+        Returns a `FieldsRequest` from a `dict` returned by :meth:`to_json`.
+        """
+        fields_request = cls(dict(json["paths"]))
+        fields_request.exclude_fields(json["excluded"])
+        return fields_request
+
+    def cache_key(self):
+        """
+        Returns a hashable value that is equal for requests that select
+        the same fields.
+        """
+        paths = dict(self.paths)
+        for excluded in self.excluded:
+            paths[excluded] = False
+        return tuple(sorted((path, _freeze(value)) for path, value in paths.items()))
+
     def prepare_query(self, query_selector):
         # TODO: account for exclusions in default fields
         for excluded in self.excluded:
@@ -141,19 +167,20 @@ class FieldsRequest:
             if isinstance(value, dict):
                 field(**value)
 
-        # selectors that dont have any child nodes call them
-        # this is not a smart way of doing this
-        leaf_selectors = []
-        for path, selector in all_selectors:
-            # a selector is a leaf if no other selectors are
-            # included below it
-            for other_path, _ in all_selectors:
-                if is_subfield_of(path, other_path):
-                    # has a subfield selector--not a leaf
-                    break
-            else:
-                # no leaf found
-                leaf_selectors.append(selector)
+        # a selector is a leaf if no other selectors are included below it.
+        # build a trie of the paths, and check which paths have no children.
+        trie = {}
+        path_nodes = []
+        for path, _ in all_selectors:
+            node = trie
+            for subpath in path.split("."):
+                node = node.setdefault(subpath, {})
+            path_nodes.append(node)
+        leaf_selectors = [
+            selector
+            for (_, selector), node in zip(all_selectors, path_nodes)
+            if len(node) == 0
+        ]
 
         # if no fields are selected, select defaults on query
         if len(leaf_selectors) == 0:
@@ -174,6 +201,17 @@ class FieldsRequest:
         return obj
 
 
+def _freeze(value):
+    # Field arguments may be dicts or lists, which aren't hashable.
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return repr(value)
+
+
 def is_subfield_of(parent, subpath):
     # parent : videos.frames.annotations
     # subpath: videos.frames.annotations.bbox.w
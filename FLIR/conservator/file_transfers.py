@@ -1,11 +1,12 @@
-import multiprocessing
+import functools
 import os
 import logging
-import time
 
 import requests
-import tqdm
 
+from FLIR.conservator.http_session import get_thread_session
+from FLIR.conservator.retry import parse_retry_after
+from FLIR.conservator.transfer_engine import TransferEngine
 from FLIR.conservator.util import md5sum_file
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,11 @@ class ConservatorFileTransfers:
     These methods cannot be standalone utilities because in some deployments
     URLs will be relative to the base Conservator URL. Therefore, all download
     and upload operations need to have a reference to the Conservator instance.
+
+    Transfers are made with a session used only by the calling thread (see
+    :func:`~FLIR.conservator.http_session.get_thread_session`), so the
+    threads of :meth:`download_many` and :meth:`upload_many` each reuse
+    their own connections.
     """
 
     def __init__(self, conservator):
@@ -90,38 +96,81 @@ class ConservatorFileTransfers:
                 return True
         return self.download(url, local_path, no_meter=no_meter)
 
+    def _retry_policy(self, max_retries):
+        # max_retries has always counted attempts, not retries.
+        return self._conservator.retry_policy.with_options(
+            max_retries=max(0, max_retries - 1)
+        )
+
     def download(self, url, local_path, no_meter=False, max_retries=5):
         """
         Download the file from Conservator `url` to the `local_path`.
+
+        Failed requests (and connections dropped during the download) are retried
+        according to the Conservator's
+        :class:`~FLIR.conservator.retry.RetryPolicy`, making at most
+        `max_retries` attempts.
         """
         directory, file = os.path.split(local_path)
         os.makedirs(directory, exist_ok=True)
         url = self.full_url(url)
+        retry_policy = self._retry_policy(max_retries)
 
         logger.debug("Downloading %s from %s", file, url)
-        response = None
-        try:
-            retries = 0
-            while retries < max_retries:
-                response = requests.get(url, stream=True, allow_redirects=True)
+        # Bytes are charged to the limiter as they are received.
+        with self._conservator.transfer_limiter.slot():
+            with self._conservator.metrics.measure("transfer", "download") as m:
+                response, m.size = self._download(
+                    url, local_path, file, no_meter, retry_policy
+                )
+        return response
+
+    def _download(self, url, local_path, file, no_meter, retry_policy):
+        # Failed requests and failures during the download share one count of
+        # retries, so a download makes at most max_retries + 1 attempts.
+        session = get_thread_session()
+        retries = 0
+        retry_policy.record_request()
+        while True:
+            retry_after = None
+            response = None
+            try:
+                response = session.get(url, stream=True, allow_redirects=True)
                 if response.ok:
-                    break
+                    size = self._write_response(response, local_path, file, no_meter)
+                    return response, size
+            except (requests.exceptions.RequestException, OSError) as ex:
+                self._discard_download(response, local_path)
+                if not retry_policy.should_retry(retries, exception=ex):
+                    raise FileDownloadException(url) from ex
+                reason = f"{file}: {ex}"
+            except BaseException:  # BaseException includes KeyboardInterrupt
+                self._discard_download(response, local_path)
+                raise
+            else:
+                # Releases the connection back to the pool before retrying.
+                response.close()
                 logger.warning("Got status code %s", response.status_code)
-                if response.status_code == 502:
-                    retries += 1
-                    if retries < max_retries:
-                        logger.info("Bad Gateway error, retrying %s..", file)
-                        time.sleep(retries)  # Timeout increases per retry.
-                        continue
-                if response.status_code == 504:
-                    retries += 1
-                    if retries < max_retries:
-                        logger.info("Gateway timeout error, retrying  %s..", file)
-                        time.sleep(retries)  # Timeout increases per retry.
-                        continue
-                raise FileDownloadException(url)
-        except requests.exceptions.ConnectionError as conn_ex:
-            raise FileDownloadException(url) from conn_ex
+                if not retry_policy.should_retry(
+                    retries, status_code=response.status_code
+                ):
+                    raise FileDownloadException(url)
+                reason = f"{file}: status code {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            retries += 1
+            self._conservator.metrics.record_retry("transfer", "download")
+            retry_policy.sleep(retries, retry_after, reason=reason)
+
+    @staticmethod
+    def _discard_download(response, local_path):
+        if response is not None:
+            response.close()
+        # To avoid partial downloads:
+        if os.path.exists(local_path):
+            os.remove(local_path)
+
+    def _write_response(self, response, local_path, file, no_meter):
+        import tqdm
 
         size = int(response.headers.get("content-length", 0))
         progress = tqdm.tqdm(
@@ -130,20 +179,17 @@ class ConservatorFileTransfers:
         progress.set_description(f"Downloading {file}")
         chunk_size = 1024 * 1024
 
+        written = 0
         try:
             with open(local_path, "wb") as fd:
                 for chunk in response.iter_content(chunk_size=chunk_size):
+                    self._conservator.transfer_limiter.take(len(chunk))
                     progress.update(len(chunk))
                     fd.write(chunk)
-        except BaseException as base_ex:  # BaseException includes KeyboardInterrupt
-            # To avoid partial downloads:
-            if os.path.exists(local_path):
-                os.remove(local_path)
-
-            raise FileDownloadException(url) from base_ex
+                    written += len(chunk)
         finally:
             progress.close()
-        return response
+        return written
 
     def _do_download_request(self, download_request):
         try:
@@ -160,7 +206,7 @@ class ConservatorFileTransfers:
                 no_meter=True,
             )
         except FileDownloadException:
-            # This is called from multiprocessing context, errors should not be raised.
+            # This is called from worker threads, errors should not be raised.
             logger.warning(
                 "Encountered FileDownloadException with %s", download_request
             )
@@ -172,79 +218,93 @@ class ConservatorFileTransfers:
                 url=upload_request.url, local_path=upload_request.local_path
             )
         except FileUploadException:
-            # This is called from multiprocessing context, errors should not be raised.
+            # This is called from worker threads, errors should not be raised.
             logger.warning("Encountered FileUploadException with %s", upload_request)
             return False
 
     def upload(self, url, local_path, max_retries=5):
         """
         Upload the file at `local_path` to Conservator `url`.
+
+        Failed requests are retried according to the Conservator's
+        :class:`~FLIR.conservator.retry.RetryPolicy`, making at most
+        `max_retries` attempts.
         """
         url = self.full_url(url)
         path = os.path.abspath(local_path)
         logger.info("Uploading '%s'", path)
-        response = None
-        retries = 0
-        while retries < max_retries:
+
+        session = get_thread_session()
+
+        def put():
             with open(path, "rb") as f:
-                response = requests.put(url, f)
-            if response.ok:
-                break
-            logger.warning("Got status code %s", response.status_code)
-            if response.status_code == 502:
-                retries += 1
-                if retries < max_retries:
-                    logger.warning(
-                        "Bad Gateway error, retrying %s..", os.path.basename(path)
+                return session.put(url, f)
+
+        size = os.path.getsize(path)
+        metrics = self._conservator.metrics
+        with self._conservator.transfer_limiter.limit(size):
+            with metrics.measure("transfer", "upload") as measurement:
+                try:
+                    response = self._retry_policy(max_retries).send(
+                        put,
+                        description=os.path.basename(path),
+                        on_retry=functools.partial(
+                            metrics.record_retry, "transfer", "upload"
+                        ),
                     )
-                    time.sleep(retries)  # Timeout increases per retry.
-                    continue
-            if response.status_code == 504:
-                retries += 1
-                if retries < max_retries:
-                    logger.warning(
-                        "Gateway timeout error, retrying %s..", os.path.basename(path)
-                    )
-                    time.sleep(retries)  # Timeout increases per retry.
-                    continue
-            raise FileUploadException(f"url={url} response={response}))")
+                except requests.exceptions.RequestException as request_ex:
+                    raise FileUploadException(f"url={url}") from request_ex
+                if not response.ok:
+                    logger.warning("Got status code %s", response.status_code)
+                    raise FileUploadException(f"url={url} response={response}))")
+                measurement.size = size
         logger.info("Completed upload of '%s'", path)
         return response
 
     def download_many(self, downloads, process_count=None, no_meter=False):
         """
-        Download a list of `DownloadRequest` in parallel.
+        Download a list of `DownloadRequest` in parallel, on a
+        :class:`~FLIR.conservator.transfer_engine.TransferEngine`. Returns a
+        list with the result of each download, or `False` if it failed.
 
         :param downloads: The `list` of `DownloadRequest` to download.
         :param process_count: The number of concurrent downloads. If `None`, uses
-            ``os.cpu_count()``.
+            :data:`~FLIR.conservator.transfer_engine.DEFAULT_CONCURRENCY`.
         :param no_meter: If `True`, hide the progress bar.
         """
-        with multiprocessing.get_context("fork").Pool(process_count) as pool:
-            progress = tqdm.tqdm(
-                iterable=pool.imap(self._do_download_request, downloads),
-                desc="Downloading files",
-                total=len(downloads),
-                disable=no_meter,
-            )
-            # We need to consume the results as they're output to update the progress bar. We use list.
-            return list(progress)
+        return self._transfer_many(
+            self._do_download_request,
+            downloads,
+            process_count,
+            "Downloading files",
+            no_meter,
+        )
 
     def upload_many(self, uploads, process_count=None, no_meter=False):
         """
-        Upload a list of `UploadRequest` in parallel.
+        Upload a list of `UploadRequest` in parallel, on a
+        :class:`~FLIR.conservator.transfer_engine.TransferEngine`. Returns a
+        list with the response of each upload, or `False` if it failed.
 
-        :param uploads: The `list` of `UploadRequest` to download.
+        :param uploads: The `list` of `UploadRequest` to upload.
         :param process_count: The number of concurrent uploads. If `None`, uses
-            ``os.cpu_count()``.
+            :data:`~FLIR.conservator.transfer_engine.DEFAULT_CONCURRENCY`.
         :param no_meter: If `True`, hide the progress bar.
         """
-        with multiprocessing.get_context("fork").Pool(process_count) as pool:
-            progress = tqdm.tqdm(
-                iterable=pool.imap(self._do_upload_request, uploads),
-                desc="Uploading files",
-                total=len(uploads),
-                disable=no_meter,
-            )
-            # We need to consume the results as they're output to update the progress bar. We use list.
-            return list(progress)
+        return self._transfer_many(
+            self._do_upload_request, uploads, process_count, "Uploading files", no_meter
+        )
+
+    @staticmethod
+    def _transfer_many(transfer, requests_, concurrency, description, no_meter):
+        import tqdm
+
+        engine = TransferEngine(concurrency)
+        progress = tqdm.tqdm(
+            iterable=engine.map(transfer, requests_),
+            desc=description,
+            total=len(requests_),
+            disable=no_meter,
+        )
+        # We need to consume the results as they're output to update the progress bar. We use list.
+        return list(progress)
@@ -4,5 +4,9 @@ on a conservator instance.
 
 The rest of the conservator library is built on top of this autogenerated API.
 
+The types are generated in a temporary ``eager_schema.py``. The library
+imports ``schema.py``, built from it by ``build_lazy_schema.py``, which only
+defines types when they're first used.
+
 Run ``generate.sh`` to update these files.
 """
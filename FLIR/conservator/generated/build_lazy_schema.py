@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Builds ``schema.py`` from ``eager_schema.py``, the schema generated by SGQLC.
+
+Every type class is moved into a function that defines it, called by
+:class:`~FLIR.conservator.generated.lazy.LazySchema` when the type is first
+used. References to other types in fields and arguments become names (which
+SGQLC resolves when needed), so defining a type doesn't define the types of
+its fields.
+
+This is run by ``generate.sh``, which deletes ``eager_schema.py`` afterwards:
+only ``schema.py`` is committed. Another source and output can be given as
+arguments. Requires Python 3.9 or later::
+
+    python3 build_lazy_schema.py [SOURCE [OUTPUT]]
+"""
+
+import ast
+import os
+import sys
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(DIRECTORY, "eager_schema.py")
+OUTPUT_PATH = os.path.join(DIRECTORY, "schema.py")
+
+HEADER = '''"""
+The SGQLC types of the Conservator API.
+
+This module is built by ``build_lazy_schema.py`` from the schema generated by
+SGQLC, when running ``generate.sh``. Don't edit it. Types are defined when
+first used (see :mod:`FLIR.conservator.generated.lazy`), but can be imported
+as usual:
+
+>>> from FLIR.conservator.generated.schema import Query, Dataset
+"""
+'''
+
+FOOTER = """
+__getattr__ = schema.module_getattr
+__dir__ = schema.module_dir
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ isn't supported.
+    schema.define_all()
+"""
+
+
+class _TypeNamesToStrings(ast.NodeTransformer):
+    def __init__(self, type_names):
+        self.type_names = type_names
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load) and node.id in self.type_names:
+            return ast.copy_location(ast.Constant(node.id), node)
+        return node
+
+
+def is_schema_assignment(node):
+    # schema = sgqlc.types.Schema(), or schema.query_type = Query
+    target = node.targets[0]
+    if isinstance(target, ast.Attribute):
+        target = target.value
+    return isinstance(target, ast.Name) and target.id == "schema"
+
+
+def build(source):
+    """Returns the source of the lazy schema module built from `source`."""
+    tree = ast.parse(source)
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    type_names = {node.name for node in classes}
+
+    lines = [HEADER, "import sys", ""]
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            lines.append(ast.unparse(node))
+    lines.append("from FLIR.conservator.generated.lazy import LazySchema")
+    lines.append("")
+    lines.append("schema = LazySchema(globals())")
+    lines.append("")
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and not is_schema_assignment(node):
+            lines.append(ast.unparse(node))
+        elif not isinstance(node, (ast.Import, ast.Assign, ast.ClassDef)):
+            raise ValueError(f"Unexpected statement: {ast.unparse(node)}")
+
+    definitions = []
+    transformer = _TypeNamesToStrings(type_names)
+    for node in classes:
+        bases = [
+            base.id
+            for base in node.bases
+            if isinstance(base, ast.Name) and base.id in type_names
+        ]
+        node.body = [transformer.visit(statement) for statement in node.body]
+        function = ast.FunctionDef(
+            name=f"_define_{node.name}",
+            args=ast.arguments(
+                posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]
+            ),
+            body=[node, ast.Return(ast.Name(node.name, ast.Load()))],
+            decorator_list=[],
+        )
+        lines.append("")
+        lines.append(ast.unparse(ast.fix_missing_locations(function)))
+        definitions.append(
+            f"    {node.name!r}: (_define_{node.name}, {tuple(bases)!r}),"
+        )
+
+    lines.append("")
+    lines.append("schema.add_definitions(")
+    lines.append("    {")
+    lines.extend(definitions)
+    lines.append("    }")
+    lines.append(")")
+    lines.append(FOOTER)
+    return "\n".join(lines)
+
+
+def main(source_path=SOURCE_PATH, output_path=OUTPUT_PATH):
+    if sys.version_info < (3, 9):
+        sys.exit("Building the schema requires Python 3.9 or later")
+    with open(source_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(build(source))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
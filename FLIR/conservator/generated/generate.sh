@@ -14,7 +14,7 @@ python3 -m sgqlc.introspection \
   ${url} \
   ${SCRIPT_PATH}/schema.json
 
-sgqlc-codegen schema ${SCRIPT_PATH}/schema.json ${SCRIPT_PATH}/schema.py
+sgqlc-codegen schema ${SCRIPT_PATH}/schema.json ${SCRIPT_PATH}/eager_schema.py
 
 # HACK!!!
 # The built in sgqlc Date type doesn't work with Conservator.
@@ -22,17 +22,21 @@ sgqlc-codegen schema ${SCRIPT_PATH}/schema.json ${SCRIPT_PATH}/schema.py
 
 #For it to run on Macos
 if [[ "$OSTYPE" == "darwin"* ]]; then
-  gsed -i 's/sgqlc.types.datetime.Date/FLIR.conservator.generated.date.Date/g' ${SCRIPT_PATH}/schema.py
-  gsed -i 's/import sgqlc.types.datetime/import FLIR.conservator.generated.date/g' ${SCRIPT_PATH}/schema.py
+  gsed -i 's/sgqlc.types.datetime.Date/FLIR.conservator.generated.date.Date/g' ${SCRIPT_PATH}/eager_schema.py
+  gsed -i 's/import sgqlc.types.datetime/import FLIR.conservator.generated.date/g' ${SCRIPT_PATH}/eager_schema.py
 else
-  sed -i 's/sgqlc.types.datetime.Date/FLIR.conservator.generated.date.Date/g' ${SCRIPT_PATH}/schema.py
-  sed -i 's/import sgqlc.types.datetime/import FLIR.conservator.generated.date/g' ${SCRIPT_PATH}/schema.py
+  sed -i 's/sgqlc.types.datetime.Date/FLIR.conservator.generated.date.Date/g' ${SCRIPT_PATH}/eager_schema.py
+  sed -i 's/import sgqlc.types.datetime/import FLIR.conservator.generated.date/g' ${SCRIPT_PATH}/eager_schema.py
 fi
 
 md5sum ${SCRIPT_PATH}/schema.json | cut -d ' ' -f 1 | tee "$BASE_PATH/api_version.txt"
 rm ${SCRIPT_PATH}/schema.json
 
-# reformat generated python
+# build the lazily defined schema imported by the library, and reformat it
+python3 ${SCRIPT_PATH}/build_lazy_schema.py
 black ${SCRIPT_PATH}/schema.py
 
+# the eager schema is only needed to build it, and isn't committed
+rm ${SCRIPT_PATH}/eager_schema.py
+
 echo "Done."
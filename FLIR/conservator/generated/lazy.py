@@ -0,0 +1,105 @@
+"""
+Defines the types of the generated schema when they're first used.
+
+Defining all of the SGQLC types generated for the schema takes most of the
+time spent importing the library, but a script only uses a few of them. The
+``schema.py`` module is built from them by ``build_lazy_schema.py``: each type
+is defined by a function, which is called by :class:`LazySchema` the first
+time the type is used, as an attribute of the module, or while resolving
+the types of fields.
+"""
+
+import threading
+
+import sgqlc.types
+
+# Kinds of types, as in schema.type or schema.enum. Listing them
+# requires every type.
+_KINDS = ("scalar", "enum", "input", "interface", "type", "union")
+
+
+class LazySchema(sgqlc.types.Schema):
+    """
+    A :class:`sgqlc.types.Schema` with types that are defined when first
+    looked up.
+
+    The ``query_type`` and ``mutation_type`` are set when the ``Query``
+    and ``Mutation`` types are defined.
+
+    :param namespace: The module globals where types are stored once defined.
+    """
+
+    def __init__(self, namespace):
+        super().__init__()
+        self._namespace = namespace
+        self._definitions = {}
+        self._lock = threading.RLock()
+
+    def add_definitions(self, definitions):
+        """
+        Adds types that are defined when first used.
+
+        :param definitions: A `dict` by type name of ``(define, bases)``,
+            where `define` is a function creating and returning the type, and
+            `bases` are the names of the types it extends.
+        """
+        self._definitions.update(definitions)
+
+    def define(self, name):
+        """
+        Returns the type `name`, defining it if it isn't yet.
+        """
+        with self._lock:
+            definition = self._definitions.pop(name, None)
+            if definition is None:
+                return self._namespace[name]
+            define, bases = definition
+            for base in bases:
+                self.define(base)
+            type_ = define()
+            # Defined in a function, but should be found (and pickled)
+            # as a module attribute.
+            type_.__qualname__ = name
+            self._namespace[name] = type_
+            return type_
+
+    def define_all(self):
+        """Defines every type that isn't defined yet."""
+        with self._lock:
+            for name in list(self._definitions):
+                self.define(name)
+
+    def module_getattr(self, name):
+        """
+        Implements ``__getattr__`` of the module containing the schema.
+        """
+        if name in self._definitions:
+            return self.define(name)
+        module = self._namespace["__name__"]
+        raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+    def module_dir(self):
+        """
+        Implements ``__dir__`` of the module containing the schema.
+        """
+        return sorted(set(self._namespace) | set(self._definitions))
+
+    def __contains__(self, key):
+        return key in self._definitions or super().__contains__(key)
+
+    def __getitem__(self, key):
+        if key in self._definitions:
+            self.define(key)
+        return super().__getitem__(key)
+
+    def __getattr__(self, key):
+        definitions = self.__dict__.get("_definitions", {})
+        if key in definitions:
+            return self.define(key)
+        if key in _KINDS:
+            self.define_all()
+        return super().__getattr__(key)
+
+    def __iter__(self):
+        self.define_all()
+        return super().__iter__()
@@ -0,0 +1,90 @@
+"""
+Pooled HTTP sessions used for talking to Conservator.
+
+Opening a new connection for every request means paying for a TCP (and TLS)
+handshake each time. A :class:`requests.Session` keeps connections alive and
+reuses them, so all HTTP traffic should go through one of these sessions.
+
+A forked child process must not use the sockets pooled by its parent, or
+both would read and write the same TLS streams. In the child, every session
+made by :func:`create_session` gets new, empty pools (the session objects
+themselves are kept, so endpoints holding them keep working).
+"""
+
+import os
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+_default_session = None
+_thread_sessions = threading.local()
+# Pool sizes of the sessions made by create_session, to replace their pools
+# in forked children.
+_pool_sizes = weakref.WeakKeyDictionary()
+
+
+def create_session(pool_size=DEFAULT_POOL_SIZE):
+    """
+    Returns a new :class:`requests.Session` backed by a keep-alive
+    connection pool.
+
+    :param pool_size: The maximum number of connections kept open to a single
+        host. This is also used as the number of hosts with cached pools.
+    """
+    session = requests.Session()
+    set_pool_size(session, pool_size)
+    return session
+
+
+def set_pool_size(session, pool_size):
+    """
+    Replaces the connection pools of `session` with pools of `pool_size`.
+    Any idle connections in the old pools are dropped.
+    """
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    _pool_sizes[session] = pool_size
+
+
+def get_default_session():
+    """
+    Returns a shared session for requests made without a
+    :class:`~FLIR.conservator.connection.ConservatorConnection`, such as
+    validating a config.
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = create_session()
+    return _default_session
+
+
+def get_thread_session():
+    """
+    Returns a session used only by the current thread, for file transfers.
+
+    Each worker of a :class:`~FLIR.conservator.transfer_engine.TransferEngine`
+    keeps its connections alive from one transfer to the next, without
+    sharing a pool with other workers.
+    """
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = _thread_sessions.session = create_session()
+    return session
+
+
+def _reset_sessions():
+    # Pooled sockets must never be shared with a forked child.
+    global _default_session, _thread_sessions
+    _default_session = None
+    _thread_sessions = threading.local()
+    for session, pool_size in list(_pool_sizes.items()):
+        set_pool_size(session, pool_size)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions)
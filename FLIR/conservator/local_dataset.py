@@ -5,22 +5,20 @@
 # pylint: disable=broad-except
 # pylint: disable=too-many-lines
 import collections
-import multiprocessing
 import subprocess
 import os
 import json
 import shutil
 import logging
 import sys
-import time
 import functools
-import requests
-import jsonschema
-import tqdm
-from PIL import Image
 
+# jsonschema, tqdm and PIL are slow to import, so methods using them
+# import them when called.
 from FLIR.conservator.file_transfers import FileDownloadException
 from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.http_session import get_thread_session
+from FLIR.conservator.transfer_engine import TransferEngine
 from FLIR.conservator.util import md5sum_file, chunks
 from FLIR.conservator.wrappers.dataset import Dataset
 
@@ -110,6 +108,8 @@ class LocalDataset:
         """
         Validate jsonl files line-by-line
         """
+        import jsonschema
+
         jsonl_valid = True
 
         jsonl_files = [
@@ -578,18 +578,30 @@ class LocalDataset:
             "Content-type": "image/jpeg",
         }
         logger.info("Uploading '%s'.", path)
-        retry_count = 0
-        while retry_count < tries:
+
+        session = get_thread_session()
+
+        def put():
             with open(path, "rb") as data:
-                put_response = requests.put(url, data, headers=headers, timeout=5)
-            if put_response.status_code == 502:
-                retry_count += 1
-                if retry_count < tries:
-                    logger.info("Bad Gateway error, retrying %s..", filename)
-                    time.sleep(retry_count)  # Timeout increases per retry.
-                    continue
-            else:
-                break
+                return session.put(url, data, headers=headers, timeout=5)
+
+        # tries counts attempts, not retries.
+        retry_policy = self.conservator.retry_policy.with_options(
+            max_retries=max(0, tries - 1)
+        )
+        size = os.path.getsize(path)
+        metrics = self.conservator.metrics
+        with self.conservator.transfer_limiter.limit(size):
+            with metrics.measure("transfer", "upload") as measurement:
+                put_response = retry_policy.send(
+                    put,
+                    description=filename,
+                    on_retry=functools.partial(
+                        metrics.record_retry, "transfer", "upload"
+                    ),
+                )
+                measurement.size = size
+                measurement.error = put_response.status_code != 200
         logger.info("response status code is %s", put_response.status_code)
         logger.info(put_response)
         assert put_response.status_code == 200
@@ -714,6 +726,8 @@ class LocalDataset:
         This opens the `path` using PIL to verify it is a JPEG image,
         and get the dimensions.
         """
+        from PIL import Image
+
         try:
             image = Image.open(path)
         except IOError:
@@ -757,7 +771,7 @@ class LocalDataset:
                 os.remove(file_path)
 
     def _download_and_link(self, asset, max_retries=5):
-        # we use imap (istarmap doesn't exist) so we need to unpack arguments
+        # TransferEngine.map passes a single argument, so we unpack it
         try:
             download_path, url, paths_to_link, use_symlink = asset
             result = self.conservator.files.download(
@@ -813,8 +827,9 @@ class LocalDataset:
             `rawData/`.
         :param include_eight_bit: If `True`, download eight-bit images to
             `data/`.
-        :param process_count: Number of concurrent download processes. Passing
-            `None` will use `os.cpu_count()`.
+        :param process_count: Number of concurrent downloads, made by the
+            threads of a :class:`~FLIR.conservator.transfer_engine.TransferEngine`.
+            Passing `None` will use its ``DEFAULT_CONCURRENCY``.
         :param use_symlink: If `True`, use symbolic links instead of hardlinks
             when linking the cache and data.
         :param no_meter: If 'True', don't display file download progress
@@ -822,6 +837,8 @@ class LocalDataset:
         :param tries: Specify a retry limit when recovering from connection
             errors.
         """
+        import tqdm
+
         if include_eight_bit:
             os.makedirs(self.data_path, exist_ok=True)
 
@@ -884,29 +901,30 @@ class LocalDataset:
         logger.info("  Unique hashes: %s", len(hashes_required))
         logger.info("  Already downloaded: %s", cache_hits)
         logger.info("  Missing: %s", len(assets))
+        # Frames are only counted, so they're taken as they complete.
+        engine = TransferEngine(process_count, ordered=False)
         logger.info(
-            "Going to download %s new frames using %s processes.",
+            "Going to download %s new frames using %s threads.",
             len(assets),
-            process_count,
+            engine.concurrency,
         )
         current_assets = list(assets)
         failures = 0
         results = []
         progress_msg = "Downloading new frames"
         for attempt in range(tries):
-            with multiprocessing.get_context("fork").Pool(process_count) as pool:
-                download_method = functools.partial(
-                    LocalDataset._download_and_link, self, max_retries=tries
-                )
-                progress = tqdm.tqdm(
-                    iterable=pool.imap(download_method, current_assets),
-                    desc=progress_msg,
-                    total=len(current_assets),
-                    disable=no_meter,
-                )
-                # We need to consume the results as they're output to update
-                # the progress bar, we use list.
-                results += list(progress)
+            download_method = functools.partial(
+                self._download_and_link, max_retries=tries
+            )
+            progress = tqdm.tqdm(
+                iterable=engine.map(download_method, current_assets),
+                desc=progress_msg,
+                total=len(current_assets),
+                disable=no_meter,
+            )
+            # We need to consume the results as they're output to update
+            # the progress bar, we use list.
+            results += list(progress)
 
             # We double check everything downloaded, and retry failures.
             failures = 0
@@ -931,6 +949,10 @@ class LocalDataset:
             elif failures:
                 current_assets = retry_assets
                 progress_msg = "Retrying missing frames"
+                if attempt < tries - 1:
+                    self.conservator.retry_policy.sleep(
+                        attempt + 1, reason="missing frames"
+                    )
             else:
                 break
 
@@ -957,21 +979,23 @@ class LocalDataset:
             This is intended to account for the race condition when a dataset has
             just been created using an API call and its repository is not
             immediately available.
-        :param timeout: Delay this many seconds between retries.
+        :param timeout: Delay this many seconds before the first retry. Later
+            retries back off exponentially, as in the Conservator's
+            :class:`~FLIR.conservator.retry.RetryPolicy`.
         """
+        # pylint: disable=protected-access
+        retry_policy = dataset._conservator.retry_policy.with_options(
+            max_retries=max_retries, backoff_base=timeout, budget=None
+        )
         dataset.populate(["name", "repository.master"])
         # Newly created datasets may not have a fully populated repository
         # right away, so allow for retries until the queued commits
         # produced by the server have finished.
-        for _ in range(max_retries):
+        for retry in range(1, max_retries + 1):
             if dataset.has_field("repository.master"):
                 break
-            logger.info(
-                "Dataset %s not available for cloning, retry in %s seconds...",
-                dataset.name,
-                timeout,
-            )
-            time.sleep(timeout)
+            logger.info("Dataset %s not available for cloning yet", dataset.name)
+            retry_policy.sleep(retry, reason="waiting for repository")
             dataset.populate(["name", "repository.master"])
 
         if not dataset.has_field("repository.master"):
@@ -1010,10 +1034,10 @@ class LocalDataset:
         # this will cause the LocalDataset constructor to fail.
         # this re-pulls until index.json exists (or we timeout)
         index_path = os.path.join(clone_path, "index.json")
-        for _ in range(max_retries):
+        for retry in range(1, max_retries + 1):
             if os.path.exists(index_path):
                 break
-            time.sleep(timeout)
+            retry_policy.sleep(retry, reason="waiting for index.json")
             subprocess.call(["git", "pull"], cwd=clone_path)
         else:
             # raise RuntimeError for compatibility with dataset-toolkit (see #165)
@@ -1026,6 +1050,8 @@ class LocalDataset:
         Validates that the given ``index.json`` matches the expected JSON
         Schema.
         """
+        import jsonschema
+
         schema_json = self.conservator.query(Query.validation_schema)
         schema = json.loads(schema_json)
 
@@ -1,5 +1,6 @@
+from FLIR.conservator.batch import QueryBatch
 from FLIR.conservator.connection import ConservatorGraphQLServerError
-
+from FLIR.conservator.fields_request import FieldsRequest
 from FLIR.conservator.wrappers.queryable import InvalidIdException
 
 
@@ -16,6 +17,8 @@ class TypeManager:
     :param underlying_type: Underlying TypeProxy class to wrap.
     """
 
+    DEFAULT_CHUNK_SIZE = QueryBatch.DEFAULT_BATCH_SIZE
+
     def __init__(self, conservator, underlying_type):
         self._conservator = conservator
         self._underlying_type = underlying_type
@@ -48,6 +51,86 @@ class TypeManager:
 
         return self._underlying_type.from_id(self._conservator, id_)
 
+    def from_ids(self, ids, fields=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Creates new instances of `underlying_type` from `ids`, and populates
+        them with `fields` using as few requests as possible. See :meth:`populate_many`.
+        """
+        instances = [self.from_id(id_) for id_ in ids]
+        self.populate_many(instances, fields=fields, chunk_size=chunk_size)
+        return instances
+
+    def populate_many(self, instances, fields=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Populates `fields` on each of `instances`. This is equivalent to calling
+        :meth:`~FLIR.conservator.wrappers.queryable.QueryableType.populate` on
+        each instance, but uses as few requests as possible.
+
+        Types with a ``by_ids_query`` (such as
+        :class:`~FLIR.conservator.wrappers.frame.Frame`) are queried `chunk_size`
+        IDs at a time. Other types are queried by ID in batches of `chunk_size`
+        (see :meth:`~FLIR.conservator.connection.ConservatorConnection.batch`).
+
+        Every instance that can be populated is populated. Then, if any ID
+        wasn't found, an :class:`InvalidIdException` listing them is raised.
+        """
+        fields = FieldsRequest.create(fields)
+        instances_by_type = {}
+        for instance in instances:
+            instances_by_type.setdefault(type(instance), []).append(instance)
+
+        missing_ids = []
+        for type_, typed_instances in instances_by_type.items():
+            if type_.by_ids_query is not None:
+                populate_chunk = self._populate_by_ids
+            else:
+                populate_chunk = self._populate_by_batch
+            for start in range(0, len(typed_instances), chunk_size):
+                chunk = typed_instances[start : start + chunk_size]
+                missing_ids += populate_chunk(type_, chunk, fields)
+
+        if missing_ids:
+            raise InvalidIdException(f"Queries with ids {missing_ids} returned None")
+
+    def _populate_by_ids(self, type_, instances, fields):
+        ids = list(dict.fromkeys(instance.id for instance in instances))
+        results = self._conservator.query(type_.by_ids_query, ids=ids, fields=fields)
+        results_by_id = {result.id: result for result in results or [] if result}
+        missing_ids = []
+        for instance in instances:
+            result = results_by_id.get(instance.id, None)
+            if result is None:
+                missing_ids.append(instance.id)
+                continue
+            instance._merge(result)
+        return missing_ids
+
+    def _populate_by_batch(self, type_, instances, fields):
+        if type_.by_id_query is None:
+            # Custom _populate methods can't be batched.
+            missing_ids = []
+            for instance in instances:
+                try:
+                    instance.populate(fields)
+                except InvalidIdException:
+                    missing_ids.append(instance.id)
+            return missing_ids
+
+        calls = [(type_.by_id_query, {"id": i.id}, fields) for i in instances]
+        results = self._conservator.query_many(calls, batch_size=len(calls))
+        missing_ids = []
+        errors = []
+        for instance, result in zip(instances, results):
+            if result.error is not None:
+                errors.append(result.error)
+            elif result.value is None:
+                missing_ids.append(instance.id)
+            else:
+                instance._merge(result.value)
+        if errors:
+            raise errors[0]
+        return missing_ids
+
     def from_json(self, json):
         """
         Return a wrapped instance from a dictionary (usually produced by calling
@@ -0,0 +1,315 @@
+"""
+Records how long requests take, how much data they move, and how often they
+fail or are retried.
+
+Every :class:`~FLIR.conservator.connection.ConservatorConnection` has a
+:class:`Metrics` instance as ``metrics``. GraphQL requests are recorded under
+the ``"graphql"`` kind, by query name. File transfers are recorded under the
+``"transfer"`` kind, as ``"download"`` or ``"upload"``.
+
+>>> conservator.query(Query.project, id=project_id)
+>>> conservator.metrics.snapshot()["graphql"]["project"]
+{'requests': 1, 'errors': 0, 'retries': 0, 'seconds': 0.08, 'max_seconds': 0.08,
+ 'mean_seconds': 0.08, 'bytes': 154, 'bytes_per_second': 1925.0}
+
+Paginated queries with an adaptive page size (see
+:meth:`~FLIR.conservator.paginated_query.PaginatedQuery.adaptive_page_size`)
+record the sizes they choose under the ``"page_size"`` kind, by query name.
+
+Hooks added with :meth:`Metrics.add_hook` are called with a
+:class:`MetricsEvent` for every request and retry, for sending them elsewhere.
+
+If the config's ``metrics_path`` is set, a snapshot is written there when the
+process exits: as Prometheus text if the path ends with ``.prom``, and as JSON
+otherwise.
+
+Metrics recorded in worker processes (for instance, by
+:meth:`~FLIR.conservator.managers.media.MediaTypeManager.upload_many_to_collection`)
+are not sent back to the parent process. Transfers made by the worker threads
+of :meth:`~FLIR.conservator.file_transfers.ConservatorFileTransfers.download_many`
+are recorded as usual.
+"""
+
+import atexit
+import contextlib
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["Metrics", "MetricsEvent", "Measurement"]
+
+# (snapshot key, name, type, description)
+_PROMETHEUS_METRICS = [
+    ("requests", "conservator_requests_total", "counter", "Requests made"),
+    ("errors", "conservator_request_errors_total", "counter", "Failed requests"),
+    ("retries", "conservator_request_retries_total", "counter", "Retries"),
+    ("seconds", "conservator_request_seconds_total", "counter", "Time in requests"),
+    ("max_seconds", "conservator_request_seconds_max", "gauge", "Longest request"),
+    ("bytes", "conservator_request_bytes_total", "counter", "Bytes received or sent"),
+]
+
+_PROMETHEUS_PAGE_SIZE_METRICS = [
+    ("pages", "conservator_pages_total", "counter", "Pages requested"),
+    ("last", "conservator_page_size", "gauge", "Size of the last page"),
+]
+
+
+class MetricsEvent:
+    """
+    A single request or retry, as passed to hooks.
+
+    :param event: ``"request"``, ``"retry"`` or ``"page_size"``.
+    :param kind: ``"graphql"`` or ``"transfer"``.
+    :param name: The query name, or the kind of transfer.
+    :param seconds: How long the request took.
+    :param size: The number of bytes received or sent, if known. For
+        ``"page_size"`` events, the number of items requested.
+    :param error: `True` if the request failed.
+    """
+
+    def __init__(self, event, kind, name, seconds=0.0, size=0, error=False):
+        self.event = event
+        self.kind = kind
+        self.name = name
+        self.seconds = seconds
+        self.size = size
+        self.error = error
+
+    def __repr__(self):
+        return (
+            f"<MetricsEvent {self.event} {self.kind}:{self.name} "
+            f"seconds={self.seconds:.3f} size={self.size} error={self.error}>"
+        )
+
+
+class Measurement:
+    """
+    The size and outcome of a request measured by :meth:`Metrics.measure`.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.error = False
+
+
+class _Stats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "seconds": self.seconds,
+            "max_seconds": self.max_seconds,
+            "mean_seconds": self.seconds / self.requests if self.requests else 0.0,
+            "bytes": self.bytes,
+            "bytes_per_second": self.bytes / self.seconds if self.seconds else 0.0,
+        }
+
+
+class _PageSizeStats:
+    def __init__(self):
+        self.pages = 0
+        self.total = 0
+        self.last = 0
+        self.min = 0
+        self.max = 0
+
+    def add(self, size):
+        self.min = size if self.pages == 0 else min(self.min, size)
+        self.max = max(self.max, size)
+        self.pages += 1
+        self.total += size
+        self.last = size
+
+    def to_dict(self):
+        return {
+            "pages": self.pages,
+            "last": self.last,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.pages if self.pages else 0.0,
+        }
+
+
+class Metrics:
+    """
+    Aggregates request metrics by kind and name.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._page_sizes = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Calls `hook` with a :class:`MetricsEvent` for every request and retry.
+        Hooks are called on the thread making the request, so they should be fast.
+        """
+        # The list is replaced rather than changed, so threads calling hooks
+        # can loop over it without the lock.
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+
+    def remove_hook(self, hook):
+        """Stops calling `hook`."""
+        with self._lock:
+            hooks = list(self._hooks)
+            hooks.remove(hook)
+            self._hooks = hooks
+
+    def _get_stats(self, kind, name):
+        key = (kind, name)
+        stats = self._stats.get(key, None)
+        if stats is None:
+            stats = self._stats[key] = _Stats()
+        return stats
+
+    def _call_hooks(self, event):
+        # _hooks is replaced, never changed, by add_hook and remove_hook.
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Metrics hook %s failed", hook)
+
+    def record_request(self, kind, name, seconds, size=0, error=False):
+        """
+        Records a request that took `seconds`, and received or sent `size` bytes.
+        """
+        with self._lock:
+            stats = self._get_stats(kind, name)
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bytes += size or 0
+        if self._hooks:
+            self._call_hooks(MetricsEvent("request", kind, name, seconds, size, error))
+
+    @contextlib.contextmanager
+    def measure(self, kind, name):
+        """
+        A context manager recording the request made in its body. It yields a
+        :class:`Measurement`, whose ``size`` should be set to the number of bytes
+        received or sent. The request is an error if an exception is raised.
+        """
+        measurement = Measurement()
+        start = time.perf_counter()
+        try:
+            yield measurement
+        except BaseException:
+            measurement.error = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self.record_request(
+                kind, name, seconds, size=measurement.size, error=measurement.error
+            )
+
+    def record_retry(self, kind, name):
+        """Records that a request is being retried."""
+        with self._lock:
+            self._get_stats(kind, name).retries += 1
+        if self._hooks:
+            self._call_hooks(MetricsEvent("retry", kind, name))
+
+    def record_page_size(self, name, size):
+        """
+        Records that a paginated query `name` requested a page of `size` items.
+        """
+        with self._lock:
+            stats = self._page_sizes.get(name, None)
+            if stats is None:
+                stats = self._page_sizes[name] = _PageSizeStats()
+            stats.add(size)
+        if self._hooks:
+            self._call_hooks(MetricsEvent("page_size", "graphql", name, size=size))
+
+    def snapshot(self):
+        """
+        Returns the current metrics as a `dict` of kinds, each a `dict` of
+        names, each a `dict` of values.
+        """
+        with self._lock:
+            snapshot = {}
+            for (kind, name), stats in sorted(self._stats.items()):
+                snapshot.setdefault(kind, {})[name] = stats.to_dict()
+            for name, stats in sorted(self._page_sizes.items()):
+                snapshot.setdefault("page_size", {})[name] = stats.to_dict()
+            return snapshot
+
+    def reset(self):
+        """Removes all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+            self._page_sizes.clear()
+
+    def to_json(self):
+        """Returns the current metrics as a JSON string."""
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self):
+        """
+        Returns the current metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        page_sizes = snapshot.pop("page_size", {})
+        lines = []
+        for key, metric, metric_type, description in _PROMETHEUS_METRICS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for kind, names in snapshot.items():
+                for name, values in names.items():
+                    labels = f'kind="{_escape(kind)}",name="{_escape(name)}"'
+                    lines.append(f"{metric}{{{labels}}} {values[key]}")
+        for key, metric, metric_type, description in _PROMETHEUS_PAGE_SIZE_METRICS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for name, values in page_sizes.items():
+                lines.append(f'{metric}{{name="{_escape(name)}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """
+        Writes the current metrics to `path`: as Prometheus text if it ends
+        with ``.prom``, and as JSON otherwise.
+        """
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def dump_at_exit(self, path):
+        """
+        Writes the metrics to `path` (see :meth:`dump`) when the process exits.
+        """
+        atexit.register(self._dump_quietly, path)
+
+    def _dump_quietly(self, path):
+        try:
+            self.dump(path)
+        except OSError as e:
+            logger.warning("Couldn't write metrics to %s: %s", path, e)
+
+    def __getstate__(self):
+        # Locks can't be pickled. Worker processes record their own metrics.
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
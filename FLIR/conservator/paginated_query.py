@@ -1,6 +1,85 @@
+import collections
+import concurrent.futures
+import itertools
+import json
+import logging
+import math
 import operator
+import os
+import threading
+import time
+
+import requests
+import sgqlc.types
 
 from FLIR.conservator.fields_request import FieldsRequest
+from FLIR.conservator.generated import schema
+from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.util import write_json_atomically
+
+logger = logging.getLogger(__name__)
+
+# How much smaller than requested an adaptive page size may be made, so that
+# it divides the number of items already read.
+PAGE_SIZE_TOLERANCE = 0.25
+
+# Queries returning the number of results of a paginated query, by the
+# paginated query's name. They accept the same arguments, besides paging.
+COUNT_QUERIES = {
+    Query.collections.name: Query.collections_query_count,
+    Query.datasets.name: Query.datasets_query_count,
+    Query.projects.name: Query.projects_query_count,
+    Query.videos.name: Query.videos_query_count,
+    Query.images.name: Query.images_query_count,
+    Query.dataset_frames_only.name: Query.dataset_frames_query_count,
+}
+
+
+class AdaptivePageSize:
+    """
+    Chooses page sizes for a :class:`PaginatedQuery`, so that each request
+    takes about `target_seconds`, and returns about `target_bytes`.
+
+    Each page size is based on the previous one, scaled by how far its
+    request was from the targets. It changes by at most a factor of two
+    between pages.
+
+    :param target_seconds: The desired duration of each request.
+    :param target_bytes: The desired (decoded) size of each response. If
+        `None`, sizes are only based on duration.
+    :param min_size: The smallest page size to use.
+    :param max_size: The largest page size to use.
+    """
+
+    def __init__(
+        self, target_seconds=1.0, target_bytes=None, min_size=1, max_size=1000
+    ):
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def next_size(self, size, seconds, num_bytes=0):
+        """
+        Returns the size of the page after one of `size` items that took
+        `seconds`, and returned `num_bytes`.
+        """
+        ratio = 2.0
+        if seconds > 0:
+            ratio = min(ratio, self.target_seconds / seconds)
+        if self.target_bytes is not None and num_bytes > 0:
+            ratio = min(ratio, self.target_bytes / num_bytes)
+        ratio = max(0.5, ratio)
+        return self._clamp(int(size * ratio))
+
+    def shrink(self, size):
+        """
+        Returns the size to use after a page of `size` items failed.
+        """
+        return self._clamp(size // 2)
+
+    def _clamp(self, size):
+        return max(self.min_size, min(self.max_size, size))
 
 
 class PaginatedQuery:
@@ -33,6 +112,8 @@ class PaginatedQuery:
     :param total_unpack_field: If `reverse` is true, the query fields need to
         include a field containing the total number of entries.  Supply the
         field name to this parameter.
+    :param raw: If `True`, return results as `dict` (see :meth:`as_dicts`).
+    :param retain: If `False`, results aren't kept for iterating again (see :meth:`stream`).
     """
 
     def __init__(
@@ -46,6 +127,8 @@ class PaginatedQuery:
         unpack_field=None,
         reverse=False,
         total_unpack_field=None,
+        raw=False,
+        retain=True,
         **kwargs,
     ):
         # Unfortunately, query is a required arg, but for backwards-compatibility reasons can't be made required.
@@ -59,38 +142,68 @@ class PaginatedQuery:
         self.results = []
         self.reverse = reverse
         self._total_items = 0
+        self.total_unpack_field = total_unpack_field
+        self.raw = raw
+        self.retain = retain
+        self.kwargs = kwargs
         if reverse:
             if not total_unpack_field:
                 raise KeyError("total_unpack_field must be supplied if reverse is True")
             self.fields.include_field(total_unpack_field)
-            # Perform a single-entry query to collect the total count of items.
-            try:
-                results = self._conservator.query(
-                    query=self._query, fields=self.fields, page=1, limit=1, **kwargs
-                )
-            except AttributeError as exc:
-                if str(exc).endswith(total_unpack_field):
-                    raise KeyError(total_unpack_field)
-                raise
-            self._total_items = getattr(results, total_unpack_field)
-            if self._limit > self._total_items:
-                self._limit = self._total_items
-                # Don't confuse the API.
-                if self._limit == 0:
-                    self._limit = 1
-            # Set the page number to the last page of results.
-            if self._total_items > self._limit:
-                self._page = self._total_items // self._limit
-                if self._total_items % self._limit:
-                    # Count any partial page.
-                    self._page += 1
-                # Page numbers are 0-based.
-                self._page -= 1
+            self._load_total_items()
 
-        self.kwargs = kwargs
         self.started = False
         self.done = False
         self.filters = []
+        self._prefetch_pages = 0
+        self._prefetch_workers = 0
+        self._page_sizer = None
+        self._next_limit = None
+        # Items at the start of the next page that were already returned.
+        self._skip = 0
+        self._skipped = 0
+        self._checkpoint_path = None
+        self._checkpoint_every = 1
+        self._pages_since_checkpoint = 0
+
+    def _load_total_items(self):
+        # Perform a single-entry query to collect the total count of items.
+        try:
+            results = self._conservator.query(
+                query=self._query,
+                fields=self.fields,
+                raw=self.raw,
+                page=1,
+                limit=1,
+                **self.kwargs,
+            )
+        except AttributeError as exc:
+            if str(exc).endswith(self.total_unpack_field):
+                raise KeyError(self.total_unpack_field)
+            raise
+        self._set_total_items(self._get_field(results, self.total_unpack_field))
+
+    def _get_field(self, result, field_name):
+        if self.raw:
+            return result[field_name]
+        return getattr(result, field_name)
+
+    def _set_total_items(self, total_items):
+        # In reverse mode, iteration starts from the last page of results.
+        self._total_items = total_items
+        if self._limit > self._total_items:
+            self._limit = self._total_items
+            # Don't confuse the API.
+            if self._limit == 0:
+                self._limit = 1
+        # Set the page number to the last page of results.
+        if self._total_items > self._limit:
+            self._page = self._total_items // self._limit
+            if self._total_items % self._limit:
+                # Count any partial page.
+                self._page += 1
+            # Page numbers are 0-based.
+            self._page -= 1
 
     def filtered_by(self, func=operator.eq, **kwargs):
         """
@@ -109,9 +222,14 @@ class PaginatedQuery:
 
         def filter_(instance):
             for field_name, filter_value in kwargs.items():
-                if not hasattr(instance, field_name):
+                if self.raw:
+                    if field_name not in instance:
+                        return False
+                    field_value = instance[field_name]
+                elif not hasattr(instance, field_name):
                     return False
-                field_value = getattr(instance, field_name)
+                else:
+                    field_value = getattr(instance, field_name)
                 if not func(field_value, filter_value):
                     return False
             return True
@@ -167,6 +285,34 @@ class PaginatedQuery:
         self.fields = FieldsRequest.create(None)
         return self
 
+    def as_dicts(self):
+        """
+        Return results as plain `dict` of the decoded JSON, with snake_case
+        keys, instead of wrapped objects.
+
+        This skips building SGQLC objects and wrappers entirely, which makes
+        iterating over large results much faster. Custom scalars (such as dates)
+        are left as strings.
+        """
+        if self.started:
+            raise ConcurrentQueryModificationException()
+        self.raw = True
+        return self
+
+    def stream(self):
+        """
+        Don't keep results after they are returned, so that iterating over
+        many results uses a bounded amount of memory. Each page is released
+        as soon as its items have been returned.
+
+        The query can only be iterated once, and has no `len`. Use
+        :meth:`count` to count the results instead.
+        """
+        if self.started:
+            raise ConcurrentQueryModificationException()
+        self.retain = False
+        return self
+
     def page_size(self, page_size):
         """
         Set the number of items to request in each query.
@@ -179,6 +325,162 @@ class PaginatedQuery:
         self._limit = page_size
         return self
 
+    def prefetch(self, pages=4, workers=4):
+        """
+        Fetch up to `pages` upcoming pages in the background, using up to
+        `workers` threads, while the current page is being consumed. Results
+        are still returned in order.
+
+        Because the last page isn't known until it's returned, up to `pages`
+        requests past the end of the results may be made. In reverse mode, the
+        number of pages is known, so no extra requests are made.
+
+        This has no effect when iterating an
+        :class:`~FLIR.conservator.async_conservator.AsyncPaginatedQuery`.
+        """
+        if self.started:
+            raise ConcurrentQueryModificationException()
+        if self._page_sizer is not None:
+            raise ValueError("Can't prefetch pages with an adaptive page size")
+        self._prefetch_pages = pages
+        self._prefetch_workers = workers
+        return self
+
+    def adaptive_page_size(
+        self, target_seconds=1.0, target_bytes=None, min_size=1, max_size=1000
+    ):
+        """
+        Adjust the page size between pages, so that each request takes about
+        `target_seconds`, and (if given) returns about `target_bytes`. The
+        query's page size is used for the first page.
+
+        If a request times out or fails with a server error (5xx), the page is
+        requested again right away with half as many items, until `min_size` is
+        reached. Other errors are retried (or raised) as usual.
+
+        Pages are requested by number, so each page starts at a multiple of
+        its size. A new size is lowered by up to ``PAGE_SIZE_TOLERANCE`` to
+        divide the number of items already read. If no such size is close
+        enough, the next page starts at the nearest multiple of the new size
+        before them, and the items already read are skipped.
+
+        The sizes used are recorded in the connection's
+        :class:`~FLIR.conservator.metrics.Metrics` under the query's name.
+
+        This can't be used in reverse mode, or with :meth:`prefetch`, and has no
+        effect when iterating an
+        :class:`~FLIR.conservator.async_conservator.AsyncPaginatedQuery`.
+        See :class:`AdaptivePageSize` for the meaning of the parameters.
+        """
+        if self.started:
+            raise ConcurrentQueryModificationException()
+        if self.reverse:
+            raise ValueError("Adaptive page sizes can't be used in reverse mode")
+        if self._prefetch_pages > 0:
+            raise ValueError("Can't prefetch pages with an adaptive page size")
+        self._page_sizer = AdaptivePageSize(
+            target_seconds, target_bytes, min_size, max_size
+        )
+        return self
+
+    def cursor(self):
+        """
+        Returns the position of the query as a `dict` suitable for turning
+        into JSON, which can be passed to :meth:`resume`. It includes the
+        query, its arguments, fields, page size and direction, but not filters.
+
+        The position is that of the last page returned in full.
+        """
+        return {
+            "query": [self._query.container.__name__, self._query.name],
+            "kwargs": {
+                name: value
+                for name, value in self.kwargs.items()
+                if not _is_input(value)
+            },
+            # Input objects (such as filters) are saved as their JSON value.
+            "input_kwargs": {
+                name: self._query.args[name].type.__to_json_value__(value)
+                for name, value in self.kwargs.items()
+                if _is_input(value)
+            },
+            "fields": self.fields.to_json(),
+            "page": self._page,
+            "limit": self._limit,
+            "reverse": self.reverse,
+            "total_items": self._total_items,
+            "unpack_field": self.unpack_field,
+            "total_unpack_field": self.total_unpack_field,
+            "raw": self.raw,
+            "retain": self.retain,
+            "done": self.done,
+        }
+
+    def checkpoint(self, path, every=1):
+        """
+        Save the :meth:`cursor` to the file at `path` after every `every` pages,
+        and once all results are returned. If iteration is interrupted (for
+        instance, by a crash), pass `path` to :meth:`resume` to continue
+        after the last saved page.
+
+        Results of a page that was only partly returned are returned again
+        when resuming.
+        """
+        if self.started:
+            raise ConcurrentQueryModificationException()
+        self._checkpoint_path = path
+        self._checkpoint_every = every
+        return self
+
+    def _save_checkpoint(self):
+        if self._checkpoint_path is None:
+            return
+        self._pages_since_checkpoint += 1
+        if self.done or self._pages_since_checkpoint >= self._checkpoint_every:
+            write_json_atomically(self._checkpoint_path, self.cursor())
+            self._pages_since_checkpoint = 0
+
+    @classmethod
+    def resume(cls, conservator, state):
+        """
+        Returns a query continuing from `state`, which is either a :meth:`cursor`,
+        or the path of a file saved by :meth:`checkpoint`.
+
+        Filters, prefetching and checkpoints aren't saved, and must be set
+        again on the returned query:
+
+        >>> frames = PaginatedQuery.resume(conservator, "frames.json")
+        >>> for frame in frames.checkpoint("frames.json"):
+        ...     export(frame)
+        """
+        if isinstance(state, (str, os.PathLike)):
+            with open(state, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        container_name, query_name = state["query"]
+        query = getattr(getattr(schema, container_name), query_name)
+        kwargs = dict(state["kwargs"])
+        for name, value in state["input_kwargs"].items():
+            kwargs[name] = query.args[name].type(value)
+        paginated_query = cls(
+            conservator,
+            query=query,
+            fields=FieldsRequest.from_json(state["fields"]),
+            page_size=state["limit"],
+            unpack_field=state["unpack_field"],
+            reverse=state["reverse"],
+            total_unpack_field=state["total_unpack_field"],
+            raw=state["raw"],
+            retain=state["retain"],
+            **kwargs,
+        )
+        # In reverse mode, the restored page shouldn't be replaced by the
+        # last page when the total is loaded.
+        paginated_query._total_items = state.get("total_items", 0)
+        paginated_query._page = state["page"]
+        paginated_query._limit = state["limit"]
+        paginated_query.done = state["done"]
+        return paginated_query
+
     def first(self):
         """
         Returns the first result, or `None` if it doesn't exist.
@@ -198,28 +500,199 @@ class PaginatedQuery:
         finally:
             self._limit = original_limit
 
-    def _do_query(self, page, limit):
+    def count(self):
+        """
+        Returns the number of results, without fetching them if possible.
+
+        If the query has a matching count query (such as ``Query.videos_query_count``
+        for ``Query.videos``) or a ``total_count`` field, the server counts
+        the results. Otherwise, or if the query is filtered with
+        :meth:`filtered_by`, pages are requested and counted without being kept.
+        If the query has already been iterated, its results are counted.
+        """
+        if self.done and self.retain:
+            return len(self.results)
+        if self.filters:
+            return self._count_pages(self.fields)
+
+        count_query = COUNT_QUERIES.get(self._query.name, None)
+        if count_query is not None:
+            kwargs = {
+                name: value
+                for name, value in self.kwargs.items()
+                if name in count_query.args and name not in ("page", "limit")
+            }
+            return self._conservator.query(count_query, **kwargs)
+
+        total_field = self.total_unpack_field
+        if total_field is None and "total_count" in _field_names(self._query.type):
+            total_field = "total_count"
+        if total_field is not None:
+            result = self._conservator.query(
+                self._query, fields=total_field, page=0, limit=1, **self.kwargs
+            )
+            return getattr(result, total_field)
+
+        if self.unpack_field is not None:
+            return self._count_pages(f"{self.unpack_field}.id")
+        return self._count_pages("id")
+
+    def _count_pages(self, fields):
+        # Raw results are cheaper, but filters expect the configured type.
+        raw = self.raw or not self.filters
+        count = 0
+        page = 0
+        while True:
+            results = self._conservator.query(
+                query=self._query,
+                fields=fields,
+                raw=raw,
+                page=page,
+                limit=self._limit,
+                **self.kwargs,
+            )
+            if results is None:
+                return count
+            if self.unpack_field is not None:
+                if raw:
+                    results = results[self.unpack_field]
+                else:
+                    results = getattr(results, self.unpack_field)
+            count += sum(1 for item in results if self._passes_filters(item))
+            if len(results) < self._limit:
+                return count
+            page += 1
+
+    def _do_query(self, page, limit, retry_policy=None):
         results = self._conservator.query(
-            query=self._query, fields=self.fields, page=page, limit=limit, **self.kwargs
+            query=self._query,
+            fields=self.fields,
+            raw=self.raw,
+            page=page,
+            limit=limit,
+            retry_policy=retry_policy,
+            **self.kwargs,
         )
         return results
 
     def _next_page(self):
         self.started = True
         results = self._do_query(self._page, self._limit)
+        return self._unpack_page(results)
+
+    def _next_adaptive_page(self):
+        # Imported here to avoid a circular import.
+        from FLIR.conservator.connection import ConservatorGraphQLServerError
+
+        self.started = True
+        if self._next_limit is not None:
+            self._set_limit(self._next_limit)
+            self._next_limit = None
+
+        retry_policy = self._conservator.retry_policy
+        shrinkable = True
+        while True:
+            smaller = self._page_sizer.shrink(self._limit)
+            # A page that can shrink is tried once, without retries: if the
+            # server is overwhelmed, a smaller page is tried right away.
+            once = shrinkable and smaller < self._limit
+            measured = _ResponseSize(self._conservator.metrics)
+            start = time.perf_counter()
+            try:
+                with measured:
+                    results = self._do_query(
+                        self._page,
+                        self._limit,
+                        retry_policy.with_options(max_retries=0) if once else None,
+                    )
+            except ConservatorGraphQLServerError as error:
+                if not once or not _is_transient(error, retry_policy):
+                    raise
+                if _is_overwhelmed(error):
+                    logger.warning(
+                        "Page of %s items failed, retrying with %s",
+                        self._limit,
+                        smaller,
+                    )
+                    self._set_limit(smaller)
+                else:
+                    # Such as 429 Too Many Requests: retry as usual.
+                    shrinkable = False
+                continue
+            break
+        seconds = time.perf_counter() - start
+
+        self._conservator.metrics.record_page_size(self._query.name, self._limit)
+        # The size can't change until the caller checks for the last page.
+        self._next_limit = self._page_sizer.next_size(
+            self._limit, seconds, measured.size
+        )
+        return self._unpack_page(results)
+
+    def _set_limit(self, limit):
+        # Pages are numbered in multiples of the limit. Use the largest limit
+        # within the tolerance that divides the number of items read so far,
+        # or skip the items read at the start of the next page.
+        offset = self._page * self._limit + self._skip
+        smallest = max(
+            self._page_sizer.min_size, math.ceil(limit * (1 - PAGE_SIZE_TOLERANCE))
+        )
+        for size in range(limit, smallest - 1, -1):
+            if offset % size == 0:
+                limit = size
+                break
+        self._page, self._skip = divmod(offset, limit)
+        self._limit = limit
+
+    def _unpack_page(self, results):
         if not self.reverse:
             self._page += 1
         else:
             self._page -= 1
 
+        self._skipped, self._skip = self._skip, 0
         if results is None:
             return []
         if self.unpack_field is not None:
-            results = getattr(results, self.unpack_field)
+            results = self._get_field(results, self.unpack_field)
+        if self._skipped:
+            results = results[self._skipped :]
         if self.reverse and results:
             results = list(reversed(results))
         return results
 
+    def _pages(self):
+        # Yields the remaining pages, in order.
+        if self._page_sizer is not None:
+            while True:
+                yield self._next_adaptive_page()
+
+        if self._prefetch_pages <= 0:
+            while True:
+                yield self._next_page()
+
+        self.started = True
+        if self.reverse:
+            page_numbers = iter(range(self._page, -1, -1))
+        else:
+            page_numbers = itertools.count(self._page)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, self._prefetch_workers)
+        )
+        pending = collections.deque()
+        try:
+            while True:
+                for page in itertools.islice(
+                    page_numbers, self._prefetch_pages + 1 - len(pending)
+                ):
+                    future = executor.submit(self._do_query, page, self._limit)
+                    pending.append(future)
+                yield self._unpack_page(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def _passes_filters(self, instance):
         return all(filter_(instance) for filter_ in self.filters)
 
@@ -227,21 +700,103 @@ class PaginatedQuery:
         for item in self.results:
             yield item
 
-        while not self.done:
-            next_page = self._next_page()
-            for item in next_page:
+        if self.done:
+            return
+        pages = self._pages()
+        try:
+            for next_page in pages:
+                is_last_page = self._is_last_page(next_page)
+                yield from self._page_items(next_page)
+                if is_last_page:
+                    self.done = True
+                self._save_checkpoint()
+                if self.done:
+                    return
+        finally:
+            pages.close()
+
+    def _page_items(self, page):
+        # Yields the items of `page` that pass the filters.
+        if self.retain:
+            for item in page:
                 if self._passes_filters(item):
                     self.results.append(item)
                     yield item
-            if self.reverse and self._page < 0:
-                self.done = True
-                return
-            if not self.reverse and len(next_page) < self._limit:
-                self.done = True
-                return
+            return
+
+        # Remove each item from the page before returning it, so it can be
+        # freed as soon as the caller is done with it.
+        page.reverse()
+        while page:
+            item = page.pop()
+            if self._passes_filters(item):
+                yield item
+
+    def _is_last_page(self, page):
+        if self.reverse:
+            return self._page < 0
+        return len(page) < self._limit - self._skipped
 
     def __len__(self):
-        return len(list(self.__iter__()))
+        if not self.retain:
+            # list() also calls this, but ignores TypeError.
+            raise TypeError("A streaming query has no length, use count()")
+        if not self.done:
+            for _ in self:
+                pass
+        return len(self.results)
+
+
+def _is_input(value):
+    if isinstance(value, (list, tuple)):
+        return len(value) > 0 and all(_is_input(item) for item in value)
+    return isinstance(value, sgqlc.types.Input)
+
+
+def _field_names(type_):
+    return getattr(type_, "__field_names__", ())
+
+
+def _is_transient(error, retry_policy):
+    # Failures that retry_policy would retry.
+    error = error.errors[0]
+    status = error.get("status", None)
+    if status is not None:
+        return retry_policy.is_retryable_status(status)
+    exception = error.get("exception", None)
+    return exception is not None and retry_policy.is_retryable_exception(exception)
+
+
+def _is_overwhelmed(error):
+    # Timeouts and server errors, which a smaller page may avoid.
+    error = error.errors[0]
+    status = error.get("status", None)
+    if status is not None:
+        return 500 <= status < 600
+    return isinstance(error.get("exception", None), requests.exceptions.Timeout)
+
+
+class _ResponseSize:
+    """
+    Sums the sizes of the GraphQL responses received by this thread, while
+    used as a context manager.
+    """
+
+    def __init__(self, metrics):
+        self._metrics = metrics
+        self._thread = threading.get_ident()
+        self.size = 0
+
+    def __call__(self, event):
+        if event.event == "request" and threading.get_ident() == self._thread:
+            self.size += event.size or 0
+
+    def __enter__(self):
+        self._metrics.add_hook(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._metrics.remove_hook(self)
 
 
 class ConcurrentQueryModificationException(Exception):
@@ -0,0 +1,129 @@
+"""
+Limits how hard a client can push a Conservator server.
+
+A :class:`RateLimiter` combines a token bucket (limiting how many units, such
+as requests or bytes, are used per second) with a cap on how many operations
+are in flight at once. Every
+:class:`~FLIR.conservator.connection.ConservatorConnection` has two:
+``graphql_limiter`` for GraphQL requests, and ``transfer_limiter`` for the
+bytes of file uploads and downloads. Their limits are read from the
+:class:`~FLIR.conservator.config.Config`, so they can be set per config
+profile. By default, nothing is limited.
+
+Limiter state lives in shared memory. Worker threads (such as those of
+:meth:`~FLIR.conservator.file_transfers.ConservatorFileTransfers.download_many`)
+and worker processes forked by methods like
+:meth:`~FLIR.conservator.managers.media.MediaTypeManager.upload_many_to_collection`
+share the limits of the parent's connection, so adding workers doesn't add load.
+"""
+
+import contextlib
+import multiprocessing
+import time
+import uuid
+import weakref
+
+__all__ = ["RateLimiter"]
+
+# Limiters by key. Forked processes inherit this, so an unpickled limiter
+# can find the shared state created by its parent.
+_limiters = weakref.WeakValueDictionary()
+
+
+def _restore_limiter(key, rate, burst, max_in_flight):
+    limiter = _limiters.get(key, None)
+    if limiter is None:
+        # Not a descendant of the process that created the limiter, so
+        # its state can't be shared. Enforce the same limits locally.
+        limiter = RateLimiter(rate, burst, max_in_flight)
+    return limiter
+
+
+class RateLimiter:
+    """
+    A token bucket and an in-flight limit, shared by forked processes.
+
+    :param rate: The number of units allowed per second. If ``0``, the rate
+        isn't limited.
+    :param burst: The number of units that can be used at once, after being idle.
+        Defaults to one second's worth (and at least one unit).
+    :param max_in_flight: The maximum number of concurrent operations. If ``0``,
+        concurrency isn't limited.
+    """
+
+    def __init__(self, rate=0, burst=None, max_in_flight=0):
+        if burst is None:
+            burst = max(1, rate)
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self._key = uuid.uuid4().hex
+
+        context = multiprocessing.get_context("fork")
+        self._lock = None
+        if rate > 0:
+            self._lock = context.Lock()
+            self._tokens = context.RawValue("d", burst)
+            self._updated = context.RawValue("d", time.monotonic())
+        self._slots = None
+        if max_in_flight > 0:
+            self._slots = context.BoundedSemaphore(max_in_flight)
+        _limiters[self._key] = self
+
+    def take(self, amount=1):
+        """
+        Waits until `amount` units can be used. A large `amount` is allowed
+        to exceed the bucket, but later callers wait until it's paid back.
+        """
+        if self._lock is None:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = max(0.0, now - self._updated.value)
+                tokens = min(self.burst, self._tokens.value + elapsed * self.rate)
+                self._updated.value = now
+                if tokens >= 0:
+                    self._tokens.value = tokens - amount
+                    return
+                self._tokens.value = tokens
+                wait = -tokens / self.rate
+            time.sleep(wait)
+
+    @contextlib.contextmanager
+    def limit(self, amount=1):
+        """
+        A context manager holding one in-flight slot, after taking
+        `amount` units.
+        """
+        with self.slot():
+            self.take(amount)
+            yield
+
+    @contextlib.contextmanager
+    def slot(self):
+        """
+        A context manager holding one in-flight slot, without taking units.
+        Use :meth:`take` to charge units while the slot is held, for instance
+        for every chunk of a download.
+        """
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            yield
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def __reduce__(self):
+        # Multiprocessing primitives can only be shared by inheritance.
+        return (
+            _restore_limiter,
+            (self._key, self.rate, self.burst, self.max_in_flight),
+        )
+
+    def __repr__(self):
+        return (
+            f"<RateLimiter rate={self.rate} burst={self.burst} "
+            f"max_in_flight={self.max_in_flight}>"
+        )
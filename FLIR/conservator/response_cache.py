@@ -0,0 +1,307 @@
+"""
+Caches the responses of queries whose results rarely change.
+
+Some queries are repeated often, but their results seldom change: the current
+user, the dataset validation schema, collection paths, and git trees and
+commits. A :class:`ResponseCache` on
+:class:`~FLIR.conservator.connection.ConservatorConnection` returns a stored
+response for these queries instead of asking the server again.
+
+Only queries with a :class:`CachePolicy` are cached. Running any mutation
+removes the entries of queries that may be affected by it, and entries expire
+after the policy's ``ttl``. Results addressed by content (such as a git tree
+requested by its hash) can never change, and are kept permanently.
+
+Responses are kept in memory by default. To share them between processes and
+sessions, use a :class:`DiskCacheBackend`:
+
+>>> conservator.response_cache = ResponseCache(backend=DiskCacheBackend())
+
+To disable caching, set ``conservator.response_cache = None``.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from FLIR.conservator.generated.schema import Query
+
+__all__ = [
+    "CachePolicy",
+    "ResponseCache",
+    "MemoryCacheBackend",
+    "DiskCacheBackend",
+]
+
+_CONTENT_HASH = re.compile(r"[0-9a-f]{40}([0-9a-f]{24})?")
+
+# Keys of entries that are removed when a mutation runs start with this prefix.
+_MUTABLE_PREFIX = "m"
+_PERMANENT_PREFIX = "p"
+
+
+class CachePolicy:
+    """
+    Describes how the responses of a query are cached.
+
+    :param ttl: The number of seconds a response is kept. If `None`, it is kept
+        until it is invalidated. If ``0``, it isn't cached.
+    :param invalidate_on_mutation: If `True`, the response is removed whenever a
+        mutation is run.
+    :param content_addressed_args: The names of arguments that may be content
+        hashes. If all of them are hashes, the response can never change, and is
+        cached permanently (regardless of `ttl` and `invalidate_on_mutation`).
+    """
+
+    def __init__(
+        self, ttl=None, invalidate_on_mutation=True, content_addressed_args=()
+    ):
+        self.ttl = ttl
+        self.invalidate_on_mutation = invalidate_on_mutation
+        self.content_addressed_args = tuple(content_addressed_args)
+
+    def is_permanent(self, kwargs):
+        """
+        Returns `True` if the response to a query with `kwargs` is addressed by content.
+        """
+        if not self.content_addressed_args:
+            return False
+        return all(
+            isinstance(kwargs.get(name, None), str)
+            and _CONTENT_HASH.fullmatch(kwargs[name]) is not None
+            for name in self.content_addressed_args
+        )
+
+    def __repr__(self):
+        return (
+            f"<CachePolicy ttl={self.ttl} "
+            f"invalidate_on_mutation={self.invalidate_on_mutation} "
+            f"content_addressed_args={self.content_addressed_args}>"
+        )
+
+
+def default_policies():
+    """
+    Returns the policies used by a new :class:`ResponseCache`, by query name.
+    """
+    return {
+        Query.user.name: CachePolicy(ttl=600),
+        Query.validation_schema.name: CachePolicy(
+            ttl=3600, invalidate_on_mutation=False
+        ),
+        Query.collection_by_path.name: CachePolicy(ttl=60),
+        # HEAD and other refs move, so only hashes are cached.
+        Query.git_commit.name: CachePolicy(ttl=0, content_addressed_args=["commit_id"]),
+        Query.git_tree.name: CachePolicy(ttl=0, content_addressed_args=["tree_id"]),
+    }
+
+
+class MemoryCacheBackend:
+    """
+    Keeps cache entries in memory, dropping the least recently used entries
+    when there are more than `max_size`.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key, None)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __getstate__(self):
+        # Locks can't be pickled. Worker processes start with an empty cache.
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_size"])
+
+
+class DiskCacheBackend:
+    """
+    Keeps cache entries as files in the `path` directory, so they can be
+    shared between processes and sessions.
+    """
+
+    DEFAULT_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "conservator-cli", "responses"
+    )
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._entry_path(key), "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, key, value):
+        os.makedirs(self.path, exist_ok=True)
+        # Write to a temporary file first, so readers never see partial entries.
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(value)
+        os.replace(temp_path, self._entry_path(key))
+
+    def delete(self, key):
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def keys(self):
+        if not os.path.isdir(self.path):
+            return []
+        return [
+            filename[: -len(".json")]
+            for filename in os.listdir(self.path)
+            if filename.endswith(".json")
+        ]
+
+    def clear(self):
+        for key in self.keys():
+            self.delete(key)
+
+
+class ResponseCache:
+    """
+    A read-through cache of query responses.
+
+    The number of cache hits and misses are counted in ``hits`` and ``misses``.
+
+    :param backend: Where entries are stored. Defaults to a new
+        :class:`MemoryCacheBackend`.
+    :param policies: A `dict` of :class:`CachePolicy` by query name. Defaults to
+        :func:`default_policies`.
+    """
+
+    def __init__(self, backend=None, policies=None):
+        if backend is None:
+            backend = MemoryCacheBackend()
+        if policies is None:
+            policies = default_policies()
+        self.backend = backend
+        self.policies = policies
+        self.hits = 0
+        self.misses = 0
+
+    def set_policy(self, query, policy):
+        """
+        Caches responses to `query` according to `policy`.
+        """
+        self.policies[query.name] = policy
+
+    def remove_policy(self, query):
+        """
+        Stops caching responses to `query`.
+        """
+        self.policies.pop(query.name, None)
+
+    def policy_for(self, query, kwargs):
+        """
+        Returns the :class:`CachePolicy` for running `query` with `kwargs`, or
+        `None` if the response shouldn't be cached.
+        """
+        if query.container is not Query:
+            return None
+        policy = self.policies.get(query.name, None)
+        if policy is None:
+            return None
+        if policy.is_permanent(kwargs):
+            return CachePolicy(ttl=None, invalidate_on_mutation=False)
+        if policy.ttl == 0:
+            return None
+        return policy
+
+    @staticmethod
+    def key(config, gql, variables, policy):
+        """
+        Returns the key of the response to `gql` with `variables`. Keys
+        depend on the server and credentials in `config`, so entries
+        are never shared between users.
+        """
+        data = json.dumps(
+            [config.url, config.key, gql, variables], sort_keys=True, default=str
+        )
+        prefix = _MUTABLE_PREFIX if policy.invalidate_on_mutation else _PERMANENT_PREFIX
+        return prefix + hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the stored response for `key`, or `None` if it's missing
+        or expired.
+        """
+        value = self.backend.get(key)
+        if value is not None:
+            entry = json.loads(value)
+            expires = entry["expires"]
+            if expires is None or expires > time.time():
+                self.hits += 1
+                return entry["response"]
+            self.backend.delete(key)
+        self.misses += 1
+        return None
+
+    def set(self, key, response, policy):
+        """
+        Stores `response` under `key`, according to `policy`.
+        """
+        expires = None if policy.ttl is None else time.time() + policy.ttl
+        entry = {"expires": expires, "response": response}
+        self.backend.set(key, json.dumps(entry))
+
+    def invalidate(self):
+        """
+        Removes every entry that may be affected by a mutation.
+        """
+        for key in self.backend.keys():
+            if key.startswith(_MUTABLE_PREFIX):
+                self.backend.delete(key)
+
+    def clear(self):
+        """Removes every entry, and resets the counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns a `dict` with the number of ``hits`` and ``misses``.
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,246 @@
+"""
+A single policy for retrying failed requests, shared by GraphQL queries and
+file transfers.
+
+Retries wait with exponential backoff and jitter, so that many clients failing
+at the same time spread their retries out instead of hitting the server again
+together. A server's ``Retry-After`` header is always honored. Only transient
+failures are retried: connection errors and resets, timeouts, and responses
+with a status in :attr:`RetryPolicy.DEFAULT_RETRY_STATUS_CODES` (such as
+``429 Too Many Requests`` or ``503 Service Unavailable``).
+
+An optional :class:`RetryBudget` limits retries to a fraction of all
+requests, so a failing server isn't flooded with retries. Connections use
+one if their config's ``retry_budget`` is set.
+
+Every :class:`~FLIR.conservator.connection.ConservatorConnection` has a
+``retry_policy``, created from its config's ``max_retries``, that can be
+replaced:
+
+>>> conservator.retry_policy = RetryPolicy(max_retries=10, backoff_max=120)
+"""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["RetryPolicy", "RetryBudget", "parse_retry_after"]
+
+
+def parse_retry_after(value):
+    """
+    Returns the number of seconds to wait from a ``Retry-After`` header `value`,
+    which may be a number of seconds or an HTTP date. Returns `None` if the
+    value is missing or invalid.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date is None:
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of requests.
+
+    Every request adds `ratio` to the budget, and every retry spends one from it.
+    The budget starts (and is capped) at `min_retries`, allowing short bursts of
+    retries even when few requests are made.
+
+    :param ratio: The number of retries allowed per request.
+    :param min_retries: The number of retries that can be made at once.
+    """
+
+    def __init__(self, ratio=0.2, min_retries=10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Records a request."""
+        with self._lock:
+            self._balance = min(self.min_retries, self._balance + self.ratio)
+
+    def withdraw(self):
+        """
+        Returns `True` and records a retry if the budget allows it.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    def __getstate__(self):
+        # Locks can't be pickled.
+        return {"ratio": self.ratio, "min_retries": self.min_retries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class RetryPolicy:
+    """
+    Decides whether, and how long after, a failed request is retried.
+
+    The delay before retry ``n`` is ``backoff_base * 2 ** (n - 1)`` seconds,
+    capped at `backoff_max`. With `jitter`, a random delay between half and
+    all of that is used instead.
+
+    :param max_retries: The maximum number of retries for a single request.
+    :param backoff_base: The delay before the first retry, in seconds.
+    :param backoff_max: The maximum delay between retries, in seconds. This
+        doesn't limit delays requested by ``Retry-After``.
+    :param jitter: If `True`, randomize delays.
+    :param retry_status_codes: HTTP status codes that are retried.
+    :param budget: A :class:`RetryBudget`, or `None` for no limit.
+    """
+
+    DEFAULT_RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+    RETRY_EXCEPTIONS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+        ConnectionError,
+    )
+
+    def __init__(
+        self,
+        max_retries=5,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        jitter=True,
+        retry_status_codes=DEFAULT_RETRY_STATUS_CODES,
+        budget=None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.budget = budget
+
+    def with_options(self, **kwargs):
+        """
+        Returns a copy of this policy, with some parameters replaced. The budget
+        is shared with the copy unless a new one is given.
+        """
+        options = {
+            "max_retries": self.max_retries,
+            "backoff_base": self.backoff_base,
+            "backoff_max": self.backoff_max,
+            "jitter": self.jitter,
+            "retry_status_codes": self.retry_status_codes,
+            "budget": self.budget,
+        }
+        options.update(kwargs)
+        return RetryPolicy(**options)
+
+    def is_retryable_status(self, status_code):
+        return status_code in self.retry_status_codes
+
+    def is_retryable_exception(self, exception):
+        return isinstance(exception, self.RETRY_EXCEPTIONS)
+
+    def record_request(self):
+        """
+        Records that a request is being made. This refills the budget.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def should_retry(self, retries, status_code=None, exception=None):
+        """
+        Returns `True` if a request that failed with `status_code` or `exception`
+        should be retried, after `retries` previous retries.
+        """
+        if retries >= self.max_retries:
+            return False
+        if exception is not None and not self.is_retryable_exception(exception):
+            return False
+        if status_code is not None and not self.is_retryable_status(status_code):
+            return False
+        if self.budget is not None and not self.budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying")
+            return False
+        return True
+
+    def get_delay(self, retry, retry_after=None):
+        """
+        Returns the number of seconds to wait before retry number `retry`
+        (starting at 1). If the server sent a ``Retry-After`` delay, the
+        result is at least `retry_after`.
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def sleep(self, retry, retry_after=None, reason=""):
+        """
+        Waits before retry number `retry`.
+        """
+        delay = self.get_delay(retry, retry_after)
+        logger.warning(
+            "Retry #%s in %.1f seconds%s",
+            retry,
+            delay,
+            f" ({reason})" if reason else "",
+        )
+        time.sleep(delay)
+
+    def send(self, request, description="", on_retry=None):
+        """
+        Calls `request` (which returns a :class:`requests.Response`) until it
+        succeeds, or fails in a way that shouldn't be retried. If given,
+        `on_retry` is called before every retry.
+
+        Returns the last response. If the last attempt raised an exception,
+        it is raised.
+        """
+        self.record_request()
+        retries = 0
+        while True:
+            try:
+                response = request()
+            except requests.exceptions.RequestException as e:
+                if not self.should_retry(retries, exception=e):
+                    raise
+                retries += 1
+                if on_retry is not None:
+                    on_retry()
+                self.sleep(retries, reason=f"{description}: {e}")
+                continue
+
+            if response.ok or not self.should_retry(
+                retries, status_code=response.status_code
+            ):
+                return response
+            retries += 1
+            if on_retry is not None:
+                on_retry()
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.sleep(
+                retries,
+                retry_after,
+                reason=f"{description}: status code {response.status_code}",
+            )
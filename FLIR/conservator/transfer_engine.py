@@ -0,0 +1,93 @@
+"""
+Runs file transfers concurrently on a pool of threads.
+
+Transfers spend their time waiting on the network, so threads run them as fast
+as processes would. Unlike a forked process pool, a thread pool doesn't pickle
+the :class:`~FLIR.conservator.conservator.Conservator` for every task, and is
+safe where forking isn't: in a process running other threads (or CUDA), or
+where only the ``spawn`` start method is available, as on macOS and Windows.
+
+Each worker thread makes its requests with its own pooled
+:class:`requests.Session` (see
+:func:`~FLIR.conservator.http_session.get_thread_session`), so connections
+are reused from one transfer to the next.
+
+>>> engine = TransferEngine(concurrency=8, ordered=False)
+>>> def upload(path):
+...     return conservator.files.upload(url_for(path), path)
+>>> for response in engine.map(upload, paths):
+...     print(response.status_code)
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+
+__all__ = ["TransferEngine", "DEFAULT_CONCURRENCY"]
+
+# The default of ThreadPoolExecutor, meant for I/O bound work.
+DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+
+
+class TransferEngine:
+    """
+    Calls a function for every item on a pool of worker threads.
+
+    :param concurrency: The number of worker threads. If `None`, uses
+        ``DEFAULT_CONCURRENCY``.
+    :param ordered: If `True`, results are returned in the order of their
+        items. Otherwise, they are returned as soon as they complete.
+    """
+
+    def __init__(self, concurrency=None, ordered=True):
+        if concurrency is None:
+            concurrency = DEFAULT_CONCURRENCY
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.ordered = ordered
+
+    def map(self, function, items):
+        """
+        Yields ``function(item)`` for every item in `items`.
+
+        Items are only submitted a few at a time, so `items` can be a long
+        generator. If `function` raises an exception, it's raised here and
+        pending items are cancelled. Closing the generator early also cancels
+        them. Either way, transfers already running are finished first.
+        """
+        items = iter(items)
+        with concurrent.futures.ThreadPoolExecutor(
+            self.concurrency, thread_name_prefix="conservator-transfer"
+        ) as executor:
+            # Keeping a few items queued means workers never wait for this
+            # thread to submit more.
+            pending = collections.deque(
+                executor.submit(function, item)
+                for item in itertools.islice(items, 2 * self.concurrency)
+            )
+            try:
+                while pending:
+                    for future in self._next_done(pending):
+                        result = future.result()
+                        for item in itertools.islice(items, 1):
+                            pending.append(executor.submit(function, item))
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _next_done(self, pending):
+        # Removes and returns the next completed futures.
+        if self.ordered:
+            return [pending.popleft()]
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            pending.remove(future)
+        return done
+
+    def __repr__(self):
+        return f"<TransferEngine concurrency={self.concurrency} ordered={self.ordered}>"
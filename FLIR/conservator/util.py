@@ -1,10 +1,17 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-function-docstring
+import functools
 import hashlib
+import json
+import keyword
 import logging
 import os
 import platform
+import re
 import sys
+import tempfile
+import threading
+import time
 
 from pathlib import Path
 from itertools import zip_longest
@@ -49,6 +56,36 @@ def to_clean_string(o, first=True):
     return s
 
 
+@functools.lru_cache(maxsize=None)
+def to_snake_case(name):
+    """
+    Converts a GraphQL field name (like ``datasetFrames``) to the name SGQLC
+    uses for it in Python (``dataset_frames``).
+    """
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def to_snake_case_keys(value):
+    """
+    Returns a copy of the decoded JSON `value`, with every ``dict`` key
+    converted by :func:`to_snake_case`.
+    """
+    if isinstance(value, dict):
+        return {to_snake_case(k): to_snake_case_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_snake_case_keys(item) for item in value]
+    return value
+
+
+def all_subclasses(cls):
+    return set(cls.__subclasses__()).union(
+        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
+    )
+
+
 def md5sum_file(path, block_size=1024 * 1024):
     hasher = hashlib.md5()
     with open(path, "rb") as fp:
@@ -90,16 +127,113 @@ def chunks(list_to_chunk, chunk_size):
     return zip_longest(*[iter(list_to_chunk)] * chunk_size, fillvalue=None)
 
 
-def get_conservator_cli_version():
+VERSION_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "conservator-cli", "latest_version.json"
+)
+VERSION_CACHE_TTL = 24 * 60 * 60
+# How long other processes wait for a check that was started (and may have
+# been stopped by its process exiting) before starting their own.
+VERSION_CHECK_PENDING_TTL = 5 * 60
+
+_version_check_thread = None
+_version_check_lock = threading.Lock()
+
+
+def _read_cached_version(max_age):
+    # Returns whether the cached version is still fresh, and the version.
+    try:
+        with open(VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("pending"):
+            max_age = min(max_age, VERSION_CHECK_PENDING_TTL)
+        return time.time() - cached["checked"] < max_age, cached["version"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False, None
+
+
+def write_json_atomically(path, value):
+    """
+    Writes `value` to `path` as JSON. The file is replaced in one step, so
+    readers never see a partially written file, even if the process dies.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _write_cached_version(version, pending=False):
+    try:
+        write_json_atomically(
+            VERSION_CACHE_PATH,
+            {"checked": time.time(), "version": version, "pending": pending},
+        )
+    except OSError:
+        logger.debug("Couldn't cache the latest version of Conservator-cli")
+
+
+def get_conservator_cli_version(max_age=VERSION_CACHE_TTL):
+    """
+    Returns the latest version of Conservator-cli released on PyPI, or `None`
+    if it couldn't be found (for instance, without internet access).
+
+    The result (including a failure) is cached on disk at ``VERSION_CACHE_PATH``,
+    and reused for `max_age` seconds. While the lookup runs, other processes
+    reuse the previous result.
+    """
+    fresh, version = _read_cached_version(max_age)
+    if fresh:
+        return version
+    _write_cached_version(version, pending=True)
+
     # Get latest version from PyPi programatically
     # See https://stackoverflow.com/a/62571316
-    response = requests.get("https://pypi.org/pypi/conservator-cli/json", timeout=10)
-    return response.json()["info"]["version"]
+    try:
+        response = requests.get(
+            "https://pypi.org/pypi/conservator-cli/json", timeout=10
+        )
+        version = response.json()["info"]["version"]
+    except Exception as e:
+        logger.debug("Couldn't get the latest version of Conservator-cli: %s", e)
+        version = None
+    _write_cached_version(version)
+    return version
+
+
+def check_conservator_cli_version_in_background():
+    """
+    Runs :func:`compare_conservator_cli_version` in a daemon thread, so
+    callers never wait for PyPI. The check runs at most once per process.
+
+    A process that exits before the check is done (like a short CLI command)
+    doesn't wait for it. Other processes then skip the check for
+    ``VERSION_CHECK_PENDING_TTL`` seconds, rather than each starting one.
+    """
+    global _version_check_thread
+    with _version_check_lock:
+        if _version_check_thread is None:
+            _version_check_thread = threading.Thread(
+                target=compare_conservator_cli_version,
+                name="conservator-cli-version-check",
+                daemon=True,
+            )
+            _version_check_thread.start()
+        return _version_check_thread
 
 
 def compare_conservator_cli_version():
+    latest_version = get_conservator_cli_version()
+    if latest_version is None:
+        return None
+
     installed_version = semver.VersionInfo.parse(cli_ver)
-    released_version = semver.VersionInfo.parse(get_conservator_cli_version())
+    released_version = semver.VersionInfo.parse(latest_version)
 
     installed_version_simple = semver.VersionInfo.parse(
         f"{installed_version.major}.{installed_version.minor}.{installed_version.patch}"
@@ -0,0 +1 @@
+version = "1.9.0"
@@ -306,9 +306,10 @@ class Collection(QueryableType, FileLockerType):
         if include_datasets:
             self.download_datasets(path, overwrite=overwrite_datasets)
         if recursive:
-            for id_ in self.child_ids:
-                child = Collection.from_id(self._conservator, id_)
-                child.populate("name")
+            children = self._conservator.collections.from_ids(
+                self.child_ids, fields="name"
+            )
+            for child in children:
                 child_path = os.path.join(path, child.name)
                 child.download(
                     child_path,
@@ -27,6 +27,7 @@ logger = logging.getLogger(__name__)
 class Dataset(QueryableType, FileLockerType, MetadataType):
     underlying_type = schema.Dataset
     by_id_query = schema.Query.dataset
+    by_ids_query = schema.Query.multi_datasets
     search_query = schema.Query.datasets
 
     # name of id field in mutations when not simply 'id'
@@ -211,17 +212,25 @@ class Dataset(QueryableType, FileLockerType, MetadataType):
                 break
         if len(dset_frame_id_map) < len(frame_ids):
             logger.warning("One or more new dataset frame IDs were not found!")
-        # Add associations between frames.
-        for frame_id in frame_ids:
-            if frame_id in associated_frame_table:
-                if frame_id not in dset_frame_id_map:
-                    logger.warning(
-                        f"Missing dataset frame ID for frame ID {frame_id}, cannot associate frame"
-                    )
-                    continue
-                dset_frame = dset_frame_id_map[frame_id]
-                for assoc_frame_input in associated_frame_table[frame_id]:
-                    self.associate_frame(dset_frame, assoc_frame_input)
+        # Add associations between frames, in as few requests as possible.
+        with self._conservator.batch() as batch:
+            for frame_id in frame_ids:
+                if frame_id in associated_frame_table:
+                    if frame_id not in dset_frame_id_map:
+                        logger.warning(
+                            f"Missing dataset frame ID for frame ID {frame_id}, cannot associate frame"
+                        )
+                        continue
+                    dset_frame = dset_frame_id_map[frame_id]
+                    for assoc_frame_input in associated_frame_table[frame_id]:
+                        batch.query(
+                            Mutation.add_associated_frame_to_dataset_frame,
+                            dataset_frame_id=dset_frame,
+                            input=assoc_frame_input,
+                        )
+        for result in batch.results:
+            if result.error is not None:
+                raise result.error
 
     def get_git_url(self):
         """Returns the Git URL used for cloning this Dataset."""
@@ -243,7 +252,8 @@ class Dataset(QueryableType, FileLockerType, MetadataType):
             user_id=user.id,
         )
 
-    @requires_fields("repository.master")
+    # The master commit changes with every commit.
+    @requires_fields("repository.master", refresh=True)
     def get_commit_history(self, fields=None):
         """
         Returns a list of version control commits for the Dataset. Note
@@ -16,6 +16,7 @@ class DatasetFrame(QueryableType):
 
     underlying_type = schema.DatasetFrame
     by_id_query = schema.Query.dataset_frame
+    by_ids_query = schema.Query.dataset_frames_by_ids
 
     def flag(self):
         """
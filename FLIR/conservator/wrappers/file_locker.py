@@ -52,7 +52,8 @@ class FileLockerType(TypeProxy):
         result = self._conservator.query(self.file_locker_gen_url, **mutation_args)
         return result.signed_url
 
-    @requires_fields("file_locker_files")
+    # File URLs are signed, and expire.
+    @requires_fields("file_locker_files", refresh=True)
     def download_associated_files(self, path, no_meter=False):
         """Downloads associated files (from file locker) to
         ``associated_files/``."""
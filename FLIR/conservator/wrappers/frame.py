@@ -18,7 +18,7 @@ class Frame(QueryableType):
     underlying_type = schema.Frame
     by_ids_query = schema.Query.frames_by_ids
 
-    @requires_fields("url", "video_name", "frame_index", "md5")
+    @requires_fields("url", "video_name", "frame_index", "md5", refresh=["url"])
     def download(self, path, no_meter=False):
         """
         Download media under the directory `path`. The filename will be ``[media id]-[frame index].jpg``,
@@ -251,7 +251,7 @@ class MediaType(QueryableType, FileLockerType, MetadataType):
 
         return upload_request
 
-    @requires_fields("url", "filename", "md5")
+    @requires_fields("url", "filename", "md5", refresh=["url"])
     def download(self, path, no_meter=False):
         """Download media to `path`."""
         local_path = os.path.join(path, self.filename)
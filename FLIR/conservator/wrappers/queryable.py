@@ -15,9 +15,14 @@ class QueryableType(TypeProxy):
     Subclasses must define ``by_id_query`` to be a query that can
     return more fields of the type given an id. Alternatively, they may define
     a custom ``_populate`` method if the method of querying is unique.
+
+    Subclasses may also define ``by_ids_query``, a query returning many
+    instances given a list of ``ids``. It's used by
+    :meth:`~FLIR.conservator.managers.type_manager.TypeManager.populate_many`.
     """
 
     by_id_query = None
+    by_ids_query = None
 
     def populate_all(self):
         """
@@ -40,11 +45,15 @@ class QueryableType(TypeProxy):
         result = self._populate(fields)  # returns a TypeProxy with the new fields
         if result is None:
             raise InvalidIdException(f"Query with id='{self.id}' returned None")
+        self._merge(result)
+
+    def _merge(self, result):
+        if result._usage is not None:
+            # The fields of a populated result were asked for, so they're used.
+            result._usage[0].record_all_used(result._usage[1], result._usage[2])
         # copy over fields from other _instance (to get unproxied)
         for field in result._instance:
-            v = getattr(result._instance, field)
-            setattr(self._instance, field, v)
-            self._initialized_fields.append(field)
+            self._set_field(field, getattr(result._instance, field))
 
     def _populate(self, fields):
         if self.by_id_query is None:
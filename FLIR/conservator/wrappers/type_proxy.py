@@ -1,10 +1,19 @@
 import functools
+import sys
 
 import sgqlc.types
 
 from FLIR.conservator.fields_request import FieldsRequest
 from FLIR.conservator.util import to_clean_string
 
+# Defined here before moving to util, and still importable from here.
+from FLIR.conservator.util import all_subclasses  # pylint: disable=unused-import
+
+# Values of these types are returned by TypeProxy.wrap as-is.
+UNWRAPPED_TYPES = (type(None), str, int, float, bool)
+
+_MISSING = object()
+
 
 class TypeProxy(object):
     """
@@ -31,6 +40,24 @@ class TypeProxy(object):
 
     underlying_type = None
 
+    # Set while profiling field usage: the FieldUsageProfiler, the name of
+    # the query that returned this instance, and this instance's path in it.
+    _usage = None
+
+    # Subclasses by the underlying type they define. Filled as they're defined.
+    _wrappers = {}
+    # Subclasses by every type passed to get_wrapping_type, including
+    # list and non-null variants.
+    _wrapping_types = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        underlying_type = cls.__dict__.get("underlying_type", None)
+        if underlying_type is not None:
+            TypeProxy._wrappers[underlying_type] = cls
+            # A new subclass may change earlier lookups.
+            TypeProxy._wrapping_types.clear()
+
     def __init__(self, conservator, instance):
         if isinstance(instance, TypeProxy):
             # Before queries returned a TypeProxy, many methods had to
@@ -40,23 +67,49 @@ class TypeProxy(object):
             self._instance = instance._instance
             self.underlying_type = instance.underlying_type
             self._initialized_fields = instance._initialized_fields
+            self._wrapped_fields = instance._wrapped_fields
+            self._usage = instance._usage
             return
 
         self._conservator = conservator
         self._instance = instance
         if self.underlying_type is None:
             self.underlying_type = instance.__class__
-        self._initialized_fields = [field for field in instance]
+        self._initialized_fields = set(instance)
+        # Wrapped field values, so repeated accesses return the same objects.
+        self._wrapped_fields = {}
 
     def __getattr__(self, field_name):
         if field_name in self._initialized_fields:
+            usage = self._usage
+            if usage is not None:
+                usage[0].record_used(usage[1], usage[2] + field_name)
+
+            wrapped = self._wrapped_fields.get(field_name, _MISSING)
+            if wrapped is not _MISSING:
+                return wrapped
+
             field = self._instance._ContainerTypeMeta__fields[field_name]
             value = getattr(self._instance, field_name)
-
-            return TypeProxy.wrap(self._conservator, field.type, value)
+            wrapped = TypeProxy.wrap(self._conservator, field.type, value)
+            if usage is not None and isinstance(wrapped, _TRACKED_TYPES):
+                wrapped._usage = (usage[0], usage[1], usage[2] + field_name + ".")
+            self._wrapped_fields[field_name] = wrapped
+            return wrapped
 
         raise AttributeError(f"Unknown or uninitialized attribute: '{field_name}'")
 
+    def _set_field(self, field_name, value):
+        """
+        Sets the underlying instance's `field_name` to the unwrapped `value`.
+        """
+        setattr(self._instance, field_name, value)
+        self._initialized_fields.add(field_name)
+        self._wrapped_fields.pop(field_name, None)
+        usage = self._usage
+        if usage is not None:
+            usage[0].record_fetched(usage[1], usage[2] + field_name, value)
+
     def has_field(self, path):
         """Returns `True` if the current instance has initialized the specified `path`.
 
@@ -103,6 +156,8 @@ class TypeProxy(object):
         Returns the underlying instance as a dictionary, suitable for turning
         into JSON.
         """
+        if self._usage is not None:
+            self._usage[0].record_all_used(self._usage[1], self._usage[2])
         return self._instance.__to_json_value__()
 
     def __to_json_value__(self):
@@ -134,12 +189,21 @@ class TypeProxy(object):
         related to `type_`. If one doesn't exist, returns generic :class:`TypeProxy`.
 
         This checks the base type. For instance, it will match ``[Video]!`` with ``Video``.
+        Results are cached, so repeated lookups are cheap.
         """
-        # rather hacky
-        for subcls in all_subclasses(TypeProxy):
-            if TypeProxy.has_base_type(subcls.underlying_type, type_):
-                return subcls
-        return TypeProxy
+        cls = TypeProxy._wrapping_types.get(type_, None)
+        if cls is not None:
+            return cls
+
+        cls = TypeProxy
+        b = type_
+        while hasattr(b, "__base__"):
+            if b in TypeProxy._wrappers:
+                cls = TypeProxy._wrappers[b]
+                break
+            b = b.__base__
+        TypeProxy._wrapping_types[type_] = cls
+        return cls
 
     @staticmethod
     def wrap(conservator, type_, instance):
@@ -153,23 +217,12 @@ class TypeProxy(object):
         :param type_: The SGQLC type of the instance to wrap.
         :param instance: The SGQLC object to wrap.
         """
-        unwrapped_types = (
-            type(None),
-            str,
-            int,
-            float,
-            bool,
-        )
-        if isinstance(instance, unwrapped_types):
+        if isinstance(instance, UNWRAPPED_TYPES):
             return instance
 
         if isinstance(instance, list):
-            # This isn't the most efficient method, as it recalculates type for each item,
-            # but it handles nested lists correctly... We can refactor if speed ever
-            # becomes a concern.
-            return ListTypeProxy(
-                TypeProxy.wrap(conservator, type_, item) for item in instance
-            )
+            # Items (including nested lists) are wrapped when first accessed.
+            return ListTypeProxy(instance, conservator=conservator, type_=type_)
 
         if isinstance(instance, sgqlc.types.ContainerType) and len(instance) == 0:
             # No fields were initialized, meaning the value is likely None.
@@ -183,17 +236,142 @@ class ListTypeProxy(list):
     """
     Identical to built-in `list`, except it provides :meth:`to_json`. This ensures all types
     returned by queries have a :meth:`to_json`.
+
+    Items are wrapped with :meth:`TypeProxy.wrap` when they are first accessed, so
+    large results only pay for the items that are used. Indexing, slicing,
+    iterating (including ``list(items)``) and copying all return wrapped items.
+    Code that reads a list's storage directly, such as :func:`json.dumps` or
+    :meth:`str.join`, sees items that aren't wrapped yet: pass it
+    :meth:`to_json` or ``list(items)`` instead.
+
+    :param iterable: The items of the list, wrapped or not.
+    :param conservator: Conservator instance used to wrap items.
+    :param type_: The SGQLC type of the items.
     """
 
+    # See TypeProxy._usage. Items share the usage of their list.
+    _usage = None
+
+    def __init__(self, iterable=(), conservator=None, type_=None):
+        super().__init__(iterable)
+        self._conservator = conservator
+        self._type = type_
+
+    def _get(self, index):
+        item = list.__getitem__(self, index)
+        if not isinstance(item, _WRAPPED_TYPES):
+            item = TypeProxy.wrap(self._conservator, self._type, item)
+            if self._usage is not None and isinstance(item, _TRACKED_TYPES):
+                item._usage = self._usage
+            list.__setitem__(self, index, item)
+        return item
+
+    def _wrap_all(self):
+        for i in range(len(self)):
+            self._get(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        return self._get(index)
+
+    def __iter__(self):
+        i = 0
+        while i < len(self):
+            yield self._get(i)
+            i += 1
+
+    def __reversed__(self):
+        for i in reversed(range(len(self))):
+            yield self._get(i)
+
+    def __contains__(self, value):
+        return any(item is value or item == value for item in self)
+
+    def index(self, value, start=0, stop=sys.maxsize):
+        self._wrap_all()
+        return super().index(value, start, stop)
+
+    def count(self, value):
+        self._wrap_all()
+        return super().count(value)
+
+    def remove(self, value):
+        self._wrap_all()
+        super().remove(value)
+
+    def pop(self, index=-1):
+        self._get(index)
+        return super().pop(index)
+
+    def sort(self, *args, **kwargs):
+        self._wrap_all()
+        super().sort(*args, **kwargs)
+
+    def copy(self):
+        return ListTypeProxy(list.__iter__(self), self._conservator, self._type)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def _compare(self, other, op):
+        self._wrap_all()
+        if isinstance(other, ListTypeProxy):
+            other._wrap_all()
+        return op(other)
+
+    def __eq__(self, other):
+        return self._compare(other, super().__eq__)
+
+    def __ne__(self, other):
+        return self._compare(other, super().__ne__)
+
+    def __lt__(self, other):
+        return self._compare(other, super().__lt__)
+
+    def __le__(self, other):
+        return self._compare(other, super().__le__)
+
+    def __gt__(self, other):
+        return self._compare(other, super().__gt__)
+
+    def __ge__(self, other):
+        return self._compare(other, super().__ge__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._wrap_all()
+        return super().__repr__()
+
+    def __reduce__(self):
+        # The SGQLC type may not be importable, so only wrapped items are kept.
+        return ListTypeProxy, (list(self),)
+
     def to_json(self):
         """
         Returns a `list` suitable for turning into JSON.
         """
         return [
-            item.to_json() if isinstance(item, TypeProxy) else item for item in self
+            item.to_json() if isinstance(item, (TypeProxy, ListTypeProxy)) else item
+            for item in self
         ]
 
 
+# Items of a ListTypeProxy that are already wrapped.
+_WRAPPED_TYPES = UNWRAPPED_TYPES + (TypeProxy, ListTypeProxy)
+# Wrapped values whose field usage can be recorded.
+_TRACKED_TYPES = (TypeProxy, ListTypeProxy)
+
+
 class MissingFieldException(Exception):
     """Raised when a field can't be populated, but is required for an
     operation."""
@@ -201,24 +379,38 @@ class MissingFieldException(Exception):
     pass
 
 
-def requires_fields(*fields):
+def requires_fields(*fields, refresh=False):
     """
-    Decorator for requiring `fields` for an instance method. If missing, calls
-    `populate`. If `populate` fails, raises `MissingFieldException`.
+    Decorator for requiring `fields` for an instance method. Any that are missing
+    are queried with `populate`. If `populate` fails, raises `MissingFieldException`.
 
     This should be used on any instance method that requires certain fields to
-    function correctly.
+    function correctly. Fields that are already initialized aren't queried again,
+    unless the method is called with ``refresh_fields=True``.
 
     :param fields: Strings containing the names of required fields. They can be
         subfields (such as "repository.master" on a Dataset).
+    :param refresh: If `True`, always query `fields`, for fields whose values
+        are likely to change between calls. Can also be a list of the fields to
+        always query, such as signed URLs, which expire.
     """
+    if refresh is True:
+        refresh = fields
+    refresh = set(refresh or ())
 
     def decorator(f):
         @functools.wraps(f)
-        def wrapper(self, *args, **kwargs):
-            fr = FieldsRequest.create(fields)
-            if hasattr(self, "populate"):
-                self.populate(fr)
+        def wrapper(self, *args, refresh_fields=False, **kwargs):
+            if refresh_fields:
+                missing = list(fields)
+            else:
+                missing = [
+                    field
+                    for field in fields
+                    if field in refresh or not self.has_field(field)
+                ]
+            if missing and hasattr(self, "populate"):
+                self.populate(FieldsRequest.create(missing))
             for field in fields:
                 if not self.has_field(field):
                     raise MissingFieldException(f"Missing required field '{field}'")
@@ -227,9 +419,3 @@ def requires_fields(*fields):
         return wrapper
 
     return decorator
-
-
-def all_subclasses(cls):
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
-    )
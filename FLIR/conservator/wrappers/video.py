@@ -7,9 +7,12 @@ class Video(MediaType):
     by_id_query = schema.Query.video
     search_query = schema.Query.videos
 
-    def get_frames(self, fields=None):
+    def get_frames(self, fields=None, raw=False):
         """
         Get the video's frames
+
+        :param raw: If `True`, return the frames as plain `dict` with snake_case
+            keys, which is much faster for long videos.
         """
         frame_filter = schema.FrameFilter(video_id=self.id)
 
@@ -21,7 +24,13 @@ class Video(MediaType):
             query_fields.append("frames")
 
         frames = self._conservator.query(
-            query=schema.Query.frames, filter=frame_filter, limit=0, fields=query_fields
+            query=schema.Query.frames,
+            filter=frame_filter,
+            limit=0,
+            fields=query_fields,
+            raw=raw,
         )
 
+        if raw:
+            return frames["frames"]
         return frames.frames
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Measures how FieldsRequest.prepare_query scales with the number of
+requested paths.
+
+Run from the root directory:
+
+    $ python test/benchmarks/bench_fields_request.py
+"""
+
+import argparse
+import time
+
+import sgqlc.types
+from sgqlc.operation import Operation
+
+from FLIR.conservator.fields_request import FieldsRequest
+from FLIR.conservator.generated.schema import Query
+
+
+def all_paths(type_, prefix="", depth=4):
+    # Every field path below `type_`, up to `depth` levels deep.
+    for name in getattr(type_, "__field_names__", ()):
+        field = getattr(type_, name)
+        if field.args:
+            # Fields with required arguments can't be selected without them.
+            continue
+        path = prefix + name
+        yield path
+        if depth > 1 and issubclass(field.type, sgqlc.types.ContainerType):
+            yield from all_paths(field.type, path + ".", depth - 1)
+
+
+def time_prepare(paths, repeat):
+    best = None
+    for _ in range(repeat):
+        fields = FieldsRequest.create(paths)
+        selector = Operation(Query).dataset
+        start = time.perf_counter()
+        fields.prepare_query(selector)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    paths = list(all_paths(Query.dataset.type))
+    print(f"prepare_query on Query.dataset (best of {args.repeat}):")
+    for count in [25, 50, 100, 200, len(paths)]:
+        seconds = time_prepare(paths[:count], args.repeat)
+        print(f"  {count:5} paths: {seconds * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measures how long importing the CLI takes, using python -X importtime.
+
+Run from the root directory:
+
+    $ python test/benchmarks/bench_import_time.py
+
+Each module is imported in a new interpreter. The slowest imports are listed,
+to find the cause of a regression.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+MODULES = [
+    "FLIR.conservator.cli",
+    "FLIR.conservator.cli.cvc",
+    "FLIR.conservator.conservator",
+]
+
+
+def import_times(module):
+    """
+    Returns the total import time of `module` in seconds, and a `dict` of the
+    cumulative import time of every module it imported, in seconds.
+    """
+    # Compiling modules would be measured on every run without bytecode.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    lines = [
+        line[len("import time:") :].split("|")
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    ]
+    # Modules are listed after the modules they import, which are indented.
+    # Those listed before the last unindented module were imported at startup.
+    start = max(
+        (i for i, (_, _, name) in enumerate(lines[:-1]) if not name.startswith("  ")),
+        default=-1,
+    )
+    times = {name.strip(): int(cumulative) / 1e6 for _, cumulative, name in lines}
+    imported = {name.strip() for _, _, name in lines[start + 1 :]}
+    return times.get(module, 0.0), {name: times[name] for name in imported}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        # The first run warms the bytecode cache.
+        runs = [import_times(module) for _ in range(args.repeat + 1)][1:]
+        total, times = min(runs, key=lambda run: run[0])
+        print(f"{module}: {total * 1000:.1f}ms (best of {args.repeat})")
+        slowest = sorted(
+            (name for name in times if name != module),
+            key=times.get,
+            reverse=True,
+        )
+        for name in slowest[: args.top]:
+            print(f"  {times[name] * 1000:8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
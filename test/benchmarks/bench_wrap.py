@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Measures how fast TypeProxy.wrap wraps a large list of DatasetFrames.
+
+Run from the root directory:
+
+    $ python test/benchmarks/bench_wrap.py
+"""
+
+import argparse
+import time
+
+import sgqlc.types
+
+from FLIR.conservator.generated import schema
+from FLIR.conservator.util import all_subclasses
+from FLIR.conservator.wrappers import DatasetFrame, TypeProxy
+
+
+def slow_get_wrapping_type(type_):
+    # The look-up used before the type registry, for comparison.
+    for subcls in all_subclasses(TypeProxy):
+        if TypeProxy.has_base_type(subcls.underlying_type, type_):
+            return subcls
+    return TypeProxy
+
+
+def time_wrap(type_, frames, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # Items are wrapped lazily, so iterate to wrap all of them.
+        for frame in TypeProxy.wrap(None, type_, frames):
+            assert isinstance(frame, DatasetFrame)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    type_ = sgqlc.types.non_null(sgqlc.types.list_of(schema.DatasetFrame))
+    frames = [
+        schema.DatasetFrame({"id": str(i), "frameIndex": i}) for i in range(args.count)
+    ]
+
+    fast = time_wrap(type_, frames, args.repeat)
+    get_wrapping_type = TypeProxy.get_wrapping_type
+    TypeProxy.get_wrapping_type = staticmethod(slow_get_wrapping_type)
+    try:
+        slow = time_wrap(type_, frames, args.repeat)
+    finally:
+        TypeProxy.get_wrapping_type = get_wrapping_type
+
+    print(f"Wrapped {args.count} DatasetFrames (best of {args.repeat}):")
+    print(f"  registry:   {fast:.3f}s ({args.count / fast:,.0f} items/s)")
+    print(f"  subclasses: {slow:.3f}s ({args.count / slow:,.0f} items/s)")
+
+
+if __name__ == "__main__":
+    main()
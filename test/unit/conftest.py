@@ -0,0 +1,49 @@
+import pytest
+
+from FLIR.conservator.config import Config
+from FLIR.conservator.conservator import Conservator
+
+TEST_CONFIG = {
+    "CONSERVATOR_API_KEY": "testAPIkey",
+    "CONSERVATOR_URL": "https://myconservator.com",
+}
+
+
+class FakeEndpoint:
+    """
+    Stands in for the GraphQL endpoint of a Conservator instance. Each
+    request is answered by `handler(query, variables)`, which returns the
+    ``data`` of the response.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def __call__(self, query, variables=None):
+        self.requests.append((query, variables))
+        return {"data": self.handler(query, variables)}
+
+
+@pytest.fixture
+def config():
+    return Config.from_dict(TEST_CONFIG)
+
+
+@pytest.fixture
+def conservator(config, monkeypatch):
+    monkeypatch.setattr(
+        "FLIR.conservator.connection.check_conservator_cli_version_in_background",
+        lambda: None,
+    )
+    return Conservator(config)
+
+
+@pytest.fixture
+def fake_endpoint(conservator):
+    def use_handler(handler):
+        endpoint = FakeEndpoint(handler)
+        conservator.endpoint = endpoint
+        return endpoint
+
+    return use_handler
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from FLIR.conservator.async_conservator import (
+    AsyncConservatorConnection,
+    AsyncPaginatedQuery,
+)
+from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.wrappers import Project
+
+
+def test_query(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": {"id": "1", "name": "a"}})
+
+    async def run():
+        async with AsyncConservatorConnection(conservator) as async_conservator:
+            return await async_conservator.query(Query.project, id="1", fields="name")
+
+    project = asyncio.run(run())
+    assert isinstance(project, Project)
+    assert project.name == "a"
+
+
+def test_paginated_query(conservator, fake_endpoint):
+    def handler(query, variables):
+        page = variables["page"]
+        names = ["a", "b", "c", "d", "e"][page * 2 : page * 2 + 2]
+        return {"projects": [{"id": name, "name": name} for name in names]}
+
+    endpoint = fake_endpoint(handler)
+
+    async def run():
+        async with AsyncConservatorConnection(conservator) as async_conservator:
+            results = AsyncPaginatedQuery(
+                async_conservator, query=Query.projects, fields="name", page_size=2
+            )
+            return await results.to_list()
+
+    projects = asyncio.run(run())
+    assert [project.name for project in projects] == ["a", "b", "c", "d", "e"]
+    assert len(endpoint.requests) == 3
+
+
+def test_paginated_query_count(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"projectsQueryCount": 3})
+
+    async def count():
+        async with AsyncConservatorConnection(conservator) as connection:
+            return await connection.paginated_query(Query.projects).count()
+
+    assert asyncio.run(count()) == 3
+
+
+def test_paginated_query_resumes_in_reverse(conservator, fake_endpoint, tmp_path):
+    def handler(query, variables):
+        if variables["page"] == 0 and handler.fail:
+            raise ConnectionError("Connection lost")
+        start = variables["page"] * variables["limit"]
+        count = max(0, min(variables["limit"], 5 - start))
+        frames = [{"id": str(start + i)} for i in range(count)]
+        return {"datasetFramesOnly": {"datasetFrames": frames, "totalCount": 5}}
+
+    handler.fail = True
+    fake_endpoint(handler)
+    conservator.retry_policy = conservator.retry_policy.with_options(max_retries=0)
+    path = str(tmp_path / "frames.json")
+
+    async def run():
+        async with AsyncConservatorConnection(conservator) as async_conservator:
+            frames = AsyncPaginatedQuery(
+                async_conservator,
+                query=Query.dataset_frames_only,
+                fields="dataset_frames.id",
+                page_size=2,
+                unpack_field="dataset_frames",
+                reverse=True,
+                total_unpack_field="total_count",
+                id="d",
+            ).checkpoint(path)
+            ids = []
+            with pytest.raises(ConnectionError):
+                async for frame in frames:
+                    ids.append(frame.id)
+            assert ids == ["4", "3", "2"]
+
+            handler.fail = False
+            frames = AsyncPaginatedQuery.resume(async_conservator, path)
+            return [frame.id async for frame in frames]
+
+    assert asyncio.run(run()) == ["1", "0"]
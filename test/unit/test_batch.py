@@ -0,0 +1,66 @@
+import pytest
+
+from FLIR.conservator.batch import BatchNotExecutedException
+from FLIR.conservator.connection import ConservatorGraphQLServerError
+from FLIR.conservator.generated.schema import Query, Mutation
+
+
+def test_batch_single_request(conservator, fake_endpoint):
+    def handler(query, variables):
+        assert "batch0: project(" in query
+        assert "batch1: project(" in query
+        return {"batch0": {"id": "1", "name": "a"}, "batch1": {"id": "2", "name": "b"}}
+
+    endpoint = fake_endpoint(handler)
+    with conservator.batch() as batch:
+        first = batch.query(Query.project, id="1", fields="name")
+        second = batch.query(Query.project, id="2", fields="name")
+        with pytest.raises(BatchNotExecutedException):
+            first.value
+
+    assert len(endpoint.requests) == 1
+    assert first.value.name == "a"
+    assert second.value.name == "b"
+
+
+def test_query_many_splits_queries_and_mutations(conservator, fake_endpoint):
+    def handler(query, variables):
+        if query.startswith("mutation"):
+            return {"batch0": {"id": "1"}}
+        return {"batch0": {"id": "2", "name": "b"}}
+
+    endpoint = fake_endpoint(handler)
+    results = conservator.query_many(
+        [
+            (Mutation.approve_dataset_frame, {"id": "1"}, "id"),
+            (Query.project, {"id": "2"}, "name"),
+        ]
+    )
+    assert len(endpoint.requests) == 2
+    assert results[0].value.id == "1"
+    assert results[1].value.name == "b"
+
+
+def test_batch_per_item_errors(conservator, fake_endpoint):
+    endpoint = fake_endpoint(lambda query, variables: {"batch0": {"id": "1"}})
+
+    def respond(query, variables=None):
+        endpoint.requests.append((query, variables))
+        if "batch1" not in query:
+            return {"data": {"batch0": {"id": "1", "name": "a"}}}
+        # The non-null error in batch1 also nulls the result of batch0.
+        return {
+            "data": None,
+            "errors": [{"message": "Not found", "path": ["batch1"]}],
+        }
+
+    conservator.endpoint = respond
+    results = conservator.query_many(
+        [(Query.project, {"id": "1"}, "name"), (Query.project, {"id": "2"}, "name")]
+    )
+    assert len(endpoint.requests) == 2
+    assert results[0].value.name == "a"
+    assert results[0].error is None
+    assert isinstance(results[1].error, ConservatorGraphQLServerError)
+    with pytest.raises(ConservatorGraphQLServerError):
+        results[1].value
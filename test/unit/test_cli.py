@@ -1,3 +1,7 @@
+import subprocess
+import sys
+
+import click
 import pytest
 
 
@@ -9,3 +13,40 @@ def test_cli():
     with pytest.raises(SystemExit) as exits:
         cli.main()
     assert exits.type == SystemExit
+
+
+# Modules that commands like --help shouldn't need.
+HEAVY_MODULES = [
+    "FLIR.conservator.generated.schema",
+    "FLIR.conservator.conservator",
+    "requests",
+    "sgqlc",
+    "PIL",
+    "jsonschema",
+    "tqdm",
+    "readline",
+]
+
+
+@pytest.mark.parametrize("module", ["FLIR.conservator.cli", "FLIR.conservator.cli.cvc"])
+def test_cli_import_is_lazy(module):
+    # -X importtime lists every module imported, including by the interpreter.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+    for heavy in HEAVY_MODULES:
+        assert heavy not in imported
+
+
+def test_lazy_subcommands_match_their_help():
+    from FLIR.conservator.cli import LAZY_SUBCOMMANDS, main
+
+    ctx = click.Context(main)
+    for name, (_, help_) in LAZY_SUBCOMMANDS.items():
+        command = main.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+        assert command.help == help_
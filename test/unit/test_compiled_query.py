@@ -0,0 +1,38 @@
+from FLIR.conservator.generated.schema import Query, FrameFilter
+from FLIR.conservator.paginated_query import PaginatedQuery
+
+
+def test_paginated_query_reuses_document(conservator, fake_endpoint):
+    def handler(query, variables):
+        start = variables["page"] * variables["limit"]
+        count = max(0, min(variables["limit"], 5 - start))
+        return {"projects": [{"id": str(start + i)} for i in range(count)]}
+
+    endpoint = fake_endpoint(handler)
+    results = list(
+        PaginatedQuery(conservator, query=Query.projects, fields="id", page_size=2)
+    )
+
+    assert len(results) == 5
+    assert len(endpoint.requests) == 3
+    assert len({query for query, _ in endpoint.requests}) == 1
+    assert conservator.query_cache.misses == 1
+    assert conservator.query_cache.hits == 2
+
+
+def test_fields_are_part_of_key(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": {"id": "1", "name": "a"}})
+    conservator.query(Query.project, id="1", fields="name")
+    conservator.query(Query.project, id="2", fields=["name"])
+    conservator.query(Query.project, id="3", fields="id")
+    assert conservator.query_cache.stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_input_variables(conservator, fake_endpoint):
+    endpoint = fake_endpoint(lambda query, variables: {"frame": {"id": "1"}})
+    conservator.query(
+        Query.frame, filter=FrameFilter(video_id="v", frame_index=3), fields="id"
+    )
+    query, variables = endpoint.requests[0]
+    assert "$filter: FrameFilter" in query
+    assert variables == {"filter": {"videoId": "v", "frameIndex": 3}}
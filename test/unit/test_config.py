@@ -1,4 +1,6 @@
-from FLIR.conservator.config import Config
+import pytest
+
+from FLIR.conservator.config import Config, ConfigError
 
 TEST_DICT = {
     "CONSERVATOR_API_KEY": "testAPIkey",
@@ -36,3 +38,54 @@ def test_defaults():
     assert c.key == "testAPIkey"
     assert c.url == "https://myconservator.com"
     assert c.max_retries == 5
+
+
+def test_http_pool_size():
+    c = Config.from_dict({**TEST_DICT, "CONSERVATOR_HTTP_POOL_SIZE": "32"})
+    assert c.http_pool_size == 32
+    assert Config.from_dict(TEST_DICT).http_pool_size == 10
+
+
+@pytest.mark.parametrize("pool_size", ["0", "-1", "ten"])
+def test_invalid_http_pool_size(pool_size):
+    with pytest.raises(ConfigError, match="CONSERVATOR_HTTP_POOL_SIZE"):
+        Config.from_dict({**TEST_DICT, "CONSERVATOR_HTTP_POOL_SIZE": pool_size})
+
+
+@pytest.mark.parametrize("budget", ["-0.1", "many"])
+def test_invalid_retry_budget(budget):
+    with pytest.raises(ConfigError, match="CONSERVATOR_RETRY_BUDGET"):
+        Config.from_dict({**TEST_DICT, "CONSERVATOR_RETRY_BUDGET": budget})
+
+
+def test_version_check():
+    assert Config.from_dict(TEST_DICT).version_check
+    c = Config.from_dict({**TEST_DICT, "CONSERVATOR_VERSION_CHECK": "false"})
+    assert not c.version_check
+
+
+def test_limits():
+    c = Config.from_dict(
+        {
+            **TEST_DICT,
+            "CONSERVATOR_GRAPHQL_RATE_LIMIT": "20",
+            "CONSERVATOR_TRANSFER_MAX_IN_FLIGHT": "4",
+        }
+    )
+    assert c.graphql_rate_limit == 20.0
+    assert c.graphql_max_in_flight == 0
+    assert c.transfer_max_in_flight == 4
+
+
+@pytest.mark.parametrize(
+    "internal_name",
+    [
+        "CONSERVATOR_GRAPHQL_RATE_LIMIT",
+        "CONSERVATOR_GRAPHQL_MAX_IN_FLIGHT",
+        "CONSERVATOR_TRANSFER_RATE_LIMIT",
+        "CONSERVATOR_TRANSFER_MAX_IN_FLIGHT",
+    ],
+)
+def test_negative_limits(internal_name):
+    with pytest.raises(ConfigError, match=internal_name):
+        Config.from_dict({**TEST_DICT, internal_name: "-1"})
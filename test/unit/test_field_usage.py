@@ -0,0 +1,79 @@
+import json
+
+from FLIR.conservator.field_usage import FieldUsageProfiler, load_learned_fields
+from FLIR.conservator.generated.schema import Query
+
+PROJECT = {
+    "id": "1",
+    "name": "p",
+    "createdBy": "a",
+    "rootCollection": {"id": "r", "name": "root"},
+}
+
+
+def test_profiler_reports_unused_fields(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": PROJECT})
+    conservator.field_usage = FieldUsageProfiler()
+    project = conservator.query(
+        Query.project,
+        id="1",
+        fields=["id", "name", "created_by", "root_collection.name"],
+    )
+    assert project.name == "p"
+
+    report = conservator.field_usage.report()
+    assert report["project"]["fields"] == ["id", "name"]
+    assert report["project"]["unused"] == [
+        "created_by",
+        "root_collection",
+        "root_collection.id",
+        "root_collection.name",
+    ]
+
+
+def test_profiler_tracks_subfields_and_lists(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"projects": [PROJECT, PROJECT]})
+    conservator.field_usage = FieldUsageProfiler()
+    projects = conservator.query(
+        Query.projects, page=0, limit=2, fields=["id", "name", "root_collection.name"]
+    )
+    assert [project.root_collection.name for project in projects] == ["root", "root"]
+
+    assert conservator.field_usage.used_fields("projects") == ["root_collection.name"]
+    assert conservator.field_usage.unused_fields("projects") == [
+        "name",
+        "root_collection.id",
+    ]
+
+
+def test_to_json_uses_every_field(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": PROJECT})
+    conservator.field_usage = FieldUsageProfiler()
+    project = conservator.query(
+        Query.project, id="1", fields=["name", "root_collection.name"]
+    )
+    project.root_collection.to_json()
+
+    assert conservator.field_usage.used_fields("project") == [
+        "root_collection.id",
+        "root_collection.name",
+    ]
+
+
+def test_learned_fields_replace_defaults(conservator, fake_endpoint, tmp_path):
+    endpoint = fake_endpoint(lambda query, variables: {"project": PROJECT})
+    profiler = FieldUsageProfiler()
+    conservator.field_usage = profiler
+    conservator.query(Query.project, id="1").name
+    path = str(tmp_path / "fields.json")
+    profiler.dump(path)
+    assert json.load(open(path))["project"]["fields"] == ["id", "name"]
+
+    conservator.field_usage = None
+    conservator.learned_fields = load_learned_fields(path)
+    conservator.query(Query.project, id="1")
+    conservator.query(Query.project, id="1", fields="created_by")
+
+    default_query, explicit_query = endpoint.requests[-2][0], endpoint.requests[-1][0]
+    assert "rootCollection" not in default_query and "name" in default_query
+    assert "createdBy" in explicit_query and "name" not in explicit_query
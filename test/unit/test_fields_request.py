@@ -1,3 +1,4 @@
+from FLIR.conservator.fields_manager import _default_plan
 from FLIR.conservator.fields_request import FieldsRequest
 from FLIR.conservator.generated.schema import Query
 from sgqlc.operation import Operation
@@ -26,3 +27,25 @@ def test_prepare_query_simple_exclude():
     assert 'project(id: "123")' in str(op)
     assert "fileLockerFiles" not in str(op)
     assert "acl" in str(op)
+
+
+def test_prepare_query_only_defaults_leaves():
+    op = Operation(Query)
+    q = op.dataset
+    q(id="123")
+    fields = FieldsRequest()
+    fields.include_fields(["repository", "repository.master", "acl", "name"])
+    fields.prepare_query(q)
+    # repository has a selected subfield, so its defaults aren't added.
+    assert "master" in str(op)
+    assert "repoState" not in str(op)
+    # acl is a leaf, so its defaults are.
+    assert "userIds" in str(op)
+
+
+def test_default_fields_are_reused():
+    _default_plan.cache_clear()
+    for _ in range(3):
+        FieldsRequest().prepare_query(Operation(Query).project)
+    # Project, and the Collection of its root_collection.
+    assert _default_plan.cache_info().misses == 2
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+URL = "https://myconservator.com/graphql"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_children_get_new_pools(conservator):
+    session = conservator.session
+    adapter = session.get_adapter(URL)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        child_adapter = session.get_adapter(URL)
+        replaced = (
+            child_adapter is not adapter
+            and child_adapter._pool_maxsize == adapter._pool_maxsize
+            and conservator.endpoint.session is session
+        )
+        os.write(write_fd, b"1" if replaced else b"0")
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        result = f.read()
+    os.waitpid(pid, 0)
+    assert result == b"1"
+    # The parent keeps its pools.
+    assert session.get_adapter(URL) is adapter
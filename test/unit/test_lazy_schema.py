@@ -0,0 +1,140 @@
+import pickle
+import sys
+import types
+
+import pytest
+import sgqlc.types
+
+from FLIR.conservator.generated import schema
+from FLIR.conservator.generated.lazy import LazySchema
+
+# A few types, as generated by SGQLC.
+EAGER_SCHEMA = """
+import sgqlc.types
+
+
+schema = sgqlc.types.Schema()
+
+
+class Color(sgqlc.types.Enum):
+    __schema__ = schema
+    __choices__ = ("red", "green")
+
+
+class Label(sgqlc.types.Scalar):
+    __schema__ = schema
+
+
+Int = sgqlc.types.Int
+
+String = sgqlc.types.String
+
+
+class ItemFilter(sgqlc.types.Input):
+    __schema__ = schema
+    __field_names__ = ("color",)
+    color = sgqlc.types.Field(Color, graphql_name="color")
+
+
+class Item(sgqlc.types.Type):
+    __schema__ = schema
+    __field_names__ = ("name", "label", "children", "parent")
+    name = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="name")
+    label = sgqlc.types.Field(Label, graphql_name="label")
+    children = sgqlc.types.Field(
+        sgqlc.types.list_of(sgqlc.types.non_null("Item")),
+        graphql_name="children",
+        args=sgqlc.types.ArgDict(
+            (("limit", sgqlc.types.Arg(Int, graphql_name="limit", default=None)),)
+        ),
+    )
+    parent = sgqlc.types.Field("Item", graphql_name="parent")
+
+
+class Query(sgqlc.types.Type):
+    __schema__ = schema
+    __field_names__ = ("items",)
+    items = sgqlc.types.Field(
+        sgqlc.types.list_of(Item),
+        graphql_name="items",
+        args=sgqlc.types.ArgDict(
+            (
+                (
+                    "filter",
+                    sgqlc.types.Arg(ItemFilter, graphql_name="filter", default=None),
+                ),
+            )
+        ),
+    )
+
+
+schema.query_type = Query
+schema.mutation_type = None
+schema.subscription_type = None
+"""
+
+TYPE_NAMES = ["Color", "Label", "ItemFilter", "Item", "Query"]
+
+
+def exec_module(name, source):
+    module = types.ModuleType(name)
+    exec(source, vars(module))
+    return module
+
+
+def test_types_are_module_attributes():
+    assert schema.Dataset.__module__ == schema.__name__
+    assert pickle.loads(pickle.dumps(schema.Dataset)) is schema.Dataset
+    assert "Dataset" in dir(schema)
+    with pytest.raises(AttributeError):
+        schema.NotAType
+
+
+def test_types_are_defined_when_first_used():
+    namespace = {"__name__": "test"}
+    lazy_schema = LazySchema(namespace)
+
+    def define_parent():
+        class Parent(sgqlc.types.Type):
+            __schema__ = lazy_schema
+            child = sgqlc.types.Field("Child")
+
+        return Parent
+
+    def define_child():
+        class Child(sgqlc.types.Type):
+            __schema__ = lazy_schema
+            name = sgqlc.types.String
+
+        return Child
+
+    lazy_schema.add_definitions(
+        {"Parent": (define_parent, ()), "Child": (define_child, ())}
+    )
+    assert "Child" in lazy_schema and "Child" not in namespace
+
+    parent = lazy_schema.module_getattr("Parent")
+    assert namespace == {"__name__": "test", "Parent": parent}
+    assert parent.child.type is namespace["Child"]
+    assert parent.__qualname__ == "Parent"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires ast.unparse")
+def test_built_types_match_eager_types():
+    from FLIR.conservator.generated.build_lazy_schema import build
+
+    eager = exec_module("eager_test_schema", EAGER_SCHEMA)
+    lazy = exec_module("lazy_test_schema", build(EAGER_SCHEMA))
+    assert "Item" not in vars(lazy)
+    for name in TYPE_NAMES:
+        assert repr(getattr(lazy, name)) == repr(getattr(eager, name))
+    assert lazy.schema.query_type is lazy.Query
+    assert lazy.Item.parent.type is lazy.Item
+    assert repr(lazy.schema) == repr(eager.schema)
+
+
+def test_all_types_can_be_defined():
+    schema.schema.define_all()
+    names = [name for name in dir(schema) if name not in vars(schema)]
+    assert names == []
+    assert schema.schema.query_type is schema.Query
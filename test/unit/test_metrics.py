@@ -0,0 +1,105 @@
+import gzip
+import io
+import json
+import logging
+
+import requests
+import urllib3
+
+from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.metrics import Metrics
+
+
+def test_query_metrics(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": {"id": "1"}})
+    conservator.query(Query.project, id="1", fields="id")
+    conservator.query(Query.project, id="2", fields="id")
+    stats = conservator.metrics.snapshot()["graphql"]["project"]
+    assert stats["requests"] == 2
+    assert stats["errors"] == 0
+    assert stats["retries"] == 0
+
+
+def test_hooks_and_measure():
+    metrics = Metrics()
+    events = []
+    metrics.add_hook(events.append)
+    with metrics.measure("transfer", "download") as measurement:
+        measurement.size = 100
+    metrics.record_retry("transfer", "download")
+    assert [event.event for event in events] == ["request", "retry"]
+    stats = metrics.snapshot()["transfer"]["download"]
+    assert stats["bytes"] == 100
+    assert stats["retries"] == 1
+
+
+def test_prometheus():
+    metrics = Metrics()
+    metrics.record_request("graphql", "project", 0.5, size=10, error=True)
+    text = metrics.to_prometheus()
+    assert "# TYPE conservator_requests_total counter" in text
+    assert 'conservator_request_errors_total{kind="graphql",name="project"} 1' in text
+
+    metrics.record_page_size("videos", 50)
+    text = metrics.to_prometheus()
+    assert 'conservator_page_size{name="videos"} 50' in text
+
+
+def test_dump(tmp_path):
+    metrics = Metrics()
+    metrics.record_request("graphql", "user", 0.1)
+    metrics.dump(str(tmp_path / "metrics.json"))
+    assert '"user"' in (tmp_path / "metrics.json").read_text()
+
+
+def test_response_is_not_logged_without_debug(conservator, caplog):
+    rendered = []
+
+    class Response(dict):
+        def __repr__(self):
+            rendered.append(True)
+            return "response"
+
+    conservator.endpoint = lambda query, variables=None: Response(data=None)
+    with caplog.at_level(logging.INFO):
+        conservator._execute("query { user { id } }")
+    assert rendered == []
+
+
+class GzipAdapter(requests.adapters.HTTPAdapter):
+    """Answers every request with a gzipped, chunked JSON `body`."""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(gzip.compress(self.body)),
+            headers={"Content-Encoding": "gzip", "Transfer-Encoding": "chunked"},
+            status=200,
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def test_query_size_is_decoded_size(conservator):
+    body = json.dumps({"data": {"project": {"id": "1" * 1000}}}).encode()
+    conservator.session.mount("https://", GzipAdapter(body))
+    conservator.query(Query.project, id="1", fields="id")
+    assert conservator.metrics.snapshot()["graphql"]["project"]["bytes"] == len(body)
+
+
+def test_hooks_can_be_removed_while_called():
+    metrics = Metrics()
+    events = []
+
+    def once(event):
+        events.append(event)
+        metrics.remove_hook(once)
+
+    metrics.add_hook(once)
+    metrics.add_hook(events.append)
+    metrics.record_retry("transfer", "download")
+    metrics.record_retry("transfer", "download")
+    assert len(events) == 3
@@ -0,0 +1,223 @@
+import gc
+import threading
+import weakref
+
+import pytest
+
+from FLIR.conservator.connection import ConservatorGraphQLServerError
+from FLIR.conservator.generated.schema import FilterItemInput, Query
+from FLIR.conservator.paginated_query import AdaptivePageSize, PaginatedQuery
+
+
+def projects_handler(total):
+    lock = threading.Lock()
+    pages = []
+
+    def handler(query, variables):
+        with lock:
+            pages.append(variables["page"])
+        start = variables["page"] * variables["limit"]
+        count = max(0, min(variables["limit"], total - start))
+        return {"projects": [{"id": str(start + i)} for i in range(count)]}
+
+    handler.pages = pages
+    return handler
+
+
+def test_prefetch_keeps_order(conservator, fake_endpoint):
+    handler = projects_handler(total=25)
+    fake_endpoint(handler)
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects = projects.page_size(2).prefetch(pages=3, workers=3)
+    assert [project.id for project in projects] == [str(i) for i in range(25)]
+    # Pages after the short page 12 may have been requested, but no more than
+    # the prefetch window.
+    assert set(range(13)) <= set(handler.pages) <= set(range(16))
+
+
+def test_prefetch_reverse(conservator, fake_endpoint):
+    def handler(query, variables):
+        start = variables["page"] * variables["limit"]
+        count = max(0, min(variables["limit"], 5 - start))
+        frames = [{"id": str(start + i)} for i in range(count)]
+        return {"datasetFramesOnly": {"datasetFrames": frames, "totalCount": 5}}
+
+    endpoint = fake_endpoint(handler)
+    frames = PaginatedQuery(
+        conservator,
+        query=Query.dataset_frames_only,
+        fields="dataset_frames.id",
+        page_size=2,
+        unpack_field="dataset_frames",
+        reverse=True,
+        total_unpack_field="total_count",
+        id="d",
+    )
+    frames.prefetch(pages=8, workers=2)
+    assert [frame.id for frame in frames] == ["4", "3", "2", "1", "0"]
+    # One request for the total, and one per page.
+    assert len(endpoint.requests) == 4
+
+
+def test_adaptive_page_size(conservator, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    handler = projects_handler(total=40)
+
+    def endpoint(query, variables=None):
+        if variables["limit"] > 8:
+            error = {"message": "Timeout", "exception": Exception(), "status": 504}
+            return {"data": None, "errors": [error]}
+        return {"data": handler(query, variables)}
+
+    conservator.endpoint = endpoint
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects.page_size(2).adaptive_page_size(target_seconds=10, max_size=16)
+    assert [project.id for project in projects] == [str(i) for i in range(40)]
+
+    page_sizes = conservator.metrics.snapshot()["page_size"]["projects"]
+    assert page_sizes["min"] == 2
+    assert page_sizes["max"] == 8
+    # Pages were made smaller right away, without waiting to retry.
+    assert sleeps == []
+
+
+def test_adaptive_page_size_raises_query_errors(conservator, fake_endpoint):
+    def endpoint(query, variables=None):
+        endpoint.limits.append(variables["limit"])
+        return {"data": None, "errors": [{"message": "Not allowed"}]}
+
+    endpoint.limits = []
+    conservator.endpoint = endpoint
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects.page_size(16).adaptive_page_size()
+    with pytest.raises(ConservatorGraphQLServerError):
+        list(projects)
+    assert endpoint.limits == [16]
+
+
+def test_adaptive_page_size_retries_rate_limits(conservator, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    handler = projects_handler(total=3)
+
+    def endpoint(query, variables=None):
+        endpoint.limits.append(variables["limit"])
+        if len(endpoint.limits) < 3:
+            error = {"message": "Slow down", "exception": Exception(), "status": 429}
+            return {"data": None, "errors": [error]}
+        return {"data": handler(query, variables)}
+
+    endpoint.limits = []
+    conservator.endpoint = endpoint
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects.page_size(16).adaptive_page_size(target_seconds=10)
+    assert [project.id for project in projects] == ["0", "1", "2"]
+    assert endpoint.limits == [16, 16, 16]
+    assert len(sleeps) == 1
+
+
+def test_adaptive_page_size_grows(conservator, fake_endpoint):
+    endpoint = fake_endpoint(projects_handler(total=100))
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects.page_size(2).adaptive_page_size(target_seconds=10, max_size=16)
+    assert [project.id for project in projects] == [str(i) for i in range(100)]
+    limits = [variables["limit"] for _, variables in endpoint.requests]
+    assert limits[:5] == [2, 4, 8, 16, 16]
+
+
+def test_adaptive_page_size_with_awkward_offset(conservator, fake_endpoint):
+    endpoint = fake_endpoint(projects_handler(total=45))
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects.page_size(7).adaptive_page_size(max_size=10)
+    projects._page_sizer.next_size = lambda size, seconds, num_bytes: 10
+    # No size close to 10 divides the first 7 items, so the second page
+    # starts at 0, and its first 7 items are skipped.
+    assert [project.id for project in projects] == [str(i) for i in range(45)]
+    pages = [
+        (variables["page"], variables["limit"]) for _, variables in endpoint.requests
+    ]
+    assert pages == [(0, 7), (0, 10), (1, 10), (2, 10), (3, 10), (4, 10)]
+
+
+def test_adaptive_page_size_steps():
+    sizer = AdaptivePageSize(target_seconds=1.0, max_size=100)
+    assert sizer.next_size(10, seconds=0.1) == 20
+    assert sizer.next_size(10, seconds=4.0) == 5
+    assert sizer.shrink(1) == 1
+
+
+def test_count_uses_count_query(conservator, fake_endpoint):
+    endpoint = fake_endpoint(lambda query, variables: {"videosQueryCount": 1234})
+    assert conservator.videos.count("cat") == 1234
+    videos = PaginatedQuery(
+        conservator, query=Query.videos, search_text="cat", collection_id="c"
+    )
+    assert videos.count() == 1234
+
+    assert len(endpoint.requests) == 2
+    query, variables = endpoint.requests[1]
+    assert "videosQueryCount" in query
+    assert variables == {"searchText": "cat", "collectionId": "c"}
+
+
+def test_count_with_filters_pages_without_keeping(conservator, fake_endpoint):
+    endpoint = fake_endpoint(projects_handler(total=7))
+    projects = PaginatedQuery(conservator, query=Query.projects, page_size=3)
+    projects = projects.filtered_by(func=lambda id_, _: int(id_) % 2 == 0, id=None)
+    assert projects.count() == 4
+    assert len(endpoint.requests) == 3
+    assert projects.results == []
+    assert len(projects) == 4
+
+
+def test_stream_releases_items(conservator, fake_endpoint):
+    fake_endpoint(projects_handler(total=5))
+    projects = PaginatedQuery(conservator, query=Query.projects, fields="id")
+    projects = projects.page_size(3).stream()
+
+    ids = []
+    previous = None
+    for project in projects:
+        if previous is not None:
+            gc.collect()
+            assert previous() is None
+        ids.append(project.id)
+        previous = weakref.ref(project)
+        del project
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    assert projects.results == []
+    assert list(projects) == []
+
+
+def test_checkpoint_and_resume(conservator, fake_endpoint, tmp_path):
+    handler = projects_handler(total=10)
+
+    def failing_handler(query, variables):
+        assert variables["filter"] == [{"name": "a", "value": "b"}]
+        if variables["page"] == 3:
+            raise ConnectionError("Connection lost")
+        return {"videos": handler(query, variables)["projects"]}
+
+    fake_endpoint(failing_handler)
+    conservator.retry_policy = conservator.retry_policy.with_options(max_retries=0)
+    path = str(tmp_path / "videos.json")
+    videos = PaginatedQuery(
+        conservator,
+        query=Query.videos,
+        fields="id",
+        filter=[FilterItemInput(name="a", value="b")],
+    )
+    videos = videos.page_size(2).checkpoint(path, every=2)
+    ids = []
+    with pytest.raises(ConnectionError):
+        for video in videos:
+            ids.append(video.id)
+    assert ids == ["0", "1", "2", "3", "4", "5"]
+
+    fake_endpoint(
+        lambda query, variables: {"videos": handler(query, variables)["projects"]}
+    )
+    videos = PaginatedQuery.resume(conservator, path)
+    assert [video.id for video in videos] == ["4", "5", "6", "7", "8", "9"]
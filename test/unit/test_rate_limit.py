@@ -0,0 +1,66 @@
+import multiprocessing
+import pickle
+import time
+
+from FLIR.conservator.rate_limit import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+def test_token_bucket(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("time.monotonic", clock.monotonic)
+    monkeypatch.setattr("time.sleep", clock.sleep)
+    limiter = RateLimiter(rate=2, burst=2)
+    for _ in range(6):
+        limiter.take()
+    # Two are allowed by the burst, the rest at two per second.
+    assert abs(clock.slept - 1.5) < 1e-6
+
+
+def test_large_amounts_are_paid_back(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("time.monotonic", clock.monotonic)
+    monkeypatch.setattr("time.sleep", clock.sleep)
+    limiter = RateLimiter(rate=100, burst=100)
+    limiter.take(1000)
+    assert clock.slept == 0
+    limiter.take(1)
+    assert abs(clock.slept - 9) < 1e-6
+
+
+def test_unpickled_in_same_process_is_shared():
+    limiter = RateLimiter(rate=5, max_in_flight=2)
+    assert pickle.loads(pickle.dumps(limiter)) is limiter
+
+
+def _hold_slot(limiter):
+    with limiter.limit():
+        start = time.monotonic()
+        time.sleep(0.05)
+        return start, time.monotonic()
+
+
+def test_in_flight_limit_is_shared_by_workers():
+    limiter = RateLimiter(max_in_flight=1)
+    with multiprocessing.get_context("fork").Pool(3) as pool:
+        intervals = sorted(pool.map(_hold_slot, [limiter] * 3))
+    for (_, end), (start, _) in zip(intervals, intervals[1:]):
+        assert start >= end
+
+
+def test_conservator_limits(conservator):
+    assert conservator.graphql_limiter.rate == 0
+    assert conservator.transfer_limiter.max_in_flight == 0
+    pickle.loads(pickle.dumps(conservator))
@@ -0,0 +1,21 @@
+from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.paginated_query import PaginatedQuery
+
+
+def projects_handler(query, variables):
+    start = variables["page"] * variables["limit"]
+    count = max(0, min(variables["limit"], 3 - start))
+    return {"projects": [{"id": str(start + i), "name": "p"} for i in range(count)]}
+
+
+def test_query_raw(conservator, fake_endpoint):
+    fake_endpoint(lambda query, variables: {"project": {"id": "1", "createdBy": "a"}})
+    project = conservator.query(Query.project, id="1", fields="created_by", raw=True)
+    assert project == {"id": "1", "created_by": "a"}
+
+
+def test_paginated_query_as_dicts(conservator, fake_endpoint):
+    fake_endpoint(projects_handler)
+    projects = PaginatedQuery(conservator, query=Query.projects, page_size=2)
+    projects = projects.as_dicts().with_fields("name").filtered_by(id="2")
+    assert list(projects) == [{"id": "2", "name": "p"}]
@@ -0,0 +1,71 @@
+from FLIR.conservator.generated.schema import Query, Mutation
+from FLIR.conservator.response_cache import (
+    CachePolicy,
+    DiskCacheBackend,
+    ResponseCache,
+)
+
+TREE_HASH = "0123456789abcdef0123456789abcdef01234567"
+
+
+def handler(query, variables):
+    if query.startswith("mutation"):
+        return {"updateDataset": {"id": "1"}}
+    if "gitTree" in query:
+        return {"gitTree": {"_id": "t"}}
+    return {"user": {"id": "u", "email": "user@example.com"}}
+
+
+def test_query_is_cached(conservator, fake_endpoint):
+    endpoint = fake_endpoint(handler)
+    assert conservator.query(Query.user, fields="email").email == "user@example.com"
+    assert conservator.query(Query.user, fields="email").email == "user@example.com"
+    assert len(endpoint.requests) == 1
+    assert conservator.response_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_mutation_invalidates(conservator, fake_endpoint):
+    endpoint = fake_endpoint(handler)
+    conservator.query(Query.user, fields="email")
+    conservator.query(Query.git_tree, dataset_id="d", tree_id=TREE_HASH, fields="_id")
+    conservator.query(Mutation.update_dataset, input={"id": "1"}, fields="id")
+    conservator.query(Query.user, fields="email")
+    conservator.query(Query.git_tree, dataset_id="d", tree_id=TREE_HASH, fields="_id")
+    # The user is fetched again, but the tree is addressed by content.
+    assert len(endpoint.requests) == 4
+
+
+def test_refs_are_not_cached(conservator, fake_endpoint):
+    endpoint = fake_endpoint(handler)
+    conservator.query(Query.git_tree, dataset_id="d", tree_id="HEAD", fields="_id")
+    conservator.query(Query.git_tree, dataset_id="d", tree_id="HEAD", fields="_id")
+    assert len(endpoint.requests) == 2
+
+
+def test_ttl(conservator, fake_endpoint, monkeypatch):
+    endpoint = fake_endpoint(handler)
+    conservator.response_cache.set_policy(Query.user, CachePolicy(ttl=10))
+    monkeypatch.setattr("time.time", lambda: 1000)
+    conservator.query(Query.user, fields="email")
+    monkeypatch.setattr("time.time", lambda: 1005)
+    conservator.query(Query.user, fields="email")
+    monkeypatch.setattr("time.time", lambda: 1011)
+    conservator.query(Query.user, fields="email")
+    assert len(endpoint.requests) == 2
+
+
+def test_disk_backend(conservator, fake_endpoint, tmp_path):
+    endpoint = fake_endpoint(handler)
+    conservator.response_cache = ResponseCache(backend=DiskCacheBackend(tmp_path))
+    conservator.query(Query.user, fields="email")
+    conservator.response_cache = ResponseCache(backend=DiskCacheBackend(tmp_path))
+    assert conservator.query(Query.user, fields="email").email == "user@example.com"
+    assert len(endpoint.requests) == 1
+
+
+def test_disabled(conservator, fake_endpoint):
+    endpoint = fake_endpoint(handler)
+    conservator.response_cache = None
+    conservator.query(Query.user, fields="email")
+    conservator.query(Query.user, fields="email")
+    assert len(endpoint.requests) == 2
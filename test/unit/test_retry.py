@@ -0,0 +1,183 @@
+import collections
+import threading
+
+import pytest
+import requests
+
+from FLIR.conservator.connection import ConservatorGraphQLServerError
+from FLIR.conservator.file_transfers import DownloadRequest, FileDownloadException
+from FLIR.conservator.generated.schema import Query
+from FLIR.conservator.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    return sleeps
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    assert 0.5 <= policy.get_delay(1) <= 1
+    assert 2 <= policy.get_delay(3) <= 4
+    assert 2.5 <= policy.get_delay(10) <= 5
+    assert policy.get_delay(1, retry_after=20) == 20
+
+
+def test_send_retries_transient_errors(sleeps):
+    responses = [FakeResponse(503, {"Retry-After": "7"}), FakeResponse(429)]
+
+    def request():
+        if responses:
+            return responses.pop(0)
+        raise requests.exceptions.ConnectionError()
+
+    policy = RetryPolicy(max_retries=3, jitter=False)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        policy.send(request)
+    assert sleeps == [7, 1, 2]
+
+
+def test_send_returns_permanent_errors(sleeps):
+    policy = RetryPolicy()
+    assert policy.send(lambda: FakeResponse(404)).status_code == 404
+    assert sleeps == []
+
+
+def test_budget():
+    budget = RetryBudget(ratio=0.5, min_retries=2)
+    policy = RetryPolicy(budget=budget)
+    assert policy.should_retry(0, status_code=503)
+    assert policy.should_retry(0, status_code=503)
+    assert not policy.should_retry(0, status_code=503)
+    policy.record_request()
+    policy.record_request()
+    assert policy.should_retry(0, status_code=503)
+
+
+def test_query_retries(conservator, sleeps):
+    calls = []
+
+    def endpoint(query, variables=None):
+        calls.append(query)
+        if len(calls) < 3:
+            error = {"message": "", "exception": Exception(), "status": 503}
+            return {"data": None, "errors": [error]}
+        return {"data": {"user": {"id": "1", "email": "a@b.c"}}}
+
+    conservator.endpoint = endpoint
+    assert conservator.query(Query.user, fields="email").email == "a@b.c"
+    assert len(sleeps) == 2
+
+
+def test_query_does_not_retry_client_errors(conservator, sleeps):
+    def endpoint(query, variables=None):
+        error = {"message": "", "exception": Exception(), "status": 401}
+        return {"data": None, "errors": [error]}
+
+    conservator.endpoint = endpoint
+    with pytest.raises(ConservatorGraphQLServerError):
+        conservator.query(Query.user, fields="email")
+    assert sleeps == []
+
+
+class FakeSession:
+    """
+    Fails the first `failures` requests for every URL, then succeeds. With
+    `midstream`, every other failure happens while reading the content.
+    """
+
+    def __init__(self, failures, midstream=False):
+        self.failures = failures
+        self.midstream = midstream
+        self.attempts = collections.Counter()
+        self.responses = []
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.attempts[url] += 1
+            attempt = self.attempts[url]
+        failed = attempt <= self.failures
+        if failed and not (self.midstream and attempt % 2 == 0):
+            response = FakeResponse(502)
+        else:
+            response = FakeResponse(200)
+            response.iter_content = lambda chunk_size: self._content(failed)
+        self.responses.append(response)
+        return response
+
+    @staticmethod
+    def _content(failed):
+        yield b"data"
+        if failed:
+            raise requests.exceptions.ChunkedEncodingError()
+
+
+def test_burst_of_failures_across_transfers_is_retried(
+    conservator, sleeps, tmp_path, monkeypatch
+):
+    session = FakeSession(failures=2)
+    monkeypatch.setattr(
+        "FLIR.conservator.file_transfers.get_thread_session", lambda: session
+    )
+    downloads = [
+        DownloadRequest(f"/file/{i}", str(tmp_path / str(i))) for i in range(30)
+    ]
+    results = conservator.files.download_many(downloads, process_count=8, no_meter=True)
+    assert all(result.ok for result in results)
+    assert len(sleeps) == 60
+
+
+def test_download_attempts_share_one_retry_count(
+    conservator, sleeps, tmp_path, monkeypatch
+):
+    session = FakeSession(failures=100, midstream=True)
+    monkeypatch.setattr(
+        "FLIR.conservator.file_transfers.get_thread_session", lambda: session
+    )
+    with pytest.raises(FileDownloadException):
+        conservator.files.download("/file", str(tmp_path / "file"), max_retries=4)
+    assert session.attempts["https://myconservator.com/file"] == 4
+    assert not (tmp_path / "file").exists()
+    # Failed responses are closed, so their connections go back to the pool.
+    assert all(response.closed for response in session.responses)
+
+
+def test_interrupted_downloads_are_not_retried(
+    conservator, sleeps, tmp_path, monkeypatch
+):
+    session = FakeSession(failures=0)
+
+    def content(failed):
+        yield b"data"
+        raise KeyboardInterrupt()
+
+    session._content = content
+    monkeypatch.setattr(
+        "FLIR.conservator.file_transfers.get_thread_session", lambda: session
+    )
+    with pytest.raises(KeyboardInterrupt):
+        conservator.files.download("/file", str(tmp_path / "file"))
+    assert session.attempts["https://myconservator.com/file"] == 1
+    assert session.responses[0].closed
+    assert not (tmp_path / "file").exists()
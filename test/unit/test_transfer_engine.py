@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from FLIR.conservator.http_session import get_thread_session
+from FLIR.conservator.transfer_engine import TransferEngine
+
+
+def test_ordered_results():
+    engine = TransferEngine(concurrency=4)
+
+    def slow_for_small(i):
+        time.sleep(0.01 * (5 - i % 5))
+        return i * 2
+
+    assert list(engine.map(slow_for_small, range(20))) == list(range(0, 40, 2))
+
+
+def test_unordered_results_as_completed():
+    engine = TransferEngine(concurrency=2, ordered=False)
+    first_may_finish = threading.Event()
+
+    def transfer(i):
+        if i == 0:
+            first_may_finish.wait(5)
+        return i
+
+    results = engine.map(transfer, range(5))
+    # The first item is still running while the others complete.
+    assert sorted(next(results) for _ in range(4)) == [1, 2, 3, 4]
+    first_may_finish.set()
+    assert list(results) == [0]
+
+
+def test_concurrency_is_limited():
+    engine = TransferEngine(concurrency=3)
+    lock = threading.Lock()
+    running = []
+    most_running = []
+
+    def transfer(i):
+        with lock:
+            running.append(i)
+            most_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(i)
+
+    list(engine.map(transfer, range(12)))
+    assert max(most_running) == 3
+
+
+def test_errors_cancel_pending_items():
+    engine = TransferEngine(concurrency=1)
+    started = []
+
+    def transfer(i):
+        started.append(i)
+        if i == 1:
+            raise ValueError(i)
+        return i
+
+    with pytest.raises(ValueError):
+        list(engine.map(transfer, range(100)))
+    # Only the items submitted ahead were started.
+    assert len(started) <= 3
+
+
+def test_workers_have_their_own_sessions():
+    engine = TransferEngine(concurrency=4)
+    barrier = threading.Barrier(4)
+
+    def transfer(_):
+        session = get_thread_session()
+        barrier.wait(5)
+        assert get_thread_session() is session
+        return session
+
+    sessions = list(engine.map(transfer, range(4)))
+    assert len(set(map(id, sessions))) == 4
+    assert get_thread_session() not in sessions
+
+
+def test_download_many(conservator, tmp_path, monkeypatch):
+    from FLIR.conservator.file_transfers import DownloadRequest
+
+    class FakeResponse:
+        ok = True
+        headers = {}
+
+        def __init__(self, url):
+            self.content = url.encode()
+
+        def iter_content(self, chunk_size):
+            yield self.content
+
+    threads = set()
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            threads.add(threading.current_thread().name)
+            return FakeResponse(url)
+
+    monkeypatch.setattr(
+        "FLIR.conservator.file_transfers.get_thread_session", FakeSession
+    )
+    downloads = [
+        DownloadRequest(f"/file/{i}", str(tmp_path / f"{i}.txt")) for i in range(10)
+    ]
+    results = conservator.files.download_many(downloads, process_count=4, no_meter=True)
+    assert all(result.ok for result in results)
+    for i in range(10):
+        path = tmp_path / f"{i}.txt"
+        assert path.read_text() == f"https://myconservator.com/file/{i}"
+    assert all(name.startswith("conservator-transfer") for name in threads)
+    assert conservator.metrics.snapshot()["transfer"]["download"]["requests"] == 10
+
+
+def test_local_dataset_uploads_reuse_thread_sessions(conservator, tmp_path):
+    from FLIR.conservator.local_dataset import LocalDataset
+
+    (tmp_path / "index.json").write_text("{}")
+    image = tmp_path / "image.jpg"
+    image.write_bytes(b"jpeg")
+    local_dataset = LocalDataset(conservator, str(tmp_path))
+    conservator.get_dvc_url = lambda: "https://myconservator.com/dvc"
+    md5 = "0123456789abcdef"
+    puts = []
+
+    class FakeResponse:
+        ok = True
+        status_code = 200
+        headers = {"ETag": f'"{md5}"'}
+
+    def put(url, data, **kwargs):
+        puts.append(url)
+        return FakeResponse()
+
+    session = get_thread_session()
+    session.put = put
+    try:
+        local_dataset.upload_image(str(image), md5)
+        local_dataset.upload_image(str(image), md5)
+    finally:
+        del session.put
+    assert puts == ["https://myconservator.com/dvc/01/23456789abcdef"] * 2
+    assert conservator.metrics.snapshot()["transfer"]["upload"]["requests"] == 2
@@ -0,0 +1,43 @@
+import pytest
+
+from FLIR.conservator.managers.type_manager import TypeManager
+from FLIR.conservator.wrappers import Frame
+from FLIR.conservator.wrappers.queryable import InvalidIdException
+
+FRAME_ID = "a" * 17
+MISSING_ID = "b" * 17
+
+
+def test_populate_many_by_ids(conservator, fake_endpoint):
+    def handler(query, variables):
+        assert "framesByIds" in query
+        return {
+            "framesByIds": [
+                {"id": frame_id, "frameIndex": 1}
+                for frame_id in variables["ids"]
+                if frame_id != MISSING_ID
+            ]
+        }
+
+    endpoint = fake_endpoint(handler)
+    frames = TypeManager(conservator, Frame)
+    instances = [frames.from_id(FRAME_ID), frames.from_id(MISSING_ID)]
+    with pytest.raises(InvalidIdException, match=MISSING_ID):
+        frames.populate_many(instances, fields="frame_index")
+
+    assert len(endpoint.requests) == 1
+    assert instances[0].frame_index == 1
+    assert not instances[1].has_field("frame_index")
+
+
+def test_from_ids_batches_queries(conservator, fake_endpoint):
+    ids = ["c" * 17, "d" * 17, "e" * 17]
+
+    def handler(query, variables):
+        assert query.count("collection(") == 3
+        return {f"batch{i}": {"id": ids[i], "name": f"c{i}"} for i in range(3)}
+
+    endpoint = fake_endpoint(handler)
+    collections = conservator.collections.from_ids(ids, fields="name")
+    assert len(endpoint.requests) == 1
+    assert [collection.name for collection in collections] == ["c0", "c1", "c2"]
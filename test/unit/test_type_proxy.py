@@ -0,0 +1,147 @@
+import copy
+import json
+
+import sgqlc.types
+
+from FLIR.conservator.generated import schema
+from FLIR.conservator.wrappers import DatasetFrame, Project, Video
+from FLIR.conservator.wrappers.type_proxy import TypeProxy, requires_fields
+
+
+def test_get_wrapping_type():
+    assert TypeProxy.get_wrapping_type(schema.Video) is Video
+    video_list = sgqlc.types.non_null(sgqlc.types.list_of(schema.Video))
+    assert TypeProxy.get_wrapping_type(video_list) is Video
+    assert TypeProxy.get_wrapping_type(schema.Group) is TypeProxy
+
+
+def test_new_subclass_is_registered():
+    assert TypeProxy.get_wrapping_type(schema.Group) is TypeProxy
+
+    class Group(TypeProxy):
+        underlying_type = schema.Group
+
+    try:
+        assert TypeProxy.get_wrapping_type(schema.Group) is Group
+    finally:
+        del TypeProxy._wrappers[schema.Group]
+        TypeProxy._wrapping_types.clear()
+
+
+def test_wrap_list():
+    type_ = sgqlc.types.list_of(schema.DatasetFrame)
+    frames = [schema.DatasetFrame({"id": str(i)}) for i in range(3)]
+    wrapped = TypeProxy.wrap(None, type_, frames)
+    assert [type(frame) for frame in wrapped] == [DatasetFrame] * 3
+    assert wrapped.to_json() == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+
+
+def test_wrapped_fields_are_reused(conservator, fake_endpoint):
+    instance = schema.Project({"id": "1", "rootCollection": {"id": "c1"}})
+    project = Project(conservator, instance)
+    assert project.root_collection is project.root_collection
+
+    fake_endpoint(
+        lambda query, variables: {"project": {"rootCollection": {"id": "c2"}}}
+    )
+    project.populate("root_collection.id")
+    assert project.root_collection.id == "c2"
+    assert project._initialized_fields == {"id", "root_collection"}
+
+
+def test_list_type_proxy_is_lazy():
+    type_ = sgqlc.types.list_of(schema.DatasetFrame)
+    frames = [schema.DatasetFrame({"id": str(i)}) for i in range(3)]
+    wrapped = TypeProxy.wrap(None, type_, frames)
+    assert len(wrapped) == 3
+    assert list.__getitem__(wrapped, 1) is frames[1]
+
+    assert isinstance(wrapped[1], DatasetFrame)
+    assert wrapped[1] is wrapped[1]
+    assert list.__getitem__(wrapped, 0) is frames[0]
+    assert [frame.id for frame in wrapped[-2:]] == ["1", "2"]
+
+
+def test_list_type_proxy_is_a_list():
+    type_ = sgqlc.types.list_of(sgqlc.types.list_of(schema.DatasetFrame))
+    nested = [[schema.DatasetFrame({"id": "0"})], []]
+    wrapped = TypeProxy.wrap(None, type_, nested)
+    assert isinstance(wrapped, list)
+    assert wrapped == [wrapped[0], []]
+    assert wrapped.to_json() == [[{"id": "0"}], []]
+    assert [] + wrapped == [wrapped[0], []]
+    assert wrapped[0][0] in wrapped[0]
+    assert list(reversed(wrapped))[1][0].id == "0"
+
+    numbers = TypeProxy.wrap(None, sgqlc.types.list_of(int), [3, 1, 2])
+    assert sorted(numbers) == [1, 2, 3]
+    assert numbers[::2] == [3, 2]
+
+
+@requires_fields("name", "created_by")
+def get_name(project):
+    return project.name
+
+
+def test_list_type_proxy_copies_are_wrapped():
+    type_ = sgqlc.types.list_of(schema.DatasetFrame)
+    frames = [schema.DatasetFrame({"id": str(i)}) for i in range(3)]
+
+    def wrapped():
+        return TypeProxy.wrap(None, type_, frames)
+
+    copies = [
+        wrapped().copy(),
+        copy.copy(wrapped()),
+        wrapped()[:],
+        list(wrapped()),
+        tuple(wrapped()),
+        [*wrapped()],
+    ]
+    for items in copies:
+        assert [frame.id for frame in items] == ["0", "1", "2"]
+        assert all(isinstance(frame, DatasetFrame) for frame in items)
+
+    # json.dumps reads the list's storage, so it's given to_json() instead.
+    assert json.loads(json.dumps(wrapped().to_json())) == [
+        {"id": "0"},
+        {"id": "1"},
+        {"id": "2"},
+    ]
+
+
+def test_requires_fields_queries_missing_fields(conservator, fake_endpoint):
+    endpoint = fake_endpoint(
+        lambda query, variables: {"project": {"name": "new", "createdBy": "u"}}
+    )
+    project = Project(conservator, schema.Project({"id": "1", "name": "old"}))
+    assert get_name(project) == "old"
+    assert len(endpoint.requests) == 1
+    assert "createdBy" in endpoint.requests[0][0]
+    assert "name" not in endpoint.requests[0][0]
+
+    assert get_name(project) == "old"
+    assert len(endpoint.requests) == 1
+
+    assert get_name(project, refresh_fields=True) == "new"
+    assert len(endpoint.requests) == 2
+
+
+def test_signed_urls_are_always_queried(conservator, fake_endpoint, monkeypatch):
+    endpoint = fake_endpoint(
+        lambda query, variables: {"video": {"id": "1", "url": "https://new"}}
+    )
+    downloads = []
+    monkeypatch.setattr(
+        conservator.files,
+        "download_if_missing",
+        lambda url, **kwargs: downloads.append(url),
+    )
+    video = Video(
+        conservator,
+        schema.Video({"id": "1", "url": "https://old", "filename": "a", "md5": "b"}),
+    )
+    video.download("path")
+    assert downloads == ["https://new"]
+    assert len(endpoint.requests) == 1
+    assert "filename" not in endpoint.requests[0][0]
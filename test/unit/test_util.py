@@ -0,0 +1,113 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import FLIR.conservator.util as util
+
+
+class FakeResponse:
+    def json(self):
+        return {"info": {"version": "2.0.0"}}
+
+
+def test_latest_version_is_cached(tmp_path, monkeypatch):
+    calls = []
+
+    def get(url, timeout):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(util, "VERSION_CACHE_PATH", str(tmp_path / "version.json"))
+    monkeypatch.setattr(util.requests, "get", get)
+    assert util.get_conservator_cli_version() == "2.0.0"
+    assert util.get_conservator_cli_version() == "2.0.0"
+    assert len(calls) == 1
+    assert util.get_conservator_cli_version(max_age=0) == "2.0.0"
+    assert len(calls) == 2
+
+
+def test_failures_are_cached(tmp_path, monkeypatch):
+    calls = []
+
+    def get(url, timeout):
+        calls.append(url)
+        raise util.requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr(util, "VERSION_CACHE_PATH", str(tmp_path / "version.json"))
+    monkeypatch.setattr(util.requests, "get", get)
+    assert util.get_conservator_cli_version() is None
+    assert util.compare_conservator_cli_version() is None
+    assert len(calls) == 1
+
+
+def test_exit_doesnt_wait_for_version_check(tmp_path):
+    # The process exits while PyPI is slow to answer.
+    path = tmp_path / "version.json"
+    script = f"""
+import threading
+import time
+import FLIR.conservator.util as util
+
+requested = threading.Event()
+
+def get(url, timeout):
+    requested.set()
+    time.sleep(30)
+
+util.VERSION_CACHE_PATH = {str(path)!r}
+util.requests.get = get
+util.check_conservator_cli_version_in_background()
+requested.wait(5)
+"""
+    started = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+    assert time.monotonic() - started < 2.5
+    assert json.loads(path.read_text())["pending"]
+
+
+def test_pending_checks_are_not_repeated(tmp_path, monkeypatch):
+    calls = []
+
+    def get(url, timeout):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(util, "VERSION_CACHE_PATH", str(tmp_path / "version.json"))
+    monkeypatch.setattr(util.requests, "get", get)
+    util._write_cached_version("1.0.0", pending=True)
+    assert util.get_conservator_cli_version() == "1.0.0"
+    assert calls == []
+    monkeypatch.setattr(util, "VERSION_CHECK_PENDING_TTL", 0)
+    assert util.get_conservator_cli_version() == "2.0.0"
+    assert len(calls) == 1
+
+
+def test_version_check_starts_once(monkeypatch):
+    finish = threading.Event()
+    monkeypatch.setattr(util, "_version_check_thread", None)
+    monkeypatch.setattr(util, "compare_conservator_cli_version", finish.wait)
+    barrier = threading.Barrier(8)
+    checks = []
+
+    def check():
+        barrier.wait(5)
+        checks.append(util.check_conservator_cli_version_in_background())
+
+    threads = [threading.Thread(target=check) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    finish.set()
+    assert len(checks) == 8 and len(set(checks)) == 1
+
+
+def test_all_subclasses():
+    from FLIR.conservator.wrappers import Dataset, QueryableType, TypeProxy
+    from FLIR.conservator.wrappers import type_proxy
+
+    assert {Dataset, QueryableType} <= util.all_subclasses(TypeProxy)
+    # It used to be defined in type_proxy.
+    assert type_proxy.all_subclasses is util.all_subclasses